@@ -1,5 +1,6 @@
+from django.conf import settings
 from django.urls import path
-from .jwt_views import login_view, refresh_view
+from .jwt_views import login_view, refresh_view, logout_view
 from .views import registrar_usuario, solicitar_recuperacion_password, resetear_password
 
 urlpatterns = [
@@ -14,3 +15,9 @@ urlpatterns = [
     path("renovar/", refresh_view, name="renovar"),
     path("registro/", registrar_usuario, name="registro"),
 ]
+
+if settings.JWT_BLACKLIST:
+    urlpatterns += [
+        path("logout/", logout_view, name="logout"),
+        path("cerrar-sesion/", logout_view, name="cerrar_sesion"),
+    ]
@@ -1,15 +1,20 @@
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.auth.hashers import check_password
 from django.contrib.auth import get_user_model
+from core.throttling import limites
+from core.trazas import span
 from .models import Usuario
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from rest_framework_simplejwt.tokens import RefreshToken
+from .tokens import TokenRefresco
 import hashlib
 from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiResponse
 from rest_framework import serializers as drf_serializers
 
+@span("verify_password")
 def verify_password(plain, stored_hash):
     # Primero intenta usar el verificador de Django (para contraseñas nuevas)
     try:
@@ -22,6 +27,7 @@ def verify_password(plain, stored_hash):
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@throttle_classes(limites("login"))
 @extend_schema(
     summary="Iniciar sesión",
     description="Autenticación por email y contraseña. Devuelve tokens JWT.",
@@ -41,13 +47,14 @@ def verify_password(plain, stored_hash):
             },
         ),
         401: OpenApiResponse(description="Credenciales inválidas"),
+        429: OpenApiResponse(description="Demasiados intentos (ver Retry-After)"),
     },
 )
 def login_view(request):
     email = request.data.get("email")
     password = request.data.get("password")
     try:
-        u = Usuario.objects.get(email=email, estado="ACTIVO")
+        u = Usuario.activos.get(email=email)
     except Usuario.DoesNotExist:
         return Response({"detail":"Credenciales inválidas"}, status=401)
     if not verify_password(password, u.password_hash):
@@ -56,10 +63,12 @@ def login_view(request):
     User = get_user_model()
     django_user = User.objects.filter(email=email).first()
     if django_user:
-        refresh = RefreshToken.for_user(django_user)
+        refresh = TokenRefresco.for_user(django_user)
     else:
-        # Fallback: usar el authz.Usuario
-        refresh = RefreshToken.for_user(u)
+        # Fallback: usar el authz.Usuario. No se usa for_user(): con JWT_BLACKLIST
+        # registraría el token con FK al User de Django y fallaría con un Usuario.
+        refresh = TokenRefresco()
+        refresh[jwt_settings.USER_ID_CLAIM] = str(u.id)
         refresh["uid"] = u.id
     return Response({"access": str(refresh.access_token), "refresh": str(refresh)})
 
@@ -90,8 +99,35 @@ def refresh_view(request):
     if not token:
         return Response({"detail":"Falta refresh"}, status=400)
     try:
-        r = RefreshToken(token)
+        r = TokenRefresco(token)
         new_access = r.access_token
         return Response({"access": str(new_access)})
     except Exception:
         return Response({"detail":"Refresh inválido"}, status=401)
+
+@api_view(["POST"])
+@permission_classes([AllowAny])
+@extend_schema(
+    summary="Cerrar sesión",
+    description="Invalida el refresh token en el backend (requiere JWT_BLACKLIST).",
+    request=inline_serializer(
+        name="LogoutRequest",
+        fields={
+            "refresh": drf_serializers.CharField(),
+        },
+    ),
+    responses={
+        200: OpenApiResponse(description="Logout exitoso"),
+        400: OpenApiResponse(description="Falta refresh o token inválido"),
+    },
+)
+def logout_view(request):
+    # Solo se enruta con settings.JWT_BLACKLIST (ver auth_urls)
+    token = request.data.get("refresh")
+    if not token:
+        return Response({"detail":"Falta refresh"}, status=400)
+    try:
+        RefreshToken(token).blacklist()
+    except Exception:
+        return Response({"detail":"Token inválido"}, status=400)
+    return Response({"detail":"Logout exitoso"})
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authz', '0002_seed_roles'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usuario',
+            index=models.Index(condition=models.Q(('estado', 'ACTIVO')), fields=['email'], name='usuario_email_activo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usuario',
+            index=models.Index(condition=models.Q(('estado', 'ACTIVO')), fields=['id'], name='usuario_activo_idx'),
+        ),
+    ]
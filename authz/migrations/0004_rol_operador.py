@@ -1,9 +1,8 @@
 from django.db import migrations
 
-def seed_roles(apps, schema_editor):
+def crear_rol(apps, schema_editor):
     Rol = apps.get_model('authz', 'Rol')
-    for nombre in ["ADMIN", "AGENTE", "CLIENTE"]:
-        Rol.objects.get_or_create(nombre=nombre)
+    Rol.objects.get_or_create(nombre="OPERADOR")
 
 def noop(apps, schema_editor):
     # No eliminamos roles en reversa para evitar pérdida de datos
@@ -11,9 +10,9 @@ def noop(apps, schema_editor):
 
 class Migration(migrations.Migration):
     dependencies = [
-        ('authz', '0001_initial'),
+        ('authz', '0003_indices_parciales'),
     ]
 
     operations = [
-        migrations.RunPython(seed_roles, noop),
+        migrations.RunPython(crear_rol, noop),
     ]
@@ -5,6 +5,15 @@ class Rol(TimeStampedModel):
     nombre = models.CharField(max_length=50, unique=True)
     def __str__(self): return self.nombre
 
+class UsuarioQuerySet(models.QuerySet):
+    def activos(self):
+        return self.filter(estado="ACTIVO")
+
+class ActivoManager(models.Manager.from_queryset(UsuarioQuerySet)):
+    """Solo usuarios ACTIVO: los inhabilitados (borrado lógico) quedan fuera."""
+    def get_queryset(self):
+        return super().get_queryset().activos()
+
 class Usuario(TimeStampedModel):
     ESTADOS = (("ACTIVO","ACTIVO"),("INACTIVO","INACTIVO"),("BLOQUEADO","BLOQUEADO"))
     nombre = models.CharField(max_length=100)
@@ -13,6 +22,14 @@ class Usuario(TimeStampedModel):
     telefono = models.CharField(max_length=25, blank=True, null=True)
     estado = models.CharField(max_length=10, choices=ESTADOS, default="ACTIVO")
     roles = models.ManyToManyField(Rol, through="RolUsuario", related_name="usuarios")
+    objects = UsuarioQuerySet.as_manager()
+    activos = ActivoManager()
+    class Meta:
+        indexes = [
+            # Índices parciales: login y listados solo tocan usuarios ACTIVO
+            models.Index(fields=["email"], condition=models.Q(estado="ACTIVO"), name="usuario_email_activo_idx"),
+            models.Index(fields=["id"], condition=models.Q(estado="ACTIVO"), name="usuario_activo_idx"),
+        ]
     def __str__(self): return f"{self.nombre} <{self.email}>"
 
 class RolUsuario(models.Model):
@@ -0,0 +1,54 @@
+"""
+Roles por usuario para los chequeos de permisos.
+
+Los roles se leen siempre de la base de datos (una consulta sobre el
+índice de RolUsuario.usuario_id), memorizados solo dentro de la petición.
+No hay caché entre peticiones: la caché por defecto es local a cada
+worker, y quitarle ADMIN a alguien tiene que valer en todos al instante.
+"""
+from rest_framework import permissions
+
+from .models import RolUsuario, Usuario
+
+
+def roles_de(usuario_id):
+    return frozenset(
+        RolUsuario.objects.filter(usuario_id=usuario_id).values_list("rol__nombre", flat=True)
+    )
+
+
+def usuario_id_de(request):
+    """Id del `Usuario` con el email del usuario autenticado (memorizado en el request)."""
+    if not hasattr(request, "_usuario_id"):
+        request._usuario_id = (Usuario.objects.filter(email=request.user.email)
+                               .values_list("pk", flat=True).first())
+    return request._usuario_id
+
+
+class TieneRol(permissions.BasePermission):
+    """Usuario autenticado cuyo `Usuario` (mismo email) tiene alguno de `roles`."""
+    roles = ()
+    message = "No tienes permisos para realizar esta acción."
+
+    def has_permission(self, request, view):
+        if not (request.user and request.user.is_authenticated):
+            return False
+        usuario_id = usuario_id_de(request)
+        if usuario_id is None:
+            return False
+        if not hasattr(request, "_roles"):
+            request._roles = roles_de(usuario_id)
+        return not request._roles.isdisjoint(self.roles)
+
+
+class EsAdmin(TieneRol):
+    roles = ("ADMIN",)
+
+
+class EsOperador(TieneRol):
+    roles = ("OPERADOR",)
+
+
+class EsAgente(TieneRol):
+    roles = ("AGENTE", "ADMIN")
+
@@ -2,6 +2,8 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
+from core.serializers import ListaRapidaMixin
+from core.trazas import SerializerTrazadoMixin
 from .models import Usuario, Rol, RolUsuario
 
 class RolSerializer(serializers.ModelSerializer):
@@ -9,18 +11,26 @@ class RolSerializer(serializers.ModelSerializer):
         model = Rol
         fields = ["id","nombre","created_at","updated_at"]
 
-class UsuarioSerializer(serializers.ModelSerializer):
+class UsuarioSerializer(ListaRapidaMixin, serializers.ModelSerializer):
     roles = serializers.PrimaryKeyRelatedField(queryset=Rol.objects.all(), many=True, required=False)
     class Meta:
         model = Usuario
         fields = ["id","nombre","email","telefono","estado","roles","created_at","updated_at"]
 
+class OperacionRolSerializer(serializers.Serializer):
+    usuario = serializers.IntegerField()
+    rol = serializers.CharField(max_length=50)
+    accion = serializers.ChoiceField(choices=["asignar", "quitar"])
+
+class RolesLoteSerializer(serializers.Serializer):
+    operaciones = OperacionRolSerializer(many=True, allow_empty=False, max_length=5000)
+
 class UsuarioCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Usuario
         fields = ["nombre","email","password_hash","telefono"]
 
-class UsuarioRegistroSerializer(serializers.ModelSerializer):
+class UsuarioRegistroSerializer(SerializerTrazadoMixin, serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, min_length=8)
     password_confirm = serializers.CharField(write_only=True)
     
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.mail import send_mail
+
+from core.tareas import tarea
+from core.trazas import span
+from .models import Usuario
+
+
+@tarea(max_intentos=5)
+def enviar_email_recuperacion(usuario_id, reset_url):
+    usuario = Usuario.objects.filter(pk=usuario_id).first()
+    if usuario is None:
+        return
+    with span("send_mail"):
+        send_mail(
+            subject="Recuperación de contraseña",
+            message=f"Hola {usuario.nombre},\n\nPara restablecer tu contraseña haz clic en el siguiente enlace:\n{reset_url}\n\nSi no solicitaste este cambio, ignora este mensaje.",
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[usuario.email],
+            fail_silently=False,
+        )
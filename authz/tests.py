@@ -1,3 +1,111 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from core.throttling import obtener_store
+from packages.common.consultas import query_budget
+from packages.common.pruebas import cliente_admin, cliente_de, crear_usuario
+from .models import Rol, RolUsuario, Usuario
+from .roles import roles_de
+
+
+class SesionJWTTests(TestCase):
+    """
+    Se ejecuta en ambas configuraciones de despliegue (JWT_BLACKLIST=0/1,
+    ver .github/workflows/tests.yml); cada test comprueba la que esté activa.
+    """
+
+    def setUp(self):
+        obtener_store().reiniciar()
+        Usuario.objects.create(nombre="Ana", email="ana@example.com", password_hash=make_password("Secreta123"))
+        self.client = APIClient()
+        r = self.client.post("/api/auth/login/", {"email": "ana@example.com", "password": "Secreta123"}, format="json")
+        self.assertEqual(r.status_code, 200)
+        self.refresh = r.json()["refresh"]
+
+    def test_logout_segun_configuracion(self):
+        r = self.client.post("/api/auth/logout/", {"refresh": self.refresh}, format="json")
+        if not settings.JWT_BLACKLIST:
+            self.assertEqual(r.status_code, 404)
+            return
+        self.assertEqual(r.status_code, 200)
+        r = self.client.post("/api/auth/renovar/", {"refresh": self.refresh}, format="json")
+        self.assertEqual(r.status_code, 401)
+
+    def test_refresh_sigue_funcionando(self):
+        r = self.client.post("/api/auth/refresh/", {"refresh": self.refresh}, format="json")
+        self.assertEqual(r.status_code, 200)
+        self.assertIn("access", r.json())
+
+
+class ListadoUsuariosTests(TestCase):
+    def test_listado_sin_n_mas_1(self):
+        cliente = Rol.objects.get(nombre="CLIENTE")
+        for i in range(5):
+            Usuario.objects.create(nombre=f"U{i}", email=f"u{i}@example.com", password_hash="x").roles.add(cliente)
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user("u0", email="u0@example.com"))
+        with query_budget(2):  # usuarios + roles de todos en una consulta
+            r = client.get("/api/usuarios/")
+        self.assertEqual([u["roles"] for u in r.data], [[cliente.pk]] * 5)
+
+
+class RolesLoteTests(TestCase):
+    def setUp(self):
+        self.client = cliente_admin()
+        self.agentes = [
+            Usuario.objects.create(nombre=f"Agente {i}", email=f"agente{i}@example.com", password_hash="x")
+            for i in range(3)
+        ]
+
+    def test_asigna_y_quita_en_lote(self):
+        a, b, c = self.agentes
+        c.roles.add(Rol.objects.get(nombre="CLIENTE"))
+        self.assertEqual(roles_de(c.id), {"CLIENTE"})
+        ops = [
+            {"usuario": a.id, "rol": "AGENTE", "accion": "asignar"},
+            {"usuario": b.id, "rol": "AGENTE", "accion": "asignar"},
+            {"usuario": b.id, "rol": "AGENTE", "accion": "quitar"},
+            {"usuario": c.id, "rol": "AGENTE", "accion": "asignar"},
+            {"usuario": c.id, "rol": "CLIENTE", "accion": "quitar"},
+        ]
+        with self.assertNumQueries(9):
+            r = self.client.post("/api/usuarios/roles/lote/", {"operaciones": ops}, format="json")
+        self.assertEqual(r.status_code, 200, r.content)
+        self.assertEqual(r.json(), {"asignados": 2, "quitados": 1})
+        self.assertEqual(roles_de(a.id), {"AGENTE"})
+        self.assertEqual(roles_de(b.id), set())
+        self.assertEqual(roles_de(c.id), {"AGENTE"})
+
+        # Repetir la asignación no duplica filas
+        r = self.client.post("/api/usuarios/roles/lote/", {"operaciones": ops[:1]}, format="json")
+        self.assertEqual((r.status_code, r.json()), (200, {"asignados": 0, "quitados": 0}))
+        self.assertEqual(RolUsuario.objects.filter(usuario=a).count(), 1)
+
+    def test_quitar_admin_en_otro_worker_vale_al_instante(self):
+        self.assertEqual(self.client.get("/api/config/parametros/").status_code, 200)
+        # Otro proceso quita el rol (sin m2m_changed): este worker no se entera por ninguna señal
+        RolUsuario.objects.filter(usuario__email="admin@example.com", rol__nombre="ADMIN").delete()
+        self.assertEqual(self.client.get("/api/config/parametros/").status_code, 403)
+
+    def test_rol_inexistente_no_aplica_nada(self):
+        ops = [
+            {"usuario": self.agentes[0].id, "rol": "AGENTE", "accion": "asignar"},
+            {"usuario": self.agentes[1].id, "rol": "GUIA", "accion": "asignar"},
+        ]
+        r = self.client.post("/api/usuarios/roles/lote/", {"operaciones": ops}, format="json")
+        self.assertEqual(r.status_code, 400)
+        self.assertEqual(r.json(), {"roles_inexistentes": ["GUIA"]})
+        self.assertFalse(RolUsuario.objects.filter(usuario__in=self.agentes).exists())
+
+
+class InhabilitarTests(TestCase):
+    def test_inhabilita_la_propia_cuenta(self):
+        crear_usuario("ana@example.com")
+        self.assertEqual(cliente_de("ana@example.com").post("/api/usuarios/inhabilitar/").status_code, 200)
+        self.assertEqual(Usuario.objects.get(email="ana@example.com").estado, "INACTIVO")
+
+    def test_sin_usuario_de_dominio_responde_404(self):
+        self.assertEqual(cliente_de("huerfano@example.com").post("/api/usuarios/inhabilitar/").status_code, 404)
@@ -0,0 +1,30 @@
+"""
+Tokens JWT cuya vida se lee en cada emisión: ACCESS_TOKEN_LIFETIME_MIN y
+REFRESH_TOKEN_LIFETIME_DAYS pueden cambiarse en caliente con un Parametro
+(packages.admin_config); sin él rigen los de settings.SIMPLE_JWT.
+"""
+from datetime import timedelta
+
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from packages.admin_config.use_cases import configuracion
+
+
+class _VidaConfigurable:
+    def __init__(self, clave, unidad, ajuste):
+        self.clave, self.unidad, self.ajuste = clave, unidad, ajuste
+
+    def __get__(self, obj, owner):
+        defecto = getattr(api_settings, self.ajuste)
+        cantidad = configuracion.entero(self.clave)
+        return defecto if cantidad is None else timedelta(**{self.unidad: cantidad})
+
+
+class TokenAcceso(AccessToken):
+    lifetime = _VidaConfigurable("ACCESS_TOKEN_LIFETIME_MIN", "minutes", "ACCESS_TOKEN_LIFETIME")
+
+
+class TokenRefresco(RefreshToken):
+    lifetime = _VidaConfigurable("REFRESH_TOKEN_LIFETIME_DAYS", "days", "REFRESH_TOKEN_LIFETIME")
+    access_token_class = TokenAcceso
@@ -1,16 +1,22 @@
 from rest_framework import viewsets, permissions, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django.db import transaction
-from rest_framework_simplejwt.tokens import RefreshToken
-from .models import Usuario, Rol
-from .serializers import UsuarioSerializer, UsuarioCreateSerializer, RolSerializer, UsuarioRegistroSerializer
+from django.db.models import Q
+from .tokens import TokenRefresco
+from core.idempotencia import idempotente
+from core.throttling import limites
+from core.serializers import ListaRapidaViewSetMixin
+from .models import Usuario, Rol, RolUsuario
+from .roles import roles_de
+from .tareas import enviar_email_recuperacion
+from .serializers import UsuarioSerializer, UsuarioCreateSerializer, RolSerializer, UsuarioRegistroSerializer, RolesLoteSerializer
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample, inline_serializer
 from rest_framework import serializers as drf_serializers
 from rest_framework.decorators import action
-from django.core.mail import send_mail
-from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.utils.crypto import get_random_string
 from django.urls import reverse
 import datetime
@@ -22,9 +28,10 @@ from django.core.cache import cache
 # Endpoint para solicitar recuperación de contraseña
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@throttle_classes(limites("recuperacion"))
 @extend_schema(
     summary="Solicitar recuperación de contraseña",
-    description="Envía un email con un enlace para restablecer la contraseña.",
+    description="Encola un email con un enlace para restablecer la contraseña (lo envía `manage.py worker`).",
     request=inline_serializer(
         name="RecuperarPasswordRequest",
         fields={"email": drf_serializers.EmailField()},
@@ -45,14 +52,8 @@ def solicitar_recuperacion_password(request):
     cache.set(f"resetpw:{token}", usuario.id, timeout=60*60)  # 1 hora
     # Construir enlace
     reset_url = request.build_absolute_uri(reverse("reset_password") + f"?token={token}")
-    # Enviar email
-    send_mail(
-        subject="Recuperación de contraseña",
-        message=f"Hola {usuario.nombre},\n\nPara restablecer tu contraseña haz clic en el siguiente enlace:\n{reset_url}\n\nSi no solicitaste este cambio, ignora este mensaje.",
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[usuario.email],
-        fail_silently=False,
-    )
+    # Enviar email fuera de la petición (SMTP lento o caído no bloquea ni pierde el envío)
+    enviar_email_recuperacion.encolar(usuario.id, reset_url)
     return Response({"detail": "Si el email existe, se enviará un enlace de recuperación."}, status=200)
 
 # Endpoint para restablecer contraseña
@@ -87,11 +88,9 @@ def resetear_password(request):
     except Usuario.DoesNotExist:
         return Response({"detail": "Usuario no encontrado"}, status=404)
     # Cambiar contraseña (hash)
-    from django.contrib.auth.hashers import make_password
     usuario.password_hash = make_password(password)
     usuario.save()
     # Si existe el usuario nativo de Django, actualizar también
-    from django.contrib.auth import get_user_model
     User = get_user_model()
     django_user = User.objects.filter(email=usuario.email).first()
     if django_user:
@@ -106,20 +105,19 @@ class RolViewSet(viewsets.ModelViewSet):
     serializer_class = RolSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class UsuarioViewSet(viewsets.ModelViewSet):
+class UsuarioViewSet(ListaRapidaViewSetMixin, viewsets.ModelViewSet):
     @action(detail=False, methods=["post"], url_path="inhabilitar", permission_classes=[permissions.IsAuthenticated])
     def inhabilitar(self, request):
         """Permite al usuario autenticado inhabilitar (borrado lógico) su cuenta."""
-        usuario = Usuario.objects.get(email=request.user.email)
-        usuario.estado = "INACTIVO"
-        usuario.save()
+        if not Usuario.objects.filter(email=request.user.email).update(estado="INACTIVO", updated_at=timezone.now()):
+            return Response({"detail": "Usuario no encontrado"}, status=404)
         return Response({"detail": "Cuenta inhabilitada. Si deseas reactivarla, contacta a un administrador."}, status=200)
 
     @action(detail=True, methods=["post"], url_path="reactivar", permission_classes=[permissions.IsAuthenticated])
     def reactivar(self, request, pk=None):
         """Permite a un usuario con rol ADMIN reactivar una cuenta de usuario inactiva."""
         usuario_admin = Usuario.objects.get(email=request.user.email)
-        if not usuario_admin.roles.filter(nombre="ADMIN").exists():
+        if "ADMIN" not in roles_de(usuario_admin.id):
             return Response({"detail": "No tienes permisos para realizar esta acción."}, status=403)
         usuario = self.get_object()
         if usuario.estado != "INACTIVO":
@@ -142,6 +140,23 @@ class UsuarioViewSet(viewsets.ModelViewSet):
     queryset = Usuario.objects.all()
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        """
+        El listado solo muestra usuarios ACTIVO (índice parcial).
+        - ?estado=<ACTIVO|INACTIVO|BLOQUEADO|TODOS>
+        Las acciones de detalle (p. ej. reactivar) ven todos los estados.
+        """
+        qs = super().get_queryset()
+        if self.action != "list":
+            return qs
+        qs = qs.prefetch_related("roles")
+        estado = self.request.query_params.get("estado", "ACTIVO").upper()
+        if estado == "ACTIVO":
+            return qs.activos()
+        if estado == "TODOS":
+            return qs
+        return qs.filter(estado=estado)
+
     def get_serializer_class(self):
         return UsuarioCreateSerializer if self.action in ["create"] else UsuarioSerializer
 
@@ -184,8 +199,77 @@ class UsuarioViewSet(viewsets.ModelViewSet):
         usuario.roles.remove(rol)
         return Response(UsuarioSerializer(usuario).data)
 
+    @extend_schema(
+        summary="Asignar/quitar roles en lote",
+        description=(
+            "Aplica muchas operaciones (usuario, rol, accion) en una transacción. "
+            "Si un mismo par aparece varias veces, gana la última operación. Solo ADMIN. "
+            "`asignados` y `quitados` cuentan filas realmente creadas/borradas."
+        ),
+        request=RolesLoteSerializer,
+        responses={
+            200: inline_serializer(
+                name="RolesLoteResponse",
+                fields={
+                    "asignados": drf_serializers.IntegerField(),
+                    "quitados": drf_serializers.IntegerField(),
+                },
+            ),
+            400: OpenApiResponse(description="Roles o usuarios inexistentes / validación fallida"),
+            403: OpenApiResponse(description="Requiere rol ADMIN"),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="roles/lote")
+    @idempotente
+    def roles_lote(self, request):
+        usuario_admin = Usuario.objects.filter(email=request.user.email).first()
+        if usuario_admin is None or "ADMIN" not in roles_de(usuario_admin.id):
+            return Response({"detail": "No tienes permisos para realizar esta acción."}, status=403)
+        serializer = RolesLoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # Estado final por par (usuario, rol): la última operación gana
+        finales = {(op["usuario"], op["rol"]): op["accion"] for op in serializer.validated_data["operaciones"]}
+        nombres = {rol for _, rol in finales}
+        ids_usuario = {u for u, _ in finales}
+        roles = Rol.objects.in_bulk(nombres, field_name="nombre")
+        existentes = set(Usuario.objects.filter(pk__in=ids_usuario).values_list("pk", flat=True))
+        errores = {}
+        if nombres - roles.keys():
+            errores["roles_inexistentes"] = sorted(nombres - roles.keys())
+        if ids_usuario - existentes:
+            errores["usuarios_inexistentes"] = sorted(ids_usuario - existentes)
+        if errores:
+            return Response(errores, status=400)
+
+        asignar = []
+        quitar = {}  # rol_id -> [usuario_id, ...]
+        for (usuario_id, nombre), accion in finales.items():
+            rol_id = roles[nombre].pk
+            if accion == "asignar":
+                asignar.append(RolUsuario(usuario_id=usuario_id, rol_id=rol_id))
+            else:
+                quitar.setdefault(rol_id, []).append(usuario_id)
+
+        quitados = 0
+        with transaction.atomic():
+            if asignar:
+                # Solo se cuentan (y envían) los pares que aún no existen; ignore_conflicts cubre la carrera
+                ya_tenian = set(RolUsuario.objects.filter(
+                    usuario_id__in={r.usuario_id for r in asignar}, rol_id__in={r.rol_id for r in asignar},
+                ).values_list("usuario_id", "rol_id"))
+                asignar = [r for r in asignar if (r.usuario_id, r.rol_id) not in ya_tenian]
+                RolUsuario.objects.bulk_create(asignar, ignore_conflicts=True)
+            if quitar:
+                filtro = Q()
+                for rol_id, usuarios in quitar.items():
+                    filtro |= Q(rol_id=rol_id, usuario_id__in=usuarios)
+                quitados, _ = RolUsuario.objects.filter(filtro).delete()
+        return Response({"asignados": len(asignar), "quitados": quitados})
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes(limites("registro"))
 @extend_schema(
     summary="Registro de nuevo usuario",
     description="Registro de nuevo usuario con asignación de rol CLIENTE y emisión de tokens JWT.",
@@ -215,6 +299,7 @@ class UsuarioViewSet(viewsets.ModelViewSet):
         )
     ],
 )
+@idempotente(omitir=("access", "refresh"))  # los tokens no se guardan; al repetir, iniciar sesión
 def registrar_usuario(request):
     """Registro de nuevo usuario con asignación de rol CLIENTE y emisión de tokens JWT."""
     serializer = UsuarioRegistroSerializer(data=request.data)
@@ -232,10 +317,10 @@ def registrar_usuario(request):
         django_user = getattr(serializer, "_django_user", None)
         if django_user is None:
             # fallback: emitir para authz.Usuario como en login_view
-            refresh = RefreshToken.for_user(usuario)
+            refresh = TokenRefresco.for_user(usuario)
             refresh["uid"] = usuario.id
         else:
-            refresh = RefreshToken.for_user(django_user)
+            refresh = TokenRefresco.for_user(django_user)
 
     return Response({
         "access": str(refresh.access_token),
@@ -14,3 +14,15 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402  (después de get_asgi_application)
+from core.ciclo_vida import con_bucles_de_fondo  # noqa: E402
+
+bucles = []
+if settings.RESERVA_BARRIDO_ASGI:
+    from reservas.expiracion import bucle_barrido
+    bucles.append(lambda: bucle_barrido(settings.RESERVA_BARRIDO_SEG))
+if settings.TAREAS_WORKER_ASGI:
+    from core.tareas import bucle_worker
+    bucles.append(lambda: bucle_worker(settings.TAREAS_INTERVALO_SEG))
+application = con_bucles_de_fondo(application, bucles)
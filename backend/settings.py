@@ -1,6 +1,7 @@
 # backend/settings.py
 
 import os
+from corsheaders.defaults import default_headers
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -13,17 +14,31 @@ SECRET_KEY = os.getenv("SECRET_KEY", "dev-key")
 DEBUG = os.getenv("DEBUG", "1") in ["1", "True", "true"]
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "*").split(",")
 CSRF_TRUSTED_ORIGINS = os.getenv("CSRF_TRUSTED_ORIGINS", "http://localhost:8000").split(",")
-CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:5173").split(",")
+CORS_ALLOWED_ORIGINS = os.getenv(
+    "CORS_ALLOWED_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000,http://localhost:5173"
+).split(",")
+CORS_ALLOW_HEADERS = list(default_headers) + ["idempotency-key", "x-request-id"]
+CORS_EXPOSE_HEADERS = ["x-request-id"]
+CORS_ALLOW_METHODS = os.getenv("CORS_ALLOW_METHODS", "GET,POST,PUT,PATCH,DELETE,OPTIONS").split(",")
+
+# Logout real: los refresh tokens se invalidan en BD (app token_blacklist de simplejwt)
+JWT_BLACKLIST = os.getenv("JWT_BLACKLIST", "0") in ["1", "True", "true"]
 
 INSTALLED_APPS = [
     "django.contrib.admin","django.contrib.auth","django.contrib.contenttypes",
     "django.contrib.sessions","django.contrib.messages","django.contrib.staticfiles",
     "rest_framework","drf_spectacular",
-    "core","authz","catalogo","reservas","cupones",
+    "core","authz","catalogo","reservas","cupones","reportes","sincronizacion",
+    "packages.admin_config",
     "corsheaders",
 ]
+if JWT_BLACKLIST:
+    INSTALLED_APPS.append("rest_framework_simplejwt.token_blacklist")
 
 MIDDLEWARE = [
+    'core.trazas.TrazasMiddleware',
+    'packages.common.consultas.DetectorNMas1Middleware',
+    'core.consultas_lentas.ConsultasLentasMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -58,15 +73,112 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.trazas.JWTAuthenticationTrazada",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticatedOrReadOnly",),
+    # orjson si está instalado; si no, mismo comportamiento que el JSON de DRF
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.JSONRapidoRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.JSONRapidoParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    # Proxies delante de la app (Render: 1). Con 0 se ignora X-Forwarded-For y la IP es REMOTE_ADDR;
+    # sin este valor DRF confiaría en el header entero, que el cliente puede inventar
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", 1 if os.getenv("RENDER") else 0)),
+    # Políticas por ruta para core.throttling.limites("<alcance>")
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": os.getenv("LIMITE_LOGIN_IP", "30/min"),
+        "login_email": os.getenv("LIMITE_LOGIN_EMAIL", "5/min"),
+        "recuperacion_ip": os.getenv("LIMITE_RECUPERACION_IP", "10/hour"),
+        "recuperacion_email": os.getenv("LIMITE_RECUPERACION_EMAIL", "3/hour"),
+        "registro_ip": os.getenv("LIMITE_REGISTRO_IP", "20/hour"),
+        "registro_email": os.getenv("LIMITE_REGISTRO_EMAIL", "5/hour"),
+    },
+}
+
+# Rate limiting de ventana deslizante: "memoria" (por proceso) o "bd" (compartido)
+LIMITES_ACTIVOS = os.getenv("LIMITES_ACTIVOS", "1") in ["1", "True", "true"]
+LIMITES_STORE = os.getenv("LIMITES_STORE", "memoria")
+
+# Listados vía .values() + convertidores precompilados (misma salida JSON)
+LISTA_RAPIDA = os.getenv("LISTA_RAPIDA", "0") in ["1", "True", "true"]
+
+# Respuestas guardadas por Idempotency-Key (POST de reservas/registro)
+IDEMPOTENCIA_TTL_SEG = int(os.getenv("IDEMPOTENCIA_TTL_SEG", 24 * 60 * 60))
+
+# Expiración de reservas PENDIENTE (reservas.expiracion): cron con
+# `manage.py expirar_reservas` o bucle asyncio en cada worker ASGI
+RESERVA_RETENCION_MIN = int(os.getenv("RESERVA_RETENCION_MIN", 30))
+RESERVA_BARRIDO_LOTE = int(os.getenv("RESERVA_BARRIDO_LOTE", 500))
+RESERVA_BARRIDO_ASGI = os.getenv("RESERVA_BARRIDO_ASGI", "0") in ["1", "True", "true"]
+RESERVA_BARRIDO_SEG = int(os.getenv("RESERVA_BARRIDO_SEG", 60))
+
+# Archivo de reservas históricas (reservas.archivo, `manage.py archivar_reservas`)
+RESERVA_ARCHIVO_MESES = int(os.getenv("RESERVA_ARCHIVO_MESES", 18))
+RESERVA_ARCHIVO_LOTE = int(os.getenv("RESERVA_ARCHIVO_LOTE", 500))
+
+# Cola de trabajos en BD (core.tareas): `manage.py worker`, o un worker mínimo
+# dentro de cada proceso ASGI donde no hay procesos aparte (plan free de Render)
+TAREAS_WORKER_ASGI = os.getenv("TAREAS_WORKER_ASGI", "0") in ["1", "True", "true"]
+TAREAS_INTERVALO_SEG = float(os.getenv("TAREAS_INTERVALO_SEG", 2))
+TAREAS_BACKOFF_BASE_SEG = int(os.getenv("TAREAS_BACKOFF_BASE_SEG", 10))
+TAREAS_BACKOFF_MAX_SEG = int(os.getenv("TAREAS_BACKOFF_MAX_SEG", 3600))
+TAREAS_VISIBILIDAD_SEG = int(os.getenv("TAREAS_VISIBILIDAD_SEG", 600))
+
+# Listado público de servicios cacheado por versión del catálogo (catalogo.cache); 0 = sin caché.
+# La caché por defecto es local a cada proceso: usar un TTL corto o un backend compartido.
+CATALOGO_CACHE_SEG = int(os.getenv("CATALOGO_CACHE_SEG", 0))
+
+# Vida de un token de cotización (packages.ventas_cotizaciones); convertir después exige re-cotizar
+COTIZACION_TTL_SEG = int(os.getenv("COTIZACION_TTL_SEG", 15 * 60))
+
+# Parámetros editables en caliente (packages.admin_config): cada worker revisa la versión a lo sumo
+# cada tantos segundos. Un Parametro con la clave de una variable de entorno la reemplaza.
+CONFIG_REFRESCO_SEG = float(os.getenv("CONFIG_REFRESCO_SEG", 5))
+
+# Feed /api/sync/: no entregar filas más nuevas que esto (transacciones aún sin confirmar)
+SYNC_MARGEN_SEG = int(os.getenv("SYNC_MARGEN_SEG", 2))
+
+# Versión de código desplegada: invalida el esquema OpenAPI cacheado (Render expone RENDER_GIT_COMMIT)
+VERSION_CODIGO = os.getenv("VERSION_CODIGO") or os.getenv("RENDER_GIT_COMMIT", "")
+
+# Trazas por petición (core.trazas): se loguea una muestra y siempre las lentas.
+# Apagadas salvo TRAZAS_ACTIVAS=1: envuelven cada consulta SQL de cada petición
+TRAZAS_ACTIVAS = os.getenv("TRAZAS_ACTIVAS", "0") in ["1", "True", "true"]
+TRAZAS_MUESTREO = float(os.getenv("TRAZAS_MUESTREO", "0.01"))
+TRAZAS_UMBRAL_LENTO_MS = int(os.getenv("TRAZAS_UMBRAL_LENTO_MS", 1000))
+
+# Detector de N+1 (packages.common.consultas): solo actúa con DEBUG
+DETECTOR_N_MAS_1 = os.getenv("DETECTOR_N_MAS_1", "1") in ["1", "True", "true"]
+N_MAS_1_UMBRAL = int(os.getenv("N_MAS_1_UMBRAL", 5))
+
+# Registro de consultas lentas con EXPLAIN (core.consultas_lentas), en memoria por proceso
+CONSULTAS_LENTAS_ACTIVAS = os.getenv("CONSULTAS_LENTAS_ACTIVAS", "1") in ["1", "True", "true"]
+CONSULTAS_LENTAS_MS = float(os.getenv("CONSULTAS_LENTAS_MS", 200))
+CONSULTAS_LENTAS_MAX = int(os.getenv("CONSULTAS_LENTAS_MAX", 500))
+CONSULTAS_LENTAS_EXPLAIN_SEG = int(os.getenv("CONSULTAS_LENTAS_EXPLAIN_SEG", 300))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {"json": {"format": "%(message)s"}},
+    "handlers": {"trazas": {"class": "logging.StreamHandler", "formatter": "json"}},
+    "loggers": {"trazas": {"handlers": ["trazas"], "level": "INFO", "propagate": False}},
 }
 
 SPECTACULAR_SETTINGS = {
     "TITLE": "Turismo API",
     "VERSION": "1.0.0",
     "SERVE_INCLUDE_SCHEMA": False,
+    # Varios modelos tienen un campo "tipo": se fija el nombre de cada enum del esquema
+    "ENUM_NAME_OVERRIDES": {
+        "TipoEnum": "catalogo.models.Servicio.TIPO",
+        "TipoParametroEnum": "packages.admin_config.models.Parametro.TIPO",
+    },
 }
 
 TIME_ZONE = "America/La_Paz"
@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from core.diferido import vista_diferida
 from authz.views import RolViewSet, UsuarioViewSet
 from catalogo.views import CategoriaViewSet, ServicioViewSet
 from reservas.views import ReservaViewSet, VisitanteViewSet, ReservaVisitanteViewSet
@@ -19,9 +19,15 @@ router.register(r"reserva-visitantes", ReservaVisitanteViewSet)
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema")),
+    path("api/schema/", vista_diferida("core.esquema.EsquemaCacheadoView"), name="schema"),
+    path("api/docs/", vista_diferida("drf_spectacular.views.SpectacularSwaggerView", url_name="schema")),
     path("api/", include(router.urls)),
+    path("api/reportes/", include("reportes.urls")),
+    path("api/sync/", include("sincronizacion.urls")),
+    path("api/operador/", include("packages.operadores_servicios.api.urls")),
+    path("api/ventas/", include("packages.ventas_cotizaciones.api.urls")),
+    path("api/config/", include("packages.admin_config.api.urls")),
+    path("api/diagnostico/", include("core.urls")),
     path("api/auth/", include("authz.auth_urls")),  # lo creamos abajo
     # Alias en español (no rompe compatibilidad):
     path("api/autenticacion/", include("authz.auth_urls")),
@@ -0,0 +1,21 @@
+"""
+Benchmarks del backend. Cada módulo se ejecuta con `python -m benchmarks.<modulo>`
+desde la raíz del proyecto (usa backend.settings y una base SQLite propia,
+en memoria salvo que se indique un archivo).
+
+- lista_rapida: serializers DRF vs modo lista rápida (filas/s)
+- renderer_json: renderer/parser JSON sobre el payload de servicio-list
+- carga: escenarios de la API completos vía ASGI (rps, p50/p95/p99, consultas)
+"""
+import os
+
+
+def configurar_django(nombre_db=":memory:"):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+    os.environ.pop("DATABASE_URL", None)
+    import django
+    from django.conf import settings
+    django.setup()
+    settings.DATABASES["default"]["NAME"] = nombre_db
+    from django.core.management import call_command
+    call_command("migrate", verbosity=0, run_syncdb=True)
@@ -0,0 +1,240 @@
+"""
+Benchmark de carga de los flujos principales de la API.
+
+Siembra datos sintéticos en una base SQLite temporal, ejecuta cada escenario
+contra las rutas reales de `backend/urls.py` llamando en proceso a la app
+ASGI (`backend.asgi.application`) y reporta throughput, latencias p50/p95/p99
+y consultas SQL por petición. El resultado se guarda en JSON para comparar
+entre corridas:
+
+    python -m benchmarks.carga --peticiones 200 --reservas 5000 --salida antes.json
+    python -m benchmarks.carga --peticiones 200 --reservas 5000 --comparar antes.json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import warnings
+from urllib.parse import urlsplit
+
+from benchmarks import configurar_django
+from benchmarks.datos import ESCALA_DEFECTO, EMAIL_BENCH, PASSWORD_BENCH, sembrar
+
+ESCENARIOS = ["login", "registro", "busqueda_catalogo", "crear_reserva", "listar_reservas"]
+
+
+class ClienteASGI:
+    """Cliente HTTP mínimo que invoca la app ASGI sin sockets."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def peticion(self, metodo, url, cuerpo=None, token=None):
+        partes = urlsplit(url)
+        datos = json.dumps(cuerpo).encode() if cuerpo is not None else b""
+        headers = [(b"host", b"testserver"), (b"content-type", b"application/json"),
+                   (b"content-length", str(len(datos)).encode())]
+        if token:
+            headers.append((b"authorization", f"Bearer {token}".encode()))
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": metodo, "scheme": "http", "path": partes.path, "raw_path": partes.path.encode(),
+            "query_string": partes.query.encode(), "root_path": "", "headers": headers,
+            "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+        }
+        terminado = asyncio.Event()
+        enviado = False
+        respuesta = {"status": None, "body": b""}
+
+        async def receive():
+            nonlocal enviado
+            if not enviado:
+                enviado = True
+                return {"type": "http.request", "body": datos, "more_body": False}
+            await terminado.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(mensaje):
+            if mensaje["type"] == "http.response.start":
+                respuesta["status"] = mensaje["status"]
+            elif mensaje["type"] == "http.response.body":
+                respuesta["body"] += mensaje.get("body", b"")
+                if not mensaje.get("more_body"):
+                    terminado.set()
+
+        await self.app(scope, receive, send)
+        return respuesta["status"], respuesta["body"]
+
+
+class ContadorConsultas:
+    """Cuenta consultas SQL en cualquier hilo (las vistas sync corren fuera del loop)."""
+
+    def __init__(self):
+        self.total = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.total += 1
+        return execute(sql, params, many, context)
+
+    def instalar(self):
+        from django.db.backends.signals import connection_created
+        connection_created.connect(self._conectar, weak=False)
+
+    def _conectar(self, sender, connection, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    if not ordenados:
+        return None
+    k = (len(ordenados) - 1) * p / 100
+    i = int(k)
+    j = min(i + 1, len(ordenados) - 1)
+    return ordenados[i] + (ordenados[j] - ordenados[i]) * (k - i)
+
+
+def construir_escenarios(token, usuario_id, servicios_ids, categoria_id):
+    """Cada escenario es una fábrica (n -> (metodo, url, cuerpo, token))."""
+    secuencia = itertools.count()
+    return {
+        "login": lambda n: ("POST", "/api/auth/login/", {"email": EMAIL_BENCH, "password": PASSWORD_BENCH}, None),
+        "registro": lambda n: ("POST", "/api/auth/register/", {
+            "nombre": "Nuevo", "email": f"nuevo{next(secuencia)}@bench.test",
+            "password": "ClaveSegura123", "password_confirm": "ClaveSegura123"}, None),
+        "busqueda_catalogo": lambda n: (
+            "GET", f"/api/servicios/?search=Servicio {n % 50}&categoria={categoria_id}&ordering=costo", None, None),
+        "crear_reserva": lambda n: ("POST", "/api/reservas/", {
+            "usuario": usuario_id, "fecha_inicio": "2030-01-01T10:00:00-04:00", "total": "250.00",
+            "detalles": [{"servicio": servicios_ids[n % len(servicios_ids)], "cantidad": 2,
+                          "precio_unitario": "125.00"}]}, token),
+        "listar_reservas": lambda n: ("GET", "/api/reservas/", None, token),
+    }
+
+
+async def ejecutar(cliente, fabrica, peticiones, concurrencia, contador):
+    latencias, errores = [], 0
+    contador.total = 0
+    n_iter = itertools.count()
+
+    async def trabajador():
+        nonlocal errores
+        while True:
+            n = next(n_iter)
+            if n >= peticiones:
+                return
+            metodo, url, cuerpo, token = fabrica(n)
+            t0 = time.perf_counter()
+            status, _ = await cliente.peticion(metodo, url, cuerpo, token)
+            latencias.append((time.perf_counter() - t0) * 1000)
+            if status is None or status >= 400:
+                errores += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(trabajador() for _ in range(concurrencia)))
+    duracion = time.perf_counter() - t0
+    return {
+        "peticiones": peticiones,
+        "errores": errores,
+        "throughput_rps": round(peticiones / duracion, 2),
+        "p50_ms": round(percentil(latencias, 50), 3),
+        "p95_ms": round(percentil(latencias, 95), 3),
+        "p99_ms": round(percentil(latencias, 99), 3),
+        "consultas_por_peticion": round(contador.total / peticiones, 2),
+    }
+
+
+def version_codigo():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(actual, previo):
+    print(f"\n{'escenario':<20} {'rps':>18} {'p95 ms':>20} {'consultas':>14}")
+    for nombre, r in actual["escenarios"].items():
+        p = previo.get("escenarios", {}).get(nombre)
+        if not p:
+            continue
+        delta = lambda a, b: f"{(a - b) / b * 100:+.1f}%" if b else "n/a"
+        print(f"{nombre:<20} {r['throughput_rps']:>9} ({delta(r['throughput_rps'], p['throughput_rps']):>7})"
+              f" {r['p95_ms']:>10} ({delta(r['p95_ms'], p['p95_ms']):>7})"
+              f" {r['consultas_por_peticion']:>6} ({p['consultas_por_peticion']:>5})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--peticiones", type=int, default=100, help="peticiones por escenario")
+    parser.add_argument("--concurrencia", type=int, default=1)
+    parser.add_argument("--escenarios", nargs="+", choices=ESCENARIOS, default=ESCENARIOS)
+    for clave, valor in ESCALA_DEFECTO.items():
+        parser.add_argument(f"--{clave.replace('_', '-')}", type=int, default=valor, dest=clave)
+    parser.add_argument("--salida", help="archivo JSON de resultados")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DEBUG", "0")
+    os.environ.setdefault("SECRET_KEY", "benchmark-" + "k" * 40)
+    os.environ.setdefault("LIMITES_ACTIVOS", "0")  # se mide la vista, no el rate limiting
+    warnings.filterwarnings("ignore", message="No directory at")
+    directorio = tempfile.mkdtemp(prefix="bench-")
+    configurar_django(os.path.join(directorio, "bench.sqlite3"))
+    contador = ContadorConsultas()
+    contador.instalar()
+
+    import django
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from django.contrib.auth import get_user_model
+    from authz.models import Usuario
+    from catalogo.models import Categoria, Servicio
+    from backend.asgi import application
+
+    escala = {clave: getattr(args, clave) for clave in ESCALA_DEFECTO}
+    t0 = time.perf_counter()
+    filas = sembrar(escala)
+    print(f"datos sembrados en {time.perf_counter() - t0:.1f}s: {filas}")
+
+    token = str(RefreshToken.for_user(get_user_model().objects.get(email=EMAIL_BENCH)).access_token)
+    fabricas = construir_escenarios(
+        token, Usuario.objects.get(email=EMAIL_BENCH).id,
+        list(Servicio.objects.values_list("id", flat=True)), Categoria.objects.values_list("id", flat=True).first(),
+    )
+    cliente = ClienteASGI(application)
+    resultados = {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "version": version_codigo(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "escala": escala,
+        "concurrencia": args.concurrencia,
+        "escenarios": {},
+    }
+    print(f"{'escenario':<20} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'consultas':>10} {'errores':>8}")
+    for nombre in args.escenarios:
+        asyncio.run(ejecutar(cliente, fabricas[nombre], min(5, args.peticiones), 1, contador))  # calentamiento
+        r = asyncio.run(ejecutar(cliente, fabricas[nombre], args.peticiones, args.concurrencia, contador))
+        resultados["escenarios"][nombre] = r
+        print(f"{nombre:<20} {r['throughput_rps']:>9} {r['p50_ms']:>9} {r['p95_ms']:>9} {r['p99_ms']:>9}"
+              f" {r['consultas_por_peticion']:>10} {r['errores']:>8}")
+
+    if args.salida:
+        with open(args.salida, "w") as f:
+            json.dump(resultados, f, indent=2, ensure_ascii=False)
+        print(f"\nresultados guardados en {args.salida}")
+    if args.comparar:
+        with open(args.comparar) as f:
+            comparar(resultados, json.load(f))
+    shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Datos sintéticos para benchmarks, con bulk_create por tabla.
+
+La escala se define con un dict; los valores por defecto generan un
+dataset pequeño que se siembra en segundos.
+"""
+import datetime
+import random
+from decimal import Decimal
+
+ESCALA_DEFECTO = {
+    "categorias": 10,
+    "servicios": 200,
+    "usuarios": 500,
+    "reservas": 2000,
+    "detalles_por_reserva": 2,
+    "visitantes_por_reserva": 2,
+}
+
+# Usuario con contraseña real para los escenarios autenticados
+EMAIL_BENCH = "bench@example.com"
+PASSWORD_BENCH = "BenchPass123"
+
+
+def sembrar(escala=None, semilla=42, lote=1000):
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.utils import timezone
+    from authz.models import Rol, Usuario, RolUsuario
+    from catalogo.models import Categoria, Servicio
+    from reservas.models import Reserva, ReservaServicio, Visitante, ReservaVisitante
+
+    e = {**ESCALA_DEFECTO, **(escala or {})}
+    rnd = random.Random(semilla)
+    ahora = timezone.now()
+    tipos = [t for t, _ in Servicio.TIPO]
+
+    categorias = Categoria.objects.bulk_create(
+        [Categoria(nombre=f"Categoría {i}") for i in range(e["categorias"])], batch_size=lote)
+    servicios = Servicio.objects.bulk_create([
+        Servicio(tipo=rnd.choice(tipos), titulo=f"Servicio {i}", descripcion=f"Descripción del servicio {i}",
+                 duracion_min=rnd.randint(30, 480), costo=Decimal(rnd.randint(1000, 90000)) / 100,
+                 capacidad_max=rnd.randint(5, 40), punto_encuentro="Plaza Murillo",
+                 categoria=rnd.choice(categorias))
+        for i in range(e["servicios"])
+    ], batch_size=lote)
+
+    hash_bench = make_password(PASSWORD_BENCH)
+    usuarios = Usuario.objects.bulk_create(
+        [Usuario(nombre="Bench", email=EMAIL_BENCH, password_hash=hash_bench)]
+        + [Usuario(nombre=f"Usuario {i}", email=f"usuario{i}@bench.test", password_hash="!")
+           for i in range(e["usuarios"])],
+        batch_size=lote)
+    get_user_model().objects.create_user(username=EMAIL_BENCH, email=EMAIL_BENCH, password=PASSWORD_BENCH)
+    cliente = Rol.objects.get_or_create(nombre="CLIENTE")[0]
+    RolUsuario.objects.bulk_create([RolUsuario(rol=cliente, usuario=u) for u in usuarios], batch_size=lote)
+
+    reservas = Reserva.objects.bulk_create([
+        Reserva(usuario=rnd.choice(usuarios), fecha_inicio=ahora + datetime.timedelta(days=rnd.randint(-365, 365)),
+                estado=rnd.choice(["PENDIENTE", "PAGADA", "PAGADA", "CANCELADA"]), total=Decimal("0"))
+        for _ in range(e["reservas"])
+    ], batch_size=lote)
+
+    detalles = []
+    for r in reservas:
+        for s in rnd.sample(servicios, min(e["detalles_por_reserva"], len(servicios))):
+            detalles.append(ReservaServicio(reserva=r, servicio=s, cantidad=rnd.randint(1, 4),
+                                            precio_unitario=s.costo, fecha_servicio=r.fecha_inicio))
+    ReservaServicio.objects.bulk_create(detalles, batch_size=lote)
+
+    n_vis = e["reservas"] * e["visitantes_por_reserva"]
+    visitantes = Visitante.objects.bulk_create([
+        Visitante(documento=f"DOC{i:09d}", nombre=f"Nombre {i}", apellido=f"Apellido {i}",
+                  fecha_nacimiento=datetime.date(1960 + i % 50, 1 + i % 12, 1 + i % 28), nacionalidad="BO")
+        for i in range(n_vis)
+    ], batch_size=lote)
+    enlaces = []
+    for i, r in enumerate(reservas):
+        grupo = visitantes[i * e["visitantes_por_reserva"]:(i + 1) * e["visitantes_por_reserva"]]
+        for j, v in enumerate(grupo):
+            enlaces.append(ReservaVisitante(reserva=r, visitante=v, es_titular=(j == 0)))
+    ReservaVisitante.objects.bulk_create(enlaces, batch_size=lote)
+
+    return {"categorias": len(categorias), "servicios": len(servicios), "usuarios": len(usuarios),
+            "reservas": len(reservas), "detalles": len(detalles), "visitantes": len(visitantes)}
@@ -0,0 +1,80 @@
+"""
+Micro-benchmark: filas/segundo del modo lista rápida frente a los serializers DRF.
+
+    python -m benchmarks.lista_rapida --filas 2000 --repeticiones 5
+"""
+import argparse
+import time
+from decimal import Decimal
+
+from benchmarks import configurar_django
+
+
+def sembrar(n):
+    from django.utils import timezone
+    from authz.models import Rol, Usuario, RolUsuario
+    from catalogo.models import Categoria, Servicio
+    from reservas.models import Reserva, ReservaServicio
+
+    cat = Categoria.objects.create(nombre="Bench")
+    servicios = Servicio.objects.bulk_create([
+        Servicio(tipo="TOUR", titulo=f"Servicio {i}", duracion_min=60, costo=Decimal("123.45") + i,
+                 capacidad_max=20, punto_encuentro="Plaza", categoria=cat)
+        for i in range(n)
+    ])
+    usuarios = Usuario.objects.bulk_create([
+        Usuario(nombre=f"U{i}", email=f"u{i}@bench.test", password_hash="x") for i in range(n)
+    ])
+    rol = Rol.objects.get_or_create(nombre="CLIENTE")[0]
+    RolUsuario.objects.bulk_create([RolUsuario(rol=rol, usuario=u) for u in usuarios])
+    ahora = timezone.now()
+    reservas = Reserva.objects.bulk_create([
+        Reserva(usuario=u, fecha_inicio=ahora, total=Decimal("99.90")) for u in usuarios
+    ])
+    ReservaServicio.objects.bulk_create([
+        ReservaServicio(reserva=r, servicio=s, cantidad=2, precio_unitario=s.costo, fecha_servicio=ahora)
+        for r, s in zip(reservas, servicios)
+    ])
+
+
+def medir(fn, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        fn()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filas", type=int, default=2000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    configurar_django()
+    from rest_framework.renderers import JSONRenderer
+    from authz.models import Usuario
+    from authz.serializers import UsuarioSerializer
+    from catalogo.models import Servicio
+    from catalogo.serializers import ServicioSerializer
+    from reservas.models import Reserva
+    from reservas.serializers import ReservaSerializer
+
+    sembrar(args.filas)
+    casos = [
+        ("servicios", ServicioSerializer, Servicio.objects.select_related("categoria").order_by("pk")),
+        ("reservas", ReservaSerializer, Reserva.objects.prefetch_related("detalles").order_by("pk")),
+        ("usuarios", UsuarioSerializer, Usuario.objects.prefetch_related("roles").order_by("pk")),
+    ]
+    render = JSONRenderer().render
+    print(f"{'caso':<10} {'drf filas/s':>14} {'rápida filas/s':>15} {'x':>6}  idéntico")
+    for nombre, ser, qs in casos:
+        t_drf = medir(lambda: ser(qs.all(), many=True).data, args.repeticiones)
+        t_rap = medir(lambda: ser.lista_rapida(qs.all()), args.repeticiones)
+        igual = render(ser(qs.all(), many=True).data) == render(ser.lista_rapida(qs.all()))
+        print(f"{nombre:<10} {args.filas / t_drf:>14,.0f} {args.filas / t_rap:>15,.0f} {t_drf / t_rap:>6.1f}  {igual}")
+
+
+if __name__ == "__main__":
+    main()
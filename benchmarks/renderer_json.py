@@ -0,0 +1,45 @@
+"""
+Benchmark del renderer JSON sobre el payload de `servicio-list`.
+
+    python -m benchmarks.renderer_json --filas 5000 --repeticiones 20
+"""
+import argparse
+import io
+
+from benchmarks import configurar_django
+from benchmarks.lista_rapida import medir, sembrar
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filas", type=int, default=5000)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    configurar_django()
+    from django.urls import reverse
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.test import APIClient
+    from core.parsers import JSONRapidoParser
+    from core.renderers import JSONRapidoRenderer, orjson
+
+    sembrar(args.filas)
+    respuesta = APIClient().get(reverse("servicio-list"))
+    data = respuesta.data
+    drf, rapido = JSONRenderer(), JSONRapidoRenderer()
+    cuerpo = drf.render(data)
+    print(f"orjson: {orjson.__version__ if orjson else 'no instalado'}  payload: {len(cuerpo):,} bytes")
+    print(f"idéntico: {rapido.render(data) == cuerpo}")
+
+    for nombre, fn_drf, fn_rap in [
+        ("render", lambda: drf.render(data), lambda: rapido.render(data)),
+        ("parse", lambda: JSONParser().parse(io.BytesIO(cuerpo)), lambda: JSONRapidoParser().parse(io.BytesIO(cuerpo))),
+    ]:
+        t_drf = medir(fn_drf, args.repeticiones)
+        t_rap = medir(fn_rap, args.repeticiones)
+        print(f"{nombre:<7} drf {t_drf * 1000:8.2f} ms   rápido {t_rap * 1000:8.2f} ms   x{t_drf / t_rap:.1f}")
+
+
+if __name__ == "__main__":
+    main()
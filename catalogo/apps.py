@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CatalogoConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'catalogo'
+
+    def ready(self):
+        from . import cache  # noqa: F401  (registra las señales que invalidan el listado)
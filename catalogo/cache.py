@@ -0,0 +1,46 @@
+"""
+Caché del listado público de servicios.
+
+Las entradas llevan en la clave una versión del catálogo; invalidar es
+cambiar esa versión (una sola escritura), no buscar y borrar claves. Los
+cambios por el ORM fila a fila (save/delete) la cambian solos vía señales;
+quien escriba con `update()`/`bulk_*` debe llamar a `invalidar_catalogo`
+una vez, al confirmar la transacción.
+"""
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Categoria, Servicio
+
+CLAVE_VERSION = "catalogo:version"
+
+
+def version_catalogo():
+    return cache.get_or_set(CLAVE_VERSION, lambda: uuid.uuid4().hex, None)
+
+
+def invalidar_catalogo():
+    cache.set(CLAVE_VERSION, uuid.uuid4().hex, None)
+
+
+def clave_listado(query_string):
+    huella = hashlib.sha256(query_string.encode()).hexdigest()[:32]
+    return f"catalogo:servicios:{version_catalogo()}:{huella}"
+
+
+def ttl_listado():
+    return getattr(settings, "CATALOGO_CACHE_SEG", 0)
+
+
+@receiver(post_save, sender=Servicio)
+@receiver(post_delete, sender=Servicio)
+@receiver(post_save, sender=Categoria)
+@receiver(post_delete, sender=Categoria)
+def _catalogo_cambiado(sender, **kwargs):
+    transaction.on_commit(invalidar_catalogo)
@@ -0,0 +1,146 @@
+"""
+Cambios masivos al catálogo: importación de planillas y ajuste de precios.
+
+Ambos calculan primero el diff (qué cambia y de qué valor a cuál) y solo
+escriben si no es simulación. La escritura es por lotes (`bulk_create`,
+`bulk_update`, un único `UPDATE ... SET costo = ...`), así que no pasa por
+las señales de `save()`: se invalida la caché del catálogo una sola vez, al
+confirmar la transacción.
+"""
+from django.db import transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Round
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from sincronizacion.signals import registrar_ocultos
+from .cache import invalidar_catalogo
+from .models import Categoria, Servicio
+from .serializers import FilaImportacionSerializer
+
+REQUERIDOS_ALTA = ("tipo", "titulo", "duracion_min", "costo", "capacidad_max", "punto_encuentro", "categoria")
+LOTE_ESCRITURA = 500
+
+
+def _atributo(campo):
+    return "categoria_id" if campo == "categoria" else campo
+
+
+def importar(filas, simular=False):
+    """
+    Upsert por `referencia_externa`. Valida todas las filas antes de escribir
+    nada (ValidationError con los errores por número de fila). Devuelve el diff.
+    """
+    campos = FilaImportacionSerializer().fields
+
+    def texto(campo, valor):
+        return None if valor is None else campos[campo].to_representation(valor)
+
+    errores, validas = {}, []
+    for i, fila in enumerate(filas):
+        s = FilaImportacionSerializer(data=fila)
+        if s.is_valid():
+            validas.append((i, s.validated_data))
+        else:
+            errores[i] = s.errors
+
+    vistas = {}
+    for i, datos in validas:
+        ref = datos["referencia_externa"]
+        if ref in vistas:
+            errores[i] = {"referencia_externa": [f"Repetida (fila {vistas[ref]})."]}
+        vistas.setdefault(ref, i)
+    existentes = Servicio.objects.in_bulk(list(vistas), field_name="referencia_externa")
+    pedidas = {d["categoria"] for _, d in validas if "categoria" in d}
+    categorias = set(Categoria.objects.filter(pk__in=pedidas).values_list("pk", flat=True))
+    for i, datos in validas:
+        if "categoria" in datos and datos["categoria"] not in categorias:
+            errores.setdefault(i, {})["categoria"] = ["No existe."]
+        if datos["referencia_externa"] not in existentes:
+            faltan = [c for c in REQUERIDOS_ALTA if c not in datos]
+            if faltan:
+                errores.setdefault(i, {}).update({c: ["Requerido para crear el servicio."] for c in faltan})
+    if errores:
+        raise ValidationError({"filas": errores})
+
+    nuevos, modificados, cambiados, ocultos = [], [], set(), []
+    diff = {"creados": [], "actualizados": [], "sin_cambios": 0}
+    for _, datos in validas:
+        ref = datos["referencia_externa"]
+        servicio = existentes.get(ref)
+        if servicio is None:
+            nuevos.append(Servicio(**{_atributo(c): v for c, v in datos.items()}))
+            diff["creados"].append({c: texto(c, v) for c, v in datos.items()})
+            continue
+        cambios = {}
+        for campo, valor in datos.items():
+            antes = getattr(servicio, _atributo(campo))
+            if antes != valor:
+                cambios[campo] = [texto(campo, antes), texto(campo, valor)]
+                if campo == "visible_publico" and not valor:
+                    ocultos.append(servicio.pk)
+                setattr(servicio, _atributo(campo), valor)
+                cambiados.add(_atributo(campo))
+        if cambios:
+            modificados.append(servicio)
+            diff["actualizados"].append({"id": servicio.pk, "referencia_externa": ref, "cambios": cambios})
+        else:
+            diff["sin_cambios"] += 1
+
+    if not simular and (nuevos or modificados):
+        ahora = timezone.now()
+        with transaction.atomic():
+            Servicio.objects.bulk_create(nuevos, batch_size=LOTE_ESCRITURA)
+            for s in modificados:
+                s.updated_at = ahora  # bulk_update no aplica auto_now (y el feed /api/sync/ lo necesita)
+            if modificados:
+                Servicio.objects.bulk_update(modificados, [*cambiados, "updated_at"], batch_size=LOTE_ESCRITURA)
+            registrar_ocultos(ocultos)  # el feed /api/sync/ los informa como bajas
+            transaction.on_commit(invalidar_catalogo)
+    return {"simulacion": simular, **diff}
+
+
+def _filtro_ajuste(datos):
+    filtro = Q()
+    if "categoria" in datos:
+        filtro &= Q(categoria_id=datos["categoria"])
+    if "tipo" in datos:
+        filtro &= Q(tipo=datos["tipo"])
+    if "ids" in datos:
+        filtro &= Q(pk__in=datos["ids"])
+    if "referencias" in datos:
+        filtro &= Q(referencia_externa__in=datos["referencias"])
+    return filtro
+
+
+def ajustar_precios(datos, simular=False):
+    """
+    `porcentaje` (10 = +10 %) o `monto` fijo sobre los servicios filtrados,
+    redondeado a centavos por la base de datos. La simulación lee la misma
+    expresión que escribiría el UPDATE, así el diff coincide al centavo.
+    """
+    servicios = Servicio.objects.filter(_filtro_ajuste(datos))
+    costo = Servicio._meta.get_field("costo")
+    if "porcentaje" in datos:
+        factor = 1 + datos["porcentaje"] / 100
+        nuevo = Round(F("costo") * Value(factor, output_field=costo), 2, output_field=costo)
+    else:
+        monto = datos["monto"]
+        if monto < 0 and servicios.filter(costo__lt=-monto).exists():
+            raise ValidationError({"monto": ["Dejaría servicios con costo negativo."]})
+        nuevo = F("costo") + Value(monto, output_field=costo)
+
+    if simular:
+        filas = servicios.annotate(nuevo_costo=nuevo).order_by("pk").values_list(
+            "pk", "referencia_externa", "titulo", "costo", "nuevo_costo")
+        a_texto = FilaImportacionSerializer().fields["costo"].to_representation
+        cambios = [
+            {"id": pk, "referencia_externa": ref, "titulo": titulo, "costo": [a_texto(antes), a_texto(despues)]}
+            for pk, ref, titulo, antes, despues in filas
+        ]
+        return {"simulacion": True, "actualizados": len(cambios), "cambios": cambios}
+
+    with transaction.atomic():
+        n = servicios.update(costo=nuevo, updated_at=timezone.now())
+        transaction.on_commit(invalidar_catalogo)
+    return {"simulacion": False, "actualizados": n}
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogo', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='servicio',
+            index=models.Index(condition=models.Q(('visible_publico', True)), fields=['categoria', 'tipo'], name='servicio_visible_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogo', '0002_indices_parciales'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='categoria',
+            index=models.Index(fields=['updated_at'], name='categoria_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicio',
+            index=models.Index(fields=['updated_at'], name='servicio_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogo', '0003_indices_sync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicio',
+            name='referencia_externa',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
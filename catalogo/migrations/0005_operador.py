@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authz', '0004_rol_operador'),
+        ('catalogo', '0004_referencia_externa'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicio',
+            name='operador',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='servicios_operados', to='authz.usuario'),
+        ),
+        migrations.AddIndex(
+            model_name='servicio',
+            index=models.Index(fields=['operador', 'tipo'], name='servicio_operador_idx'),
+        ),
+    ]
@@ -1,11 +1,24 @@
 from django.db import models
 from core.models import TimeStampedModel
+from authz.models import Usuario
 
 class Categoria(TimeStampedModel):
     nombre = models.CharField(max_length=100, unique=True)
     descripcion = models.CharField(max_length=255, blank=True, null=True)
+    class Meta:
+        # Feed de sincronización (/api/sync/)
+        indexes = [models.Index(fields=["updated_at"], name="categoria_updated_idx")]
     def __str__(self): return self.nombre
 
+class ServicioQuerySet(models.QuerySet):
+    def visibles(self):
+        return self.filter(visible_publico=True)
+
+class VisibleManager(models.Manager.from_queryset(ServicioQuerySet)):
+    """Solo servicios visibles al público."""
+    def get_queryset(self):
+        return super().get_queryset().visibles()
+
 class Servicio(TimeStampedModel):
     TIPO = (("TOUR","TOUR"),("ALOJAMIENTO","ALOJAMIENTO"),("TRANSPORTE","TRANSPORTE"),("ACTIVIDAD","ACTIVIDAD"))
     tipo = models.CharField(max_length=20, choices=TIPO)
@@ -17,6 +30,20 @@ class Servicio(TimeStampedModel):
     punto_encuentro = models.CharField(max_length=255)
     visible_publico = models.BooleanField(default=True)
     categoria = models.ForeignKey(Categoria, on_delete=models.RESTRICT, related_name="servicios")
+    # Código del servicio en el sistema/planilla del operador; clave de /servicios/importar/
+    referencia_externa = models.CharField(max_length=64, unique=True, null=True, blank=True)
+    # Dueño del inventario (rol OPERADOR); la API del operador siempre filtra por esta columna
+    # (indexada por servicio_operador_idx, que la lleva como primera columna)
+    operador = models.ForeignKey(Usuario, on_delete=models.SET_NULL, null=True, blank=True, db_index=False,
+                                 related_name="servicios_operados")
+    objects = ServicioQuerySet.as_manager()
+    publicos = VisibleManager()
     class Meta:
-        indexes = [models.Index(fields=["categoria"]), models.Index(fields=["tipo"])]
+        indexes = [
+            models.Index(fields=["categoria"]), models.Index(fields=["tipo"]),
+            # Catálogo público: solo filas visibles
+            models.Index(fields=["categoria", "tipo"], condition=models.Q(visible_publico=True), name="servicio_visible_idx"),
+            models.Index(fields=["updated_at"], name="servicio_updated_idx"),
+            models.Index(fields=["operador", "tipo"], name="servicio_operador_idx"),
+        ]
     def __str__(self): return self.titulo
@@ -1,4 +1,7 @@
+from decimal import Decimal
+
 from rest_framework import serializers
+from core.serializers import ListaRapidaMixin
 from .models import Categoria, Servicio
 
 class CategoriaSerializer(serializers.ModelSerializer):
@@ -6,7 +9,7 @@ class CategoriaSerializer(serializers.ModelSerializer):
         model = Categoria
         fields = "__all__"  # expone todos los campos del modelo
 
-class ServicioSerializer(serializers.ModelSerializer):
+class ServicioSerializer(ListaRapidaMixin, serializers.ModelSerializer):
     categoria_nombre = serializers.CharField(
         source="categoria.nombre", read_only=True
     )
@@ -14,3 +17,38 @@ class ServicioSerializer(serializers.ModelSerializer):
     class Meta:
         model = Servicio
         fields = "__all__"
+
+class FilaImportacionSerializer(serializers.Serializer):
+    """Una fila de /servicios/importar/. Solo `referencia_externa` es obligatoria para actualizar."""
+    referencia_externa = serializers.CharField(max_length=64)
+    tipo = serializers.ChoiceField(choices=Servicio.TIPO, required=False)
+    titulo = serializers.CharField(max_length=120, required=False)
+    descripcion = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    duracion_min = serializers.IntegerField(min_value=0, max_value=32767, required=False)
+    costo = serializers.DecimalField(max_digits=12, decimal_places=2, min_value=0, required=False)
+    capacidad_max = serializers.IntegerField(min_value=0, max_value=32767, required=False)
+    punto_encuentro = serializers.CharField(max_length=255, required=False)
+    visible_publico = serializers.BooleanField(required=False)
+    categoria = serializers.IntegerField(min_value=1, required=False)
+
+class ImportacionServiciosSerializer(serializers.Serializer):
+    servicios = serializers.ListField(child=serializers.DictField(), allow_empty=False, max_length=5000)
+
+class AjustePreciosSerializer(serializers.Serializer):
+    porcentaje = serializers.DecimalField(max_digits=7, decimal_places=2, min_value=Decimal("-99.99"), required=False)
+    monto = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    # Filtros (se combinan con AND); sin ninguno hay que pedir `todos` explícitamente
+    categoria = serializers.IntegerField(min_value=1, required=False)
+    tipo = serializers.ChoiceField(choices=Servicio.TIPO, required=False)
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False)
+    referencias = serializers.ListField(child=serializers.CharField(max_length=64), required=False, allow_empty=False)
+    todos = serializers.BooleanField(default=False)
+
+    FILTROS = ("categoria", "tipo", "ids", "referencias")
+
+    def validate(self, attrs):
+        if ("porcentaje" in attrs) == ("monto" in attrs):
+            raise serializers.ValidationError("Indica 'porcentaje' o 'monto' (uno solo).")
+        if not attrs["todos"] and not any(f in attrs for f in self.FILTROS):
+            raise serializers.ValidationError("Sin filtros: envía 'todos': true para ajustar todo el catálogo.")
+        return attrs
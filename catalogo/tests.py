@@ -1,3 +1,91 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from packages.common.consultas import query_budget
+from packages.common.pruebas import cliente_admin, cliente_de, crear_servicio
+from .cache import version_catalogo
+from .models import Categoria, Servicio
+
+
+class CargaMasivaTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.cat = Categoria.objects.create(nombre="Aventura")
+        self.salar = crear_servicio(categoria=self.cat, referencia_externa="OP-1")
+        self.hotel = crear_servicio("Hotel", tipo="ALOJAMIENTO", costo=Decimal("333.33"), categoria=self.cat,
+                                    referencia_externa="OP-2")
+        self.client = cliente_admin()
+
+    def test_importar_csv_simulado_y_real(self):
+        csv = (
+            "referencia_externa,titulo,tipo,duracion_min,costo,capacidad_max,punto_encuentro,categoria\n"
+            "OP-1,,,,120.5,12,,\n"
+            f"OP-3,Isla del Sol,TOUR,240,80,20,Copacabana,{self.cat.pk}\n"
+            "OP-2,,,,333.33,,,\n"
+        )
+        r = self.client.post("/api/servicios/importar/?simular=1", csv, content_type="text/csv")
+        self.assertEqual(r.status_code, 200, r.content)
+        self.assertEqual(r.data["actualizados"][0]["cambios"],
+                         {"costo": ["100.00", "120.50"], "capacidad_max": [10, 12]})
+        self.assertEqual((len(r.data["creados"]), r.data["sin_cambios"]), (1, 1))
+        self.assertFalse(Servicio.objects.filter(referencia_externa="OP-3").exists())
+
+        version = version_catalogo()
+        with self.captureOnCommitCallbacks(execute=True):
+            r = self.client.post("/api/servicios/importar/", csv, content_type="text/csv")
+        self.assertFalse(r.data["simulacion"])
+        self.salar.refresh_from_db()
+        self.assertEqual((self.salar.costo, self.salar.capacidad_max), (Decimal("120.50"), 12))
+        self.assertEqual(Servicio.objects.get(referencia_externa="OP-3").categoria, self.cat)
+        self.assertNotEqual(version_catalogo(), version)
+
+    def test_importar_valida_todas_las_filas(self):
+        filas = [{"referencia_externa": "OP-9", "titulo": "Sin datos"},
+                 {"referencia_externa": "OP-1", "costo": "-1"},
+                 {"referencia_externa": "OP-2", "categoria": 999}]
+        r = self.client.post("/api/servicios/importar/", {"servicios": filas}, format="json")
+        self.assertEqual(r.status_code, 400)
+        self.assertEqual(set(r.json()["filas"]), {"0", "1", "2"})
+        self.assertEqual(Servicio.objects.get(pk=self.salar.pk).costo, Decimal("100"))
+
+    def test_ajustar_precios_un_update(self):
+        datos = {"porcentaje": "10", "categoria": self.cat.pk}
+        r = self.client.post("/api/servicios/ajustar-precios/?simular=1", datos, format="json")
+        self.assertEqual([c["costo"] for c in r.data["cambios"]], [["100.00", "110.00"], ["333.33", "366.66"]])
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            r = self.client.post("/api/servicios/ajustar-precios/", datos, format="json")
+        self.assertEqual(r.data, {"simulacion": False, "actualizados": 2})
+        self.assertEqual(len(callbacks), 1)  # una sola invalidación para todo el lote
+        self.assertEqual(Servicio.objects.get(pk=self.hotel.pk).costo, Decimal("366.66"))
+
+        r = self.client.post("/api/servicios/ajustar-precios/", {"monto": "-200", "ids": [self.salar.pk]}, format="json")
+        self.assertEqual(r.status_code, 400)
+        r = self.client.post("/api/servicios/ajustar-precios/", {"monto": "5"}, format="json")
+        self.assertEqual(r.status_code, 400)  # sin filtros ni 'todos'
+
+    def test_solo_admin(self):
+        r = cliente_de("c@example.com").post("/api/servicios/ajustar-precios/", {"monto": "5", "todos": True}, format="json")
+        self.assertEqual(r.status_code, 403)
+
+    @override_settings(CATALOGO_CACHE_SEG=60)
+    def test_listado_cacheado_por_version(self):
+        anonimo = APIClient()
+        self.assertEqual(len(anonimo.get("/api/servicios/").data), 2)
+        with self.assertNumQueries(0):
+            anonimo.get("/api/servicios/")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.salar.delete()
+        self.assertEqual(len(anonimo.get("/api/servicios/").data), 1)
+
+
+class ListadoServiciosTests(TestCase):
+    def test_listado_sin_n_mas_1(self):
+        for i in range(5):
+            crear_servicio(f"Tour {i}", costo=Decimal("10"), categoria=Categoria.objects.create(nombre=f"Cat {i}"))
+        with query_budget(1):  # categoria_nombre viene en el mismo SELECT
+            r = APIClient().get("/api/servicios/")
+        self.assertEqual([s["categoria_nombre"] for s in r.data], [f"Cat {i}" for i in range(5)])
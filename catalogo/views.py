@@ -1,14 +1,36 @@
+from django.core.cache import cache
+from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiParameter, OpenApiResponse
 from rest_framework import viewsets, permissions, filters
+from rest_framework import serializers as drf_serializers
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from authz.roles import EsAdmin
+from core.idempotencia import idempotente
+from core.parsers import CSVParser, JSONRapidoParser, leer_csv
+from core.serializers import ListaRapidaViewSetMixin
+from .cache import clave_listado, ttl_listado
+from . import carga_masiva
 from .models import Categoria, Servicio
-from .serializers import CategoriaSerializer, ServicioSerializer
+from .serializers import (
+    AjustePreciosSerializer, CategoriaSerializer, FilaImportacionSerializer,
+    ImportacionServiciosSerializer, ServicioSerializer,
+)
+
+SIMULAR = OpenApiParameter("simular", bool, description="1 = solo devolver el diff, sin escribir")
+
+
+def _simular(request):
+    return request.query_params.get("simular") in ("1", "true", "True")
+
 
 class CategoriaViewSet(viewsets.ModelViewSet):
     queryset = Categoria.objects.all()
     serializer_class = CategoriaSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
-class ServicioViewSet(viewsets.ModelViewSet):
-    queryset = Servicio.objects.all()
+class ServicioViewSet(ListaRapidaViewSetMixin, viewsets.ModelViewSet):
+    queryset = Servicio.objects.select_related("categoria")  # categoria_nombre
     serializer_class = ServicioSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
@@ -18,7 +40,7 @@ class ServicioViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         qs = super().get_queryset()
         if self.request.method == "GET":
-            qs = qs.filter(visible_publico=True)
+            qs = qs.visibles()
         categoria = self.request.query_params.get("categoria")
         if categoria:
             qs = qs.filter(categoria_id=categoria)
@@ -26,3 +48,76 @@ class ServicioViewSet(viewsets.ModelViewSet):
         if tipo:
             qs = qs.filter(tipo=tipo)
         return qs
+
+    def list(self, request, *args, **kwargs):
+        ttl = ttl_listado()
+        if not ttl:
+            return super().list(request, *args, **kwargs)
+        clave = clave_listado(request.META.get("QUERY_STRING", ""))
+        datos = cache.get(clave)
+        if datos is None:
+            datos = list(super().list(request, *args, **kwargs).data)
+            cache.set(clave, datos, ttl)
+        return Response(datos)
+
+    @extend_schema(
+        summary="Importar servicios (CSV o JSON)",
+        description=(
+            "Upsert por `referencia_externa`: `text/csv` con encabezados, JSON `{\"servicios\": [...]}` "
+            "o multipart con `archivo`. Se validan todas las filas antes de escribir. Solo ADMIN."
+        ),
+        parameters=[SIMULAR],
+        request=ImportacionServiciosSerializer,
+        responses={
+            200: inline_serializer(
+                name="ImportacionServiciosResponse",
+                fields={
+                    "simulacion": drf_serializers.BooleanField(),
+                    "creados": FilaImportacionSerializer(many=True),
+                    "actualizados": drf_serializers.ListField(child=drf_serializers.DictField()),
+                    "sin_cambios": drf_serializers.IntegerField(),
+                },
+            ),
+            400: OpenApiResponse(description="Errores por número de fila"),
+            403: OpenApiResponse(description="Requiere rol ADMIN"),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="importar", permission_classes=[EsAdmin],
+            parser_classes=[JSONRapidoParser, CSVParser, MultiPartParser])
+    @idempotente
+    def importar(self, request):
+        if "archivo" in request.FILES:
+            filas = {"servicios": leer_csv(request.FILES["archivo"].read())}
+        else:
+            filas = request.data if isinstance(request.data, dict) else {"servicios": request.data}
+        serializer = ImportacionServiciosSerializer(data=filas)
+        serializer.is_valid(raise_exception=True)
+        return Response(carga_masiva.importar(serializer.validated_data["servicios"], simular=_simular(request)))
+
+    @extend_schema(
+        summary="Ajustar precios en bloque",
+        description=(
+            "Un solo UPDATE sobre los servicios filtrados: `porcentaje` (10 = +10 %) o `monto` fijo. "
+            "Con ?simular=1 devuelve los costos antes/después sin escribir. Solo ADMIN."
+        ),
+        parameters=[SIMULAR],
+        request=AjustePreciosSerializer,
+        responses={
+            200: inline_serializer(
+                name="AjustePreciosResponse",
+                fields={
+                    "simulacion": drf_serializers.BooleanField(),
+                    "actualizados": drf_serializers.IntegerField(),
+                    "cambios": drf_serializers.ListField(child=drf_serializers.DictField(), required=False),
+                },
+            ),
+            400: OpenApiResponse(description="Validación fallida"),
+            403: OpenApiResponse(description="Requiere rol ADMIN"),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="ajustar-precios", permission_classes=[EsAdmin])
+    @idempotente
+    def ajustar_precios(self, request):
+        serializer = AjustePreciosSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(carga_masiva.ajustar_precios(serializer.validated_data, simular=_simular(request)))
@@ -0,0 +1,30 @@
+"""
+Bucles de fondo dentro de cada worker ASGI.
+
+Django no atiende el protocolo lifespan; `con_bucles_de_fondo` envuelve la
+aplicación, lanza las corrutinas al arrancar el worker y las cancela al
+apagarlo. Las peticiones HTTP/WebSocket pasan directo a Django.
+"""
+import asyncio
+
+
+def con_bucles_de_fondo(app, fabricas):
+    """`fabricas`: callables sin argumentos que devuelven una corrutina cada uno."""
+    if not fabricas:
+        return app
+
+    async def aplicacion(scope, receive, send):
+        if scope["type"] != "lifespan":
+            return await app(scope, receive, send)
+        tareas = []
+        while True:
+            mensaje = await receive()
+            if mensaje["type"] == "lifespan.startup":
+                tareas = [asyncio.create_task(f()) for f in fabricas]
+                await send({"type": "lifespan.startup.complete"})
+            elif mensaje["type"] == "lifespan.shutdown":
+                for t in tareas:
+                    t.cancel()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    return aplicacion
@@ -0,0 +1,201 @@
+"""
+Registro de consultas lentas con su plan de ejecución.
+
+Cada conexión nueva recibe un `execute_wrapper` (señal connection_created)
+que mide todas las consultas, dentro o fuera de una petición. Las que
+tardan CONSULTAS_LENTAS_MS o más se guardan en un buffer circular en
+memoria (CONSULTAS_LENTAS_MAX entradas por proceso) con:
+
+- el SQL y su huella (forma sin valores, ver packages.common.consultas);
+- los parámetros redactados: números, fechas y booleanos tal cual, texto
+  y binarios solo con su largo (emails, hashes, tokens no salen);
+- la vista que la ejecutó (`ConsultasLentasMiddleware`);
+- el plan: `EXPLAIN (FORMAT JSON)` en PostgreSQL, `EXPLAIN QUERY PLAN` en
+  SQLite. Se pide a lo sumo una vez cada CONSULTAS_LENTAS_EXPLAIN_SEG por
+  huella y, dentro de una transacción, en un savepoint: un EXPLAIN fallido
+  no aborta la transacción de la petición.
+
+El buffer es por proceso: /api/diagnostico/consultas-lentas/ muestra lo
+que vio el worker que atiende la petición.
+"""
+import contextvars
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.utils import timezone
+
+from packages.common.consultas import forma_sql
+
+logger = logging.getLogger(__name__)
+
+_EXPLICABLE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+_SIN_REDACTAR = (bool, int, float, Decimal, date, datetime, dt_time)
+
+_peticion_actual = contextvars.ContextVar("consultas_lentas_peticion", default=None)
+# Las consultas del propio registro (EXPLAIN, savepoints) no se miden
+_midiendo = threading.local()
+
+_lock = threading.Lock()
+_buffer = deque(maxlen=getattr(settings, "CONSULTAS_LENTAS_MAX", 500))
+_planes = {}  # huella -> (monotonic, plan)
+
+
+def huella(forma):
+    return hashlib.sha1(forma.encode()).hexdigest()[:16]
+
+
+def _redactar_valor(v):
+    if v is None or isinstance(v, _SIN_REDACTAR):
+        return v
+    if isinstance(v, (str, bytes, bytearray, memoryview)):
+        return f"<{type(v).__name__}:{len(v)}>"
+    if isinstance(v, (list, tuple)):
+        return [_redactar_valor(x) for x in v]
+    return f"<{type(v).__name__}>"
+
+
+def redactar(params):
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {k: _redactar_valor(v) for k, v in params.items()}
+    return [_redactar_valor(v) for v in params]
+
+
+def _vista():
+    request = _peticion_actual.get()
+    if request is None:
+        return None
+    match = getattr(request, "resolver_match", None)
+    return f"{request.method} {match.view_name if match else request.path}"
+
+
+def _explicar(connection, sql, params):
+    if connection.vendor == "postgresql":
+        prefijo = "EXPLAIN (FORMAT JSON) "
+    elif connection.vendor == "sqlite":
+        prefijo = "EXPLAIN QUERY PLAN "
+    else:
+        return None
+    # Savepoint solo si hay transacción abierta; en autocommit un error no arrastra nada
+    bloque = transaction.atomic(using=connection.alias) if connection.in_atomic_block else nullcontext()
+    try:
+        with bloque, connection.cursor() as c:
+            c.execute(prefijo + sql, params)
+            filas = c.fetchall()
+    except DatabaseError as e:
+        logger.debug("EXPLAIN falló: %s", e)
+        return None
+    if connection.vendor == "postgresql":
+        return filas[0][0]
+    return [{"id": f[0], "padre": f[1], "detalle": f[-1]} for f in filas]
+
+
+def _plan(connection, h, sql, params, many):
+    if many or not _EXPLICABLE.match(sql):
+        return None
+    ahora = time.monotonic()
+    previo = _planes.get(h)
+    if previo is not None and ahora - previo[0] < getattr(settings, "CONSULTAS_LENTAS_EXPLAIN_SEG", 300):
+        return previo[1]
+    plan = _explicar(connection, sql, params)
+    _planes[h] = (ahora, plan)
+    return plan
+
+
+def _registrar(connection, sql, params, many, ms):
+    _midiendo.activo = True
+    try:
+        forma = forma_sql(sql)
+        h = huella(forma)
+        entrada = {
+            "huella": h,
+            "forma": forma,
+            "sql": sql,
+            "params": None if many else redactar(params),
+            "ms": round(ms, 3),
+            "vista": _vista(),
+            "cuando": timezone.now(),
+            "base": connection.alias,
+            "plan": _plan(connection, h, sql, params, many),
+        }
+        with _lock:
+            _buffer.append(entrada)
+    finally:
+        _midiendo.activo = False
+
+
+def _medir(execute, sql, params, many, context):
+    if getattr(_midiendo, "activo", False) or not getattr(settings, "CONSULTAS_LENTAS_ACTIVAS", True):
+        return execute(sql, params, many, context)
+    inicio = time.perf_counter()
+    resultado = execute(sql, params, many, context)
+    ms = (time.perf_counter() - inicio) * 1000
+    if ms >= getattr(settings, "CONSULTAS_LENTAS_MS", 200):
+        _registrar(context["connection"], sql, params, many, ms)
+    return resultado
+
+
+@receiver(connection_created)
+def _instalar(sender, connection, **kwargs):
+    # La señal se repite en cada reconexión del mismo DatabaseWrapper
+    if _medir not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_medir)
+
+
+class ConsultasLentasMiddleware:
+    """Deja la petición en curso a mano del wrapper, para anotar qué vista hizo cada consulta."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _peticion_actual.set(request)
+        try:
+            return self.get_response(request)
+        finally:
+            _peticion_actual.reset(token)
+
+
+def entradas():
+    with _lock:
+        return list(_buffer)
+
+
+def vaciar():
+    with _lock:
+        _buffer.clear()
+        _planes.clear()
+
+
+def top_huellas(limite=20):
+    """Huellas del buffer ordenadas por tiempo total, con la última muestra de cada una."""
+    grupos = {}
+    for e in entradas():
+        g = grupos.get(e["huella"])
+        if g is None:
+            g = grupos[e["huella"]] = {"huella": e["huella"], "forma": e["forma"], "veces": 0,
+                                       "total_ms": 0.0, "max_ms": 0.0, "vistas": set()}
+        g["veces"] += 1
+        g["total_ms"] += e["ms"]
+        g["max_ms"] = max(g["max_ms"], e["ms"])
+        if e["vista"]:
+            g["vistas"].add(e["vista"])
+        g["ultima"] = {k: e[k] for k in ("sql", "params", "ms", "vista", "cuando", "plan")}
+    orden = sorted(grupos.values(), key=lambda g: g["total_ms"], reverse=True)[:limite]
+    for g in orden:
+        g["total_ms"] = round(g["total_ms"], 3)
+        g["media_ms"] = round(g["total_ms"] / g["veces"], 3)
+        g["vistas"] = sorted(g["vistas"])
+    return orden
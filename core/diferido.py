@@ -0,0 +1,30 @@
+"""
+Importación diferida de vistas pesadas.
+
+Las rutas de documentación (drf-spectacular, que arrastra PyYAML y el
+generador de esquemas) solo se usan en desarrollo o por humanos; importarlas
+al cargar `backend.urls` alarga el arranque de cada worker. `vista_diferida`
+registra la ruta con un callable liviano que importa la vista real en la
+primera petición.
+
+Criterio del proyecto: los módulos baratos o que ya se cargan al arrancar se
+importan arriba del archivo; los pesados que solo usa una ruta poco frecuente
+se importan dentro de la función o se registran con `vista_diferida`. No
+vale la pena diferir lo que Django o DRF ya cargan de todos modos (p. ej.
+django.core.mail, que importa django.utils.log): `manage.py perfil_arranque`
+muestra qué paquetes pesan realmente.
+"""
+from django.utils.module_loading import import_string
+
+
+def vista_diferida(ruta, **initkwargs):
+    vista = None
+
+    def despachar(request, *args, **kwargs):
+        nonlocal vista
+        if vista is None:
+            vista = import_string(ruta).as_view(**initkwargs)
+        return vista(request, *args, **kwargs)
+
+    despachar.csrf_exempt = True  # igual que APIView.as_view()
+    return despachar
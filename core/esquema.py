@@ -0,0 +1,160 @@
+"""
+Esquema OpenAPI generado una vez por versión de código y servido precomprimido.
+
+drf-spectacular recorre todos los viewsets y declaraciones `extend_schema` en
+cada GET a /api/schema/. Aquí el esquema se genera una sola vez por versión
+(`settings.VERSION_CODIGO`), ya sea en el build (`manage.py generar_esquema`,
+que lo deja en disco) o en la primera petición, y se sirve desde memoria con
+variantes gzip/brotli ya comprimidas, cada una con su ETag (sufijo -gzip/-br).
+"""
+import gzip
+import hashlib
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - opcional (whitenoise[brotli])
+    brotli = None
+
+
+class JWTTrazadaScheme(SimpleJWTScheme):
+    # Misma seguridad "Bearer" que JWTAuthentication (core.trazas solo agrega un tramo)
+    target_class = "core.trazas.JWTAuthenticationTrazada"
+
+
+RENDERERS = {"yaml": OpenApiYamlRenderer, "json": OpenApiJsonRenderer}
+
+_cache = {}
+_lock = threading.Lock()
+
+
+class EsquemaCompilado:
+    def __init__(self, cuerpo, media_type):
+        self.cuerpo = cuerpo
+        self.media_type = media_type
+        self.gzip = gzip.compress(cuerpo, compresslevel=9, mtime=0)
+        self.br = brotli.compress(cuerpo) if brotli else None
+        self.huella = hashlib.sha256(cuerpo).hexdigest()[:32]
+
+    def variante(self, accept_encoding):
+        """(codificación o None, bytes, ETag) según Accept-Encoding; cada codificación con su ETag."""
+        q = calidades(accept_encoding)
+        candidatas = [c for c in (("br", self.br), ("gzip", self.gzip)) if c[1] is not None and q(c[0]) > 0]
+        if candidatas:
+            # La de mayor q; a igual q, el orden de preferencia propio (br antes que gzip)
+            codificacion, cuerpo = max(candidatas, key=lambda c: q(c[0]))
+            return codificacion, cuerpo, f'"{self.huella}-{codificacion}"'
+        return None, self.cuerpo, f'"{self.huella}"'
+
+
+def calidades(accept_encoding):
+    """
+    Función codificación -> q según Accept-Encoding: la explícita, si no la
+    de `*`, si no 0. `gzip;q=0` (o `*;q=0` sin gzip) la rechaza.
+    """
+    explicitas = {}
+    for parte in accept_encoding.split(","):
+        nombre, _, parametros = parte.partition(";")
+        nombre = nombre.strip().lower()
+        if not nombre:
+            continue
+        q = 1.0
+        for p in parametros.split(";"):
+            clave, _, valor = p.partition("=")
+            if clave.strip().lower() == "q":
+                try:
+                    q = float(valor)
+                except ValueError:
+                    q = 0.0
+        explicitas[nombre] = q
+    return lambda codificacion: explicitas.get(codificacion, explicitas.get("*", 0.0))
+
+
+def version_codigo():
+    return getattr(settings, "VERSION_CODIGO", "") or "dev"
+
+
+def directorio_esquema():
+    return Path(getattr(settings, "ESQUEMA_DIR", Path(settings.STATIC_ROOT) / "openapi"))
+
+
+def _archivo(version, formato):
+    return directorio_esquema() / f"openapi-{version}.{formato}"
+
+
+def generar(formato):
+    """Genera el esquema completo (público) y lo renderiza en `formato`."""
+    schema = SchemaGenerator().get_schema(request=None, public=True)
+    renderer = RENDERERS[formato]()
+    return renderer.render(schema, renderer.media_type, {}), renderer.media_type
+
+
+def guardar_en_disco(version=None):
+    """Usado en el build: escribe yaml/json sin comprimir (gzip/brotli se arman al cargarlos en memoria)."""
+    version = version or version_codigo()
+    directorio_esquema().mkdir(parents=True, exist_ok=True)
+    rutas = []
+    for formato in RENDERERS:
+        cuerpo, _ = generar(formato)
+        ruta = _archivo(version, formato)
+        ruta.write_bytes(cuerpo)
+        rutas.append(ruta)
+    return rutas
+
+
+def obtener(formato):
+    version = version_codigo()
+    clave = (version, formato)
+    compilado = _cache.get(clave)
+    if compilado is None:
+        with _lock:
+            compilado = _cache.get(clave)
+            if compilado is None:
+                ruta = _archivo(version, formato)
+                media_type = RENDERERS[formato].media_type
+                if version != "dev" and ruta.exists():
+                    cuerpo = ruta.read_bytes()
+                else:
+                    cuerpo, media_type = generar(formato)
+                compilado = _cache[clave] = EsquemaCompilado(cuerpo, media_type)
+    return compilado
+
+
+def invalidar():
+    _cache.clear()
+
+
+class EsquemaCacheadoView(SpectacularAPIView):
+    """Igual que SpectacularAPIView (negociación YAML/JSON), pero servido desde caché."""
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        renderer, _ = self.perform_content_negotiation(request)
+        formato = "json" if renderer.format == "json" else "yaml"
+        compilado = obtener(formato)
+        codificacion, cuerpo, etag = compilado.variante(request.headers.get("Accept-Encoding", ""))
+
+        # Comparación débil (W/"x" == "x"), como la de un proxy que recomprime
+        previas = {e.removeprefix("W/") for e in parse_etags(request.headers.get("If-None-Match", ""))}
+        if etag in previas or "*" in previas:
+            respuesta = HttpResponseNotModified()
+        else:
+            respuesta = HttpResponse(cuerpo, content_type=compilado.media_type)
+            if codificacion:
+                respuesta["Content-Encoding"] = codificacion
+            respuesta["Content-Disposition"] = f'inline; filename="{settings.SPECTACULAR_SETTINGS.get("TITLE", "schema")}.{formato}"'
+        respuesta["ETag"] = etag
+        respuesta["Cache-Control"] = "public, max-age=300"
+        patch_vary_headers(respuesta, ["Accept", "Accept-Encoding"])
+        return respuesta
@@ -0,0 +1,131 @@
+"""
+Claves de idempotencia para POSTs que los clientes móviles reintentan.
+
+Con el header `Idempotency-Key`, la primera petición reserva la clave en la
+tabla `ClaveIdempotencia` (restricción única) y guarda la respuesta al
+terminar; las repeticiones con el mismo cuerpo devuelven esa respuesta sin
+volver a ejecutar la vista. Sin el header la vista se ejecuta normalmente.
+
+La clave vale por cliente: el usuario autenticado o, sin sesión, la IP
+(la misma que usan los límites, ver REST_FRAMEWORK["NUM_PROXIES"]). Los
+campos de `omitir` (p. ej. tokens JWT) no se guardan: la repetición
+devuelve la respuesta sin ellos.
+"""
+import functools
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpRequest
+from django.http.request import RawPostDataException
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import ClaveIdempotencia
+
+HEADER = "Idempotency-Key"
+
+
+def _ttl():
+    return timedelta(seconds=getattr(settings, "IDEMPOTENCIA_TTL_SEG", 24 * 60 * 60))
+
+
+def _abandono():
+    # Una clave "en curso" más vieja que esto pertenece a un worker que murió
+    return timedelta(seconds=getattr(settings, "IDEMPOTENCIA_EN_CURSO_SEG", 120))
+
+
+def _hash(request):
+    h = hashlib.sha256()
+    h.update(request.method.encode())
+    h.update(request.get_full_path().encode())
+    try:
+        h.update(request.body)
+    except RawPostDataException:  # el cuerpo ya fue consumido por el parser
+        h.update(json.dumps(request.data, cls=JSONEncoder, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def _alcance(request):
+    usuario = getattr(request, "user", None)
+    if usuario is not None and usuario.is_authenticated:
+        uid = usuario.pk
+    else:
+        uid = f"anon@{BaseThrottle().get_ident(request)}"
+    return f"{uid}:{request.method}:{request.path}"[:255]
+
+
+def _respuesta_guardada(registro):
+    r = Response(registro.respuesta, status=registro.estado_http)
+    r["Idempotent-Replayed"] = "true"
+    return r
+
+
+def ejecutar_idempotente(request, vista, *args, omitir=(), **kwargs):
+    clave = request.headers.get(HEADER)
+    if not clave:
+        return vista(*args, **kwargs)
+    if len(clave) > 255:
+        return Response({"detail": f"{HEADER} demasiado largo (máx. 255)."}, status=status.HTTP_400_BAD_REQUEST)
+
+    alcance, huella, ahora = _alcance(request), _hash(request), timezone.now()
+    ClaveIdempotencia.objects.filter(alcance=alcance, clave=clave, expira__lte=ahora).delete()
+    try:
+        with transaction.atomic():
+            registro = ClaveIdempotencia.objects.create(
+                alcance=alcance, clave=clave, hash_peticion=huella, expira=ahora + _ttl())
+    except IntegrityError:
+        previo = ClaveIdempotencia.objects.filter(alcance=alcance, clave=clave).first()
+        if previo is None:  # expiró/borrada entre medio: el cliente puede reintentar
+            return Response({"detail": "Reintenta la petición."}, status=status.HTTP_409_CONFLICT)
+        if previo.hash_peticion != huella:
+            return Response({"detail": f"{HEADER} ya usado con otra petición."},
+                            status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+        if previo.en_curso:
+            if previo.creado < ahora - _abandono():
+                previo.delete()
+                return Response({"detail": "Reintenta la petición."}, status=status.HTTP_409_CONFLICT)
+            return Response({"detail": "Petición con la misma clave en proceso."}, status=status.HTTP_409_CONFLICT)
+        return _respuesta_guardada(previo)
+
+    try:
+        respuesta = vista(*args, **kwargs)
+    except Exception:
+        registro.delete()
+        raise
+    if respuesta.status_code >= 500 or not hasattr(respuesta, "data"):
+        registro.delete()
+        return respuesta
+    registro.en_curso = False
+    registro.estado_http = respuesta.status_code
+    datos = respuesta.data
+    if omitir and isinstance(datos, dict):
+        datos = {k: v for k, v in datos.items() if k not in omitir}
+    registro.respuesta = json.loads(json.dumps(datos, cls=JSONEncoder))
+    registro.save(update_fields=["en_curso", "estado_http", "respuesta"])
+    return respuesta
+
+
+def idempotente(vista=None, *, omitir=()):
+    """
+    Decorador para vistas de función (debajo de @api_view) y métodos de ViewSet.
+    Busca el request como primer o segundo argumento posicional.
+    `@idempotente(omitir=("access", "refresh"))` no guarda esos campos.
+    """
+    def decorar(vista):
+        @functools.wraps(vista)
+        def envoltura(*args, **kwargs):
+            request = next(a for a in args[:2] if isinstance(a, (Request, HttpRequest)))
+            return ejecutar_idempotente(request, vista, *args, omitir=omitir, **kwargs)
+        return envoltura
+    return decorar(vista) if vista is not None else decorar
+
+
+def purgar_vencidas():
+    return ClaveIdempotencia.objects.filter(expira__lte=timezone.now()).delete()[0]
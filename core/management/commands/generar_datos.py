@@ -0,0 +1,208 @@
+"""
+Genera datasets sintéticos de tamaño producción para ajustar consultas.
+
+    python manage.py generar_datos --usuarios 50000 --servicios 2000 --reservas 1000000 --visitantes 100000
+
+Inserta por lotes con bulk_create (o COPY en PostgreSQL con psycopg2), con ids
+asignados de antemano para no depender de RETURNING, y mantiene consistentes
+las FKs y la restricción de un solo titular por reserva.
+"""
+import csv
+import datetime
+import io
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from authz.models import Rol, Usuario, RolUsuario
+from catalogo.models import Categoria, Servicio
+from cupones.models import Cupon
+from reservas.models import Reserva, ReservaServicio, Visitante, ReservaVisitante
+
+CENTAVO = Decimal("0.01")
+
+
+class Escritor:
+    """Inserta instancias por tabla con COPY (PostgreSQL) o bulk_create, y lleva la cuenta de filas."""
+
+    def __init__(self, usar_copy, lote):
+        self.usar_copy = usar_copy
+        self.lote = lote
+        self.filas = {}
+
+    def escribir(self, modelo, objetos):
+        if not objetos:
+            return
+        if self.usar_copy:
+            self._copy(modelo, objetos)
+        else:
+            modelo.objects.bulk_create(objetos, batch_size=self.lote)
+        nombre = modelo._meta.label
+        self.filas[nombre] = self.filas.get(nombre, 0) + len(objetos)
+
+    def _copy(self, modelo, objetos):
+        campos = [f for f in modelo._meta.concrete_fields]
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer)
+        for obj in objetos:
+            fila = []
+            for f in campos:
+                v = f.get_db_prep_save(f.pre_save(obj, True), connection)
+                fila.append(r"\N" if v is None else v)
+            escritor.writerow(fila)
+        buffer.seek(0)
+        columnas = ", ".join(connection.ops.quote_name(f.column) for f in campos)
+        sql = f"COPY {connection.ops.quote_name(modelo._meta.db_table)} ({columnas}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        with connection.cursor() as cursor:
+            cursor.cursor.copy_expert(sql, buffer)
+
+
+def siguiente_id(modelo):
+    return (modelo.objects.aggregate(m=Max("id"))["m"] or 0) + 1
+
+
+class Command(BaseCommand):
+    help = "Genera datos sintéticos por lotes (bulk_create / COPY) en authz, catalogo, cupones y reservas."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--usuarios", type=int, default=1000)
+        parser.add_argument("--categorias", type=int, default=20)
+        parser.add_argument("--servicios", type=int, default=200)
+        parser.add_argument("--cupones", type=int, default=50)
+        parser.add_argument("--reservas", type=int, default=10000)
+        parser.add_argument("--visitantes", type=int, default=None,
+                            help="tamaño del padrón de visitantes (por defecto reservas/10)")
+        parser.add_argument("--max-detalles", type=int, default=3, help="servicios por reserva (1..N)")
+        parser.add_argument("--max-visitantes", type=int, default=3, help="visitantes por reserva (1..N)")
+        parser.add_argument("--lote", type=int, default=5000)
+        parser.add_argument("--semilla", type=int, default=42)
+        parser.add_argument("--sin-copy", action="store_true", help="forzar bulk_create aun en PostgreSQL")
+
+    def handle(self, *args, **o):
+        rnd = random.Random(o["semilla"])
+        usar_copy = False
+        if not o["sin_copy"] and connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                usar_copy = hasattr(cursor.cursor, "copy_expert")  # psycopg2
+        esc = Escritor(usar_copy, o["lote"])
+        lote = o["lote"]
+        ahora = timezone.now()
+        inicio = time.perf_counter()
+        self.stdout.write(f"Insertando con {'COPY' if usar_copy else 'bulk_create'} (lote={lote})")
+
+        # Catálogo
+        base = siguiente_id(Categoria)
+        categorias = [Categoria(id=base + i, nombre=f"Categoría generada {base + i}") for i in range(o["categorias"])]
+        base = siguiente_id(Servicio)
+        tipos = [t for t, _ in Servicio.TIPO]
+        servicios = [
+            Servicio(id=base + i, tipo=rnd.choice(tipos), titulo=f"Servicio generado {base + i}",
+                     descripcion=f"Descripción {base + i}", duracion_min=rnd.randint(30, 600),
+                     costo=(Decimal(rnd.randint(1000, 150000)) / 100).quantize(CENTAVO),
+                     capacidad_max=rnd.randint(5, 60), punto_encuentro="Plaza principal",
+                     visible_publico=rnd.random() < 0.9, categoria_id=rnd.choice(categorias).id)
+            for i in range(o["servicios"])
+        ]
+        base = siguiente_id(Cupon)
+        cupones = [
+            Cupon(id=base + i, codigo=f"GEN{base + i:08d}", tipo=rnd.choice(["PORCENTAJE", "FIJO"]),
+                  valor=Decimal(rnd.choice([5, 10, 15, 20, 50])), estado=rnd.random() < 0.8)
+            for i in range(o["cupones"])
+        ]
+        with transaction.atomic():
+            esc.escribir(Categoria, categorias)
+            esc.escribir(Servicio, servicios)
+            esc.escribir(Cupon, cupones)
+
+        # Usuarios (sin contraseña utilizable: el hash real cuesta ~100 ms por fila)
+        cliente = Rol.objects.get_or_create(nombre="CLIENTE")[0]
+        base_u = siguiente_id(Usuario)
+        base_ru = siguiente_id(RolUsuario)
+        for desde in range(0, o["usuarios"], lote):
+            n = min(lote, o["usuarios"] - desde)
+            with transaction.atomic():
+                esc.escribir(Usuario, [
+                    Usuario(id=base_u + desde + i, nombre=f"Usuario {base_u + desde + i}",
+                            email=f"gen{base_u + desde + i}@datos.test", password_hash="!",
+                            estado="ACTIVO" if rnd.random() < 0.95 else "INACTIVO")
+                    for i in range(n)
+                ])
+                esc.escribir(RolUsuario, [RolUsuario(id=base_ru + desde + i, rol_id=cliente.id,
+                                                     usuario_id=base_u + desde + i) for i in range(n)])
+        usuarios_ids = range(base_u, base_u + o["usuarios"]) or list(Usuario.objects.values_list("id", flat=True))
+
+        # Padrón de visitantes
+        n_vis = o["visitantes"] if o["visitantes"] is not None else max(o["reservas"] // 10, o["max_visitantes"])
+        base_v = siguiente_id(Visitante)
+        for desde in range(0, n_vis, lote):
+            with transaction.atomic():
+                esc.escribir(Visitante, [
+                    Visitante(id=base_v + i, documento=f"GEN{base_v + i:010d}", nombre=f"Nombre {base_v + i}",
+                              apellido=f"Apellido {base_v + i}",
+                              fecha_nacimiento=datetime.date(1950 + i % 60, 1 + i % 12, 1 + i % 28),
+                              nacionalidad=rnd.choice(["BO", "PE", "AR", "CL", "BR"]))
+                    for i in range(desde, min(desde + lote, n_vis))
+                ])
+        visitantes_ids = range(base_v, base_v + n_vis) or list(Visitante.objects.values_list("id", flat=True))
+
+        # Reservas + detalles + visitantes, por lotes
+        catalogo = servicios or list(Servicio.objects.all())
+        if o["reservas"] and (not catalogo or not usuarios_ids or not visitantes_ids):
+            self.stderr.write("Se necesitan servicios, usuarios y visitantes para generar reservas.")
+            return
+        descuentos = {c.id: c for c in cupones if c.estado}
+        cupones_ids = list(descuentos)
+        base_r, base_rs, base_rv = siguiente_id(Reserva), siguiente_id(ReservaServicio), siguiente_id(ReservaVisitante)
+        id_rs = base_rs
+        id_rv = base_rv
+        for desde in range(0, o["reservas"], lote):
+            reservas, detalles, enlaces = [], [], []
+            for i in range(desde, min(desde + lote, o["reservas"])):
+                rid = base_r + i
+                fecha = ahora + datetime.timedelta(days=rnd.randint(-730, 180), hours=rnd.randint(6, 18))
+                subtotal = Decimal("0")
+                for s in rnd.sample(catalogo, min(rnd.randint(1, o["max_detalles"]), len(catalogo))):
+                    cantidad = rnd.randint(1, 4)
+                    subtotal += s.costo * cantidad
+                    detalles.append(ReservaServicio(id=id_rs, reserva_id=rid, servicio_id=s.id, cantidad=cantidad,
+                                                    precio_unitario=s.costo, fecha_servicio=fecha))
+                    id_rs += 1
+                cupon_id = rnd.choice(cupones_ids) if cupones_ids and rnd.random() < 0.1 else None
+                total = subtotal
+                if cupon_id:
+                    c = descuentos[cupon_id]
+                    total = subtotal * (1 - c.valor / 100) if c.tipo == "PORCENTAJE" else max(subtotal - c.valor, 0)
+                reservas.append(Reserva(
+                    id=rid, usuario_id=rnd.choice(usuarios_ids), fecha_inicio=fecha, cupon_id=cupon_id,
+                    estado=rnd.choices(["PENDIENTE", "PAGADA", "CANCELADA", "REPROGRAMADA"], [15, 65, 15, 5])[0],
+                    total=Decimal(total).quantize(CENTAVO),
+                ))
+                grupo = rnd.sample(visitantes_ids, min(rnd.randint(1, o["max_visitantes"]), len(visitantes_ids)))
+                for j, vid in enumerate(grupo):
+                    # El primero del grupo es el único titular de la reserva
+                    enlaces.append(ReservaVisitante(id=id_rv, reserva_id=rid, visitante_id=vid, es_titular=(j == 0)))
+                    id_rv += 1
+            with transaction.atomic():
+                esc.escribir(Reserva, reservas)
+                esc.escribir(ReservaServicio, detalles)
+                esc.escribir(ReservaVisitante, enlaces)
+            self.stdout.write(f"  reservas {desde + len(reservas):>10,}/{o['reservas']:,}")
+
+        if usar_copy:
+            modelos = [Categoria, Servicio, Cupon, Usuario, RolUsuario, Visitante, Reserva, ReservaServicio, ReservaVisitante]
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(no_style(), modelos):
+                    cursor.execute(sql)
+
+        duracion = time.perf_counter() - inicio
+        total = sum(esc.filas.values())
+        for nombre, filas in esc.filas.items():
+            self.stdout.write(f"{nombre:<28} {filas:>12,}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{total:,} filas en {duracion:.1f}s ({total / duracion if duracion else 0:,.0f} filas/s)"))
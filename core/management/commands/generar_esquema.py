@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from core.esquema import guardar_en_disco, version_codigo
+
+
+class Command(BaseCommand):
+    help = "Genera el esquema OpenAPI de la versión actual en disco (correr tras collectstatic)."
+
+    def handle(self, *args, **o):
+        for ruta in guardar_en_disco():
+            self.stdout.write(f"  {ruta}")
+        self.stdout.write(self.style.SUCCESS(f"Esquema generado para la versión {version_codigo()}"))
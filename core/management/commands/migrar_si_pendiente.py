@@ -0,0 +1,28 @@
+"""
+Paso de arranque "verificar y aplicar": solo ejecuta `migrate` si hay migraciones pendientes.
+
+`migrate` sin nada pendiente igual corre los system checks (importa todo el
+URLconf) y emite post_migrate (contenttypes/permisos consultan cada modelo).
+Este comando solo lee el grafo de migraciones y la tabla django_migrations.
+"""
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+
+class Command(BaseCommand):
+    help = "Aplica migraciones solo si hay pendientes (arranque rápido cuando no hay nada que hacer)."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **o):
+        executor = MigrationExecutor(connections[o["database"]])
+        plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+        if not plan:
+            self.stdout.write("Sin migraciones pendientes.")
+            return
+        self.stdout.write(f"{len(plan)} migración(es) pendiente(s); aplicando...")
+        call_command("migrate", database=o["database"], interactive=False, verbosity=o["verbosity"])
@@ -0,0 +1,95 @@
+"""
+Perfil de arranque de un worker: tiempo de importación por módulo.
+
+    python manage.py perfil_arranque --top 25
+    python manage.py perfil_arranque --migraciones   # compara migrate vs migrar_si_pendiente
+
+Lanza un intérprete nuevo con `-X importtime` que hace lo mismo que un worker
+(django.setup() + URLconf + aplicación ASGI) y resume su salida.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+SCRIPT = (
+    "import os, time; t0 = time.perf_counter(); "
+    "os.environ.setdefault('DJANGO_SETTINGS_MODULE', {settings!r}); "
+    "import django; django.setup(); "
+    "import importlib; importlib.import_module({urlconf!r}); "
+    "from django.core.asgi import get_asgi_application; get_asgi_application(); "
+    "print('TOTAL', time.perf_counter() - t0)"
+)
+
+
+def parsear_importtime(salida):
+    """Devuelve [(modulo, propio_us, acumulado_us, profundidad)] desde la salida de -X importtime."""
+    modulos = []
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        _, propio, acumulado, nombre = (p.strip(" ") for p in linea.replace("import time:", "|", 1).split("|"))
+        profundidad = (len(nombre) - len(nombre.lstrip(" "))) // 2
+        modulos.append((nombre.strip(), int(propio), int(acumulado), profundidad))
+    return modulos
+
+
+def medir_comando(*args):
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "manage.py", *args], cwd=settings.BASE_DIR, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+
+class Command(BaseCommand):
+    help = "Reporta el tiempo de importación por módulo al arrancar un worker."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=20)
+        parser.add_argument("--json", action="store_true", help="salida JSON")
+        parser.add_argument("--migraciones", action="store_true",
+                            help="mide también 'migrate' vs 'migrar_si_pendiente' sin pendientes")
+
+    def handle(self, *args, **o):
+        script = SCRIPT.format(settings=os.environ.get("DJANGO_SETTINGS_MODULE", "backend.settings"),
+                               urlconf=settings.ROOT_URLCONF)
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", script], cwd=settings.BASE_DIR,
+                              capture_output=True, text=True, check=True)
+        total = float(proc.stdout.split("TOTAL")[-1])
+        modulos = parsear_importtime(proc.stderr)
+
+        por_paquete = defaultdict(int)
+        for nombre, propio, _, _ in modulos:
+            por_paquete[nombre.split(".")[0]] += propio
+        top = sorted(modulos, key=lambda m: m[2], reverse=True)[:o["top"]]
+        paquetes = sorted(por_paquete.items(), key=lambda p: p[1], reverse=True)[:o["top"]]
+
+        resultado = {
+            "total_s": round(total, 3),
+            "modulos": len(modulos),
+            "top_acumulado_ms": [(n, round(a / 1000, 1)) for n, _, a, _ in top],
+            "por_paquete_ms": [(n, round(t / 1000, 1)) for n, t in paquetes],
+        }
+        if o["migraciones"]:
+            resultado["migrate_s"] = round(medir_comando("migrate", "--no-input"), 3)
+            resultado["migrar_si_pendiente_s"] = round(medir_comando("migrar_si_pendiente"), 3)
+
+        if o["json"]:
+            self.stdout.write(json.dumps(resultado, indent=2))
+            return
+        self.stdout.write(f"Arranque (setup + URLconf + ASGI): {total * 1000:.0f} ms, {len(modulos)} módulos\n")
+        self.stdout.write("Acumulado por módulo (ms):")
+        for nombre, ms in resultado["top_acumulado_ms"]:
+            self.stdout.write(f"  {ms:>8.1f}  {nombre}")
+        self.stdout.write("\nTiempo propio por paquete (ms):")
+        for nombre, ms in resultado["por_paquete_ms"]:
+            self.stdout.write(f"  {ms:>8.1f}  {nombre}")
+        if o["migraciones"]:
+            self.stdout.write(f"\nmigrate: {resultado['migrate_s']:.2f}s   "
+                              f"migrar_si_pendiente: {resultado['migrar_si_pendiente_s']:.2f}s")
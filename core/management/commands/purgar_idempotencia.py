@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from core.idempotencia import purgar_vencidas
+
+
+class Command(BaseCommand):
+    help = "Elimina las claves de idempotencia vencidas."
+
+    def handle(self, *args, **o):
+        self.stdout.write(self.style.SUCCESS(f"{purgar_vencidas()} clave(s) eliminadas"))
@@ -0,0 +1,60 @@
+import signal
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from core.tareas import ejecutar, id_worker, purgar_hechas, recuperar_abandonadas, tomar
+
+
+class Command(BaseCommand):
+    help = "Ejecuta las tareas encoladas con core.tareas (reintentos con backoff, FALLIDA al agotarlos)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrencia", type=int, default=1, help="hilos que toman tareas en paralelo")
+        parser.add_argument("--intervalo", type=float, help="segundos entre sondeos con la cola vacía")
+        parser.add_argument("--una-vez", action="store_true", help="vaciar la cola y salir")
+
+    def handle(self, *args, **o):
+        intervalo = o["intervalo"] or getattr(settings, "TAREAS_INTERVALO_SEG", 2)
+        self.parar = threading.Event()
+        self.ejecutadas = 0
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: self.parar.set())
+        modo = "SKIP LOCKED" if connection.features.has_select_for_update_skip_locked else "UPDATE condicional"
+        self.stdout.write(f"worker: {o['concurrencia']} hilo(s), toma con {modo}")
+
+        recuperar_abandonadas()
+        hilos = [threading.Thread(target=self._bucle, args=(intervalo, o["una_vez"]), daemon=True)
+                 for _ in range(o["concurrencia"])]
+        for h in hilos:
+            h.start()
+        ultimo_mantenimiento = time.monotonic()
+        while any(h.is_alive() for h in hilos):
+            for h in hilos:
+                h.join(timeout=1)
+            if time.monotonic() - ultimo_mantenimiento > 60:
+                close_old_connections()
+                recuperar_abandonadas()
+                purgar_hechas()
+                ultimo_mantenimiento = time.monotonic()
+        self.stdout.write(self.style.SUCCESS(f"worker detenido; {self.ejecutadas} tarea(s) ejecutadas"))
+
+    def _bucle(self, intervalo, una_vez):
+        worker = id_worker()
+        try:
+            while not self.parar.is_set():
+                close_old_connections()
+                tomadas = tomar(worker)
+                if not tomadas:
+                    if una_vez:
+                        return
+                    self.parar.wait(intervalo)
+                    continue
+                estado = ejecutar(tomadas[0])
+                self.ejecutadas += 1
+                self.stdout.write(f"  {tomadas[0].nombre} #{tomadas[0].pk}: {estado}")
+        finally:
+            connection.close()
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClaveIdempotencia',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alcance', models.CharField(max_length=255)),
+                ('clave', models.CharField(max_length=255)),
+                ('hash_peticion', models.CharField(max_length=64)),
+                ('en_curso', models.BooleanField(default=True)),
+                ('estado_http', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('respuesta', models.JSONField(blank=True, null=True)),
+                ('creado', models.DateTimeField(auto_now_add=True)),
+                ('expira', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['expira'], name='core_clavei_expira_cc8847_idx')],
+                'constraints': [models.UniqueConstraint(fields=('alcance', 'clave'), name='uq_idempotencia_clave')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_clave_idempotencia'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContadorLimite',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clave', models.CharField(max_length=255)),
+                ('ventana', models.BigIntegerField()),
+                ('cuenta', models.PositiveIntegerField(default=0)),
+                ('expira', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['expira'], name='core_contad_expira_e98e48_idx')],
+                'constraints': [models.UniqueConstraint(fields=('clave', 'ventana'), name='uq_contador_limite')],
+            },
+        ),
+    ]
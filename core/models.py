@@ -1,7 +1,56 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
 
 class TimeStampedModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     class Meta:
         abstract = True
+
+class ClaveIdempotencia(models.Model):
+    """Respuesta guardada para un header Idempotency-Key (por usuario + método + ruta)."""
+    alcance = models.CharField(max_length=255)
+    clave = models.CharField(max_length=255)
+    hash_peticion = models.CharField(max_length=64)
+    en_curso = models.BooleanField(default=True)
+    estado_http = models.PositiveSmallIntegerField(null=True, blank=True)
+    respuesta = models.JSONField(null=True, blank=True)
+    creado = models.DateTimeField(auto_now_add=True)
+    expira = models.DateTimeField()
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["alcance", "clave"], name="uq_idempotencia_clave")]
+        indexes = [models.Index(fields=["expira"])]
+
+class ContadorLimite(models.Model):
+    """Contador de una ventana fija para el rate limiting de ventana deslizante."""
+    clave = models.CharField(max_length=255)
+    ventana = models.BigIntegerField()  # inicio de la ventana (epoch en segundos)
+    cuenta = models.PositiveIntegerField(default=0)
+    expira = models.DateTimeField()
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["clave", "ventana"], name="uq_contador_limite")]
+        indexes = [models.Index(fields=["expira"])]
+
+class Tarea(models.Model):
+    """Trabajo en segundo plano encolado con core.tareas; lo ejecuta `manage.py worker`."""
+    ESTADO = (("PENDIENTE","PENDIENTE"),("EN_CURSO","EN_CURSO"),("HECHA","HECHA"),("FALLIDA","FALLIDA"))
+    nombre = models.CharField(max_length=200)  # ruta de la función registrada con @tarea
+    argumentos = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    estado = models.CharField(max_length=10, choices=ESTADO, default="PENDIENTE")
+    intentos = models.PositiveSmallIntegerField(default=0)
+    max_intentos = models.PositiveSmallIntegerField(default=5)
+    ejecutar_desde = models.DateTimeField(default=timezone.now)
+    tomada_en = models.DateTimeField(null=True, blank=True)
+    tomada_por = models.CharField(max_length=100, blank=True)
+    ultimo_error = models.TextField(blank=True)
+    creada = models.DateTimeField(auto_now_add=True)
+    terminada = models.DateTimeField(null=True, blank=True)
+    class Meta:
+        indexes = [
+            # Lo que consulta el worker en cada sondeo
+            models.Index(fields=["ejecutar_desde"], condition=models.Q(estado="PENDIENTE"), name="tarea_pendiente_idx"),
+            # Recuperar tareas de workers que murieron
+            models.Index(fields=["tomada_en"], condition=models.Q(estado="EN_CURSO"), name="tarea_en_curso_idx"),
+        ]
+    def __str__(self): return f"{self.nombre} [{self.estado}]"
@@ -0,0 +1,66 @@
+"""
+Parser JSON rápido basado en orjson (dependencia opcional), y un parser
+CSV para las importaciones masivas.
+
+Con STRICT_JSON (por defecto) acepta y rechaza lo mismo que el JSONParser de
+DRF; ante cualquier error se re-parsea con la librería estándar para
+devolver exactamente el mismo ParseError (o aceptar enteros > 64 bits).
+"""
+import csv
+import io
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from .renderers import JSONRapidoRenderer, orjson
+
+# Enteros fuera de 64 bits: algunas versiones de orjson los convierten a float.
+# Se detectan corridas de 19+ dígitos (translate + búsqueda, ambos en C).
+_SOLO_DIGITOS = bytes(0x30 if 0x30 <= i <= 0x39 else 0x20 for i in range(256))
+_CORRIDA = b"0" * 19
+
+
+class JSONRapidoParser(JSONParser):
+    renderer_class = JSONRapidoRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower().replace("_", "-") not in ("utf-8", "utf8"):
+            return super().parse(stream, media_type, parser_context)
+        contenido = stream.read()
+        if _CORRIDA in contenido.translate(_SOLO_DIGITOS):
+            return super().parse(io.BytesIO(contenido), media_type, parser_context)
+        try:
+            return orjson.loads(contenido)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(contenido), media_type, parser_context)
+
+
+class CSVParser(BaseParser):
+    """`text/csv` con fila de encabezados -> lista de dicts (texto; las celdas vacías se omiten)."""
+    media_type = "text/csv"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        return leer_csv(stream.read(), parser_context.get("encoding", settings.DEFAULT_CHARSET))
+
+
+def leer_csv(contenido, encoding="utf-8"):
+    """Bytes de un CSV (también un archivo subido por multipart) -> lista de dicts, o ParseError."""
+    try:
+        return _filas_csv(contenido.decode(encoding).lstrip("\ufeff"))  # BOM de Excel
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise ParseError(f"CSV inválido: {e}")
+
+
+def _filas_csv(texto):
+    lector = csv.DictReader(io.StringIO(texto))
+    if not lector.fieldnames:
+        raise csv.Error("falta la fila de encabezados")
+    filas = []
+    for fila in lector:
+        limpia = {(k or "").strip(): (v or "").strip() for k, v in fila.items() if isinstance(v, str)}
+        filas.append({k: v for k, v in limpia.items() if k and v})
+    return filas
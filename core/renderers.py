@@ -0,0 +1,50 @@
+"""
+Renderer JSON rápido basado en orjson (dependencia opcional).
+
+Produce el mismo JSON que `rest_framework.renderers.JSONRenderer`:
+salida compacta UTF-8 y datetime/date/time/Decimal/UUID/lazy strings
+codificados con el mismo `encoders.JSONEncoder` de DRF. Si orjson no
+está instalado, se pide indentación (API navegable) o la configuración
+de DRF no es la compacta por defecto, delega en el renderer estándar.
+
+Diferencias conocidas:
+- floats muy grandes o muy chicos se escriben con otro formato de
+  exponente (mismo valor al parsear): `1e+16` sale `1e16`, `1e-07` sale
+  `1e-7` y `1e-05` sale `0.00001`. Pueden llegar, p. ej., desde
+  `Parametro.valor` (JSONField); los Decimal no cambian.
+- NaN/Infinity salen como null en vez de levantar ValueError (los
+  serializers del proyecto no los producen).
+"""
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+_OPCIONES = 0
+if orjson is not None:
+    # datetime y dataclasses pasan por el encoder de DRF para conservar su formato
+    _OPCIONES = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+class JSONRapidoRenderer(JSONRenderer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._default = self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self._default, option=_OPCIONES)
+        except orjson.JSONEncodeError:
+            # Enteros > 64 bits, claves no str, etc.: mismo resultado/error que DRF
+            return super().render(data, accepted_media_type, renderer_context)
+        # Igual que DRF: escapar U+2028/U+2029 para que sea un subconjunto de JS
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
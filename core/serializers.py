@@ -0,0 +1,155 @@
+"""
+Modo "lista rápida" para endpoints de listado con muchas filas.
+
+En vez de instanciar modelos y recorrer los campos de DRF fila por fila,
+se leen tuplas con `.values()` y cada columna pasa por un convertidor
+precompilado (Decimal/datetime se preparan una sola vez por columna).
+La salida es idéntica a la del ModelSerializer equivalente.
+"""
+import decimal
+from collections import defaultdict
+
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.fields import ISO_8601
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+def _identidad(v):
+    return v
+
+
+def _convertidor_decimal(field):
+    coerce = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+    if not coerce or field.localize or field.normalize_output or field.decimal_places is None:
+        return field.to_representation
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    quantum = decimal.Decimal(".1") ** field.decimal_places
+    rounding = field.rounding
+
+    def convertir(v):
+        if not isinstance(v, decimal.Decimal):
+            v = decimal.Decimal(str(v).strip())
+        return f"{v.quantize(quantum, rounding=rounding, context=context):f}"
+    return convertir
+
+
+def _convertidor_datetime(field):
+    formato = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if formato is None or formato.lower() != ISO_8601 or tz is None:
+        return field.to_representation
+
+    def convertir(v):
+        if v.tzinfo is None:
+            return field.to_representation(v)
+        s = v.astimezone(tz).isoformat()
+        return s[:-6] + "Z" if s.endswith("+00:00") else s
+    return convertir
+
+
+def _convertidor(field):
+    if isinstance(field, PrimaryKeyRelatedField):
+        return _identidad if field.pk_field is None else field.pk_field.to_representation
+    if isinstance(field, serializers.DecimalField):
+        return _convertidor_decimal(field)
+    if isinstance(field, serializers.DateTimeField):
+        return _convertidor_datetime(field)
+    if isinstance(field, serializers.ChoiceField):
+        return field.to_representation
+    if isinstance(field, (serializers.CharField, serializers.IntegerField)):
+        return str if isinstance(field, serializers.CharField) else int
+    return field.to_representation
+
+
+class PlanListaRapida:
+    """Columnas de `.values()` + convertidor por campo, compiladas desde un serializer."""
+
+    def __init__(self, serializer):
+        self.model = serializer.Meta.model
+        self.columnas = []   # (nombre_salida, lookup, convertidor)
+        self.muchos = []     # (nombre_salida, through, campo_origen, campo_destino)
+        self.anidados = []   # (nombre_salida, fk_padre, PlanListaRapida)
+        self.salida = []
+        for field in serializer._readable_fields:
+            nombre = field.field_name
+            self.salida.append(nombre)
+            if isinstance(field, ManyRelatedField):
+                if not isinstance(field.child_relation, PrimaryKeyRelatedField):
+                    raise TypeError(f"{nombre}: solo se soportan relaciones M2M por pk")
+                m2m = self.model._meta.get_field(field.source)
+                self.muchos.append((nombre, m2m.remote_field.through, m2m.m2m_field_name(), m2m.m2m_reverse_field_name()))
+            elif isinstance(field, serializers.ListSerializer):
+                relacion = self.model._meta.get_field(field.source)
+                self.anidados.append((nombre, relacion.field.name, PlanListaRapida(field.child)))
+            elif isinstance(field, serializers.SerializerMethodField) or field.source == "*":
+                raise TypeError(f"{nombre}: campo no soportado en modo lista rápida")
+            else:
+                self.columnas.append((nombre, "__".join(field.source_attrs), _convertidor(field)))
+
+    def filas(self, queryset, excluir=()):
+        lookups = list(dict.fromkeys(["pk"] + [c[1] for c in self.columnas]))
+        registros = list(queryset.prefetch_related(None).values(*lookups, *excluir))
+        if not registros:
+            return registros
+        ids = [r["pk"] for r in registros]
+
+        extra = {}
+        for nombre, through, origen, destino in self.muchos:
+            agrupado = defaultdict(list)
+            for a, b in (through.objects.filter(**{f"{origen}_id__in": ids})
+                         .order_by("pk").values_list(f"{origen}_id", f"{destino}_id")):
+                agrupado[a].append(b)
+            extra[nombre] = agrupado
+        for nombre, fk, plan in self.anidados:
+            agrupado = defaultdict(list)
+            hijos = plan.model._default_manager.filter(**{f"{fk}_id__in": ids}).order_by("pk")
+            for hijo in plan.filas(hijos, excluir=(f"{fk}_id",)):
+                agrupado[hijo.pop(f"{fk}_id")].append(hijo)
+            extra[nombre] = agrupado
+
+        columnas = {nombre: (lookup, conv) for nombre, lookup, conv in self.columnas}
+        salida = []
+        for r in registros:
+            fila = {}
+            for nombre in self.salida:
+                if nombre in columnas:
+                    lookup, conv = columnas[nombre]
+                    v = r[lookup]
+                    fila[nombre] = None if v is None else conv(v)
+                else:
+                    fila[nombre] = extra[nombre].get(r["pk"], [])
+            for k in excluir:
+                fila[k] = r[k]
+            salida.append(fila)
+        return salida
+
+
+class ListaRapidaMixin:
+    """
+    Serializer con método de clase `lista_rapida(queryset)` que devuelve
+    la misma lista de dicts que `Serializer(qs, many=True).data`.
+    """
+
+    @classmethod
+    def lista_rapida(cls, queryset, context=None):
+        return PlanListaRapida(cls(context=context or {})).filas(queryset)
+
+
+class ListaRapidaViewSetMixin:
+    """
+    Usa `serializer_class.lista_rapida` en `list()` cuando
+    settings.LISTA_RAPIDA está activo y no hay paginación.
+    """
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.get_serializer_class()
+        if (not getattr(settings, "LISTA_RAPIDA", False) or self.paginator is not None
+                or not hasattr(serializer_class, "lista_rapida")):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(serializer_class.lista_rapida(queryset, self.get_serializer_context()))
@@ -0,0 +1,197 @@
+"""
+Cola de trabajos sobre la base de datos (no hay broker en nuestro entorno).
+
+    @tarea(max_intentos=5)
+    def enviar_email(usuario_id): ...
+
+    enviar_email.encolar(usuario.id)          # desde una vista
+    enviar_email.encolar(usuario.id, demora=timedelta(minutes=5))
+
+`encolar` inserta una fila `Tarea` en la misma transacción que la vista: si
+la vista hace rollback el trabajo no existe. `manage.py worker` las toma:
+
+- PostgreSQL: `SELECT ... FOR UPDATE SKIP LOCKED` sobre el índice parcial de
+  pendientes y un UPDATE a EN_CURSO en la misma transacción; varios workers
+  nunca toman la misma fila ni se esperan entre sí.
+- SQLite (local): no hay bloqueos de fila; cada candidata se toma con un
+  UPDATE condicional (`WHERE estado='PENDIENTE'`) y gana quien afecte 1 fila.
+
+Si la función falla se reintenta con backoff exponencial
+(TAREAS_BACKOFF_BASE_SEG * 2^(intento-1), con jitter y tope
+TAREAS_BACKOFF_MAX_SEG); al agotar `max_intentos` queda FALLIDA (dead
+letter) con el traceback en `ultimo_error`. Una tarea EN_CURSO más vieja que
+TAREAS_VISIBILIDAD_SEG se considera de un worker muerto y vuelve a la cola
+(o queda FALLIDA si ese era su último intento).
+"""
+import asyncio
+import functools
+import logging
+import os
+import random
+import socket
+import threading
+import traceback
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import Tarea
+
+logger = logging.getLogger(__name__)
+
+
+class TareaDesconocida(Exception):
+    pass
+
+
+class FuncionTarea:
+    """Función registrada con @tarea: se puede llamar normal o `.encolar(...)`."""
+
+    def __init__(self, func, max_intentos):
+        if "<locals>" in func.__qualname__:
+            raise TypeError("@tarea solo admite funciones de nivel de módulo")
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.nombre = f"{func.__module__}.{func.__qualname__}"
+        self.max_intentos = max_intentos
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def encolar(self, *args, demora=None, **kwargs):
+        return Tarea.objects.create(
+            nombre=self.nombre,
+            argumentos={"args": list(args), "kwargs": kwargs},
+            max_intentos=self.max_intentos,
+            ejecutar_desde=timezone.now() + (demora or timedelta()),
+        )
+
+
+def tarea(func=None, *, max_intentos=5):
+    """Decorador: `@tarea` o `@tarea(max_intentos=3)`."""
+    if func is None:
+        return lambda f: FuncionTarea(f, max_intentos)
+    return FuncionTarea(func, max_intentos)
+
+
+def resolver(nombre):
+    try:
+        funcion = import_string(nombre)
+    except ImportError as e:
+        raise TareaDesconocida(nombre) from e
+    # Solo se ejecuta lo registrado con @tarea, no cualquier callable importable
+    if not isinstance(funcion, FuncionTarea):
+        raise TareaDesconocida(nombre)
+    return funcion
+
+
+def id_worker():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def backoff(intento):
+    base = getattr(settings, "TAREAS_BACKOFF_BASE_SEG", 10)
+    tope = getattr(settings, "TAREAS_BACKOFF_MAX_SEG", 3600)
+    segundos = min(tope, base * 2 ** (intento - 1))
+    return timedelta(seconds=segundos * random.uniform(0.9, 1.1))
+
+
+def _pendientes(ahora):
+    return Tarea.objects.filter(estado="PENDIENTE", ejecutar_desde__lte=ahora).order_by("ejecutar_desde")
+
+
+def tomar(worker, cantidad=1):
+    """Marca hasta `cantidad` tareas vencidas como EN_CURSO para `worker` y las devuelve."""
+    ahora = timezone.now()
+    cambios = dict(estado="EN_CURSO", tomada_en=ahora, tomada_por=worker, intentos=F("intentos") + 1)
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            ids = list(_pendientes(ahora).select_for_update(skip_locked=True).values_list("pk", flat=True)[:cantidad])
+            if ids:
+                Tarea.objects.filter(pk__in=ids).update(**cambios)
+    else:
+        ids = []
+        for pk in _pendientes(ahora).values_list("pk", flat=True)[:cantidad * 2]:
+            if Tarea.objects.filter(pk=pk, estado="PENDIENTE").update(**cambios):
+                ids.append(pk)
+                if len(ids) == cantidad:
+                    break
+    return list(Tarea.objects.filter(pk__in=ids).order_by("ejecutar_desde")) if ids else []
+
+
+def ejecutar(t):
+    """Ejecuta una tarea ya tomada y registra el resultado. Devuelve el estado final."""
+    en_curso = Tarea.objects.filter(pk=t.pk, estado="EN_CURSO")
+    try:
+        resolver(t.nombre)(*t.argumentos.get("args", []), **t.argumentos.get("kwargs", {}))
+    except Exception as e:
+        error = traceback.format_exc()[-4000:]
+        if isinstance(e, TareaDesconocida) or t.intentos >= t.max_intentos:
+            en_curso.update(estado="FALLIDA", ultimo_error=error, terminada=timezone.now())
+            logger.error("tarea %s #%s FALLIDA tras %s intento(s)", t.nombre, t.pk, t.intentos)
+            return "FALLIDA"
+        en_curso.update(estado="PENDIENTE", ultimo_error=error,
+                        ejecutar_desde=timezone.now() + backoff(t.intentos))
+        logger.warning("tarea %s #%s falló (intento %s), se reintentará", t.nombre, t.pk, t.intentos)
+        return "PENDIENTE"
+    en_curso.update(estado="HECHA", terminada=timezone.now())
+    return "HECHA"
+
+
+def procesar_pendientes(worker=None, maximo=None):
+    """Toma y ejecuta tareas de a una hasta vaciar la cola (o `maximo`). Devuelve cuántas ejecutó."""
+    worker = worker or id_worker()
+    hechas = 0
+    while maximo is None or hechas < maximo:
+        tomadas = tomar(worker)
+        if not tomadas:
+            break
+        ejecutar(tomadas[0])
+        hechas += 1
+    return hechas
+
+
+def recuperar_abandonadas():
+    """
+    Devuelve a la cola las tareas EN_CURSO de workers muertos. `tomar` ya
+    contó ese intento: si agotó `max_intentos` la tarea queda FALLIDA, así
+    una tarea que tumba al worker no se reintenta para siempre.
+    """
+    ahora = timezone.now()
+    limite = ahora - timedelta(seconds=getattr(settings, "TAREAS_VISIBILIDAD_SEG", 600))
+    abandonadas = Tarea.objects.filter(estado="EN_CURSO", tomada_en__lt=limite)
+    fallidas = abandonadas.filter(intentos__gte=F("max_intentos")).update(
+        estado="FALLIDA", terminada=ahora,
+        ultimo_error="El worker que la ejecutaba no terminó (abandonada en el último intento).",
+    )
+    if fallidas:
+        logger.error("%s tarea(s) abandonada(s) quedaron FALLIDA al agotar sus intentos", fallidas)
+    return fallidas + abandonadas.update(estado="PENDIENTE", tomada_por="", ejecutar_desde=ahora)
+
+
+def purgar_hechas(dias=7):
+    return Tarea.objects.filter(estado="HECHA", terminada__lt=timezone.now() - timedelta(days=dias)).delete()[0]
+
+
+def _procesar_en_hilo():
+    close_old_connections()
+    try:
+        recuperar_abandonadas()
+        return procesar_pendientes()
+    finally:
+        close_old_connections()
+
+
+async def bucle_worker(intervalo):
+    """Worker mínimo dentro del proceso ASGI (TAREAS_WORKER_ASGI), para planes sin procesos aparte."""
+    while True:
+        try:
+            await sync_to_async(_procesar_en_hilo, thread_sensitive=False)()
+        except Exception:
+            logger.exception("falló el worker de tareas")
+        await asyncio.sleep(intervalo)
@@ -1,3 +1,390 @@
-from django.test import TestCase
+import datetime
+import gzip
+import io
+import json
+import tempfile
+import uuid
+from decimal import Decimal
+from pathlib import Path
 
-# Create your tests here.
+from django.conf import settings
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from authz.models import RolUsuario, Usuario
+from authz.serializers import UsuarioSerializer
+from catalogo.models import Categoria, Servicio
+from catalogo.serializers import ServicioSerializer
+from core import consultas_lentas, esquema, renderers
+from core.parsers import JSONRapidoParser
+from core.models import ClaveIdempotencia, Tarea
+from core.renderers import JSONRapidoRenderer
+from core.tareas import procesar_pendientes, recuperar_abandonadas, tarea, tomar
+from core.throttling import BaseDatosStore, obtener_store
+from packages.admin_config.models import Parametro
+from packages.admin_config.use_cases import configuracion
+from packages.common.pruebas import cliente_admin, cliente_de, crear_servicio, crear_usuario
+from reservas.models import Reserva, ReservaServicio, ReservaVisitante, Visitante
+from reservas.serializers import ReservaSerializer
+
+
+class GenerarDatosTests(TestCase):
+    def _generar(self):
+        call_command("generar_datos", usuarios=7, categorias=2, servicios=5, cupones=3, reservas=11,
+                     visitantes=6, lote=4, semilla=1, sin_copy=True, stdout=io.StringIO())
+
+    def test_lotes_pequenos_con_fks_consistentes(self):
+        Usuario.objects.create(nombre="Previo", email="previo@example.com", password_hash="x")
+        self._generar()
+        self._generar()  # la segunda pasada sigue los ids de la primera
+        generados = Usuario.objects.filter(email__endswith="@datos.test")
+        self.assertEqual((generados.count(), Categoria.objects.count(), Servicio.objects.count(),
+                          Reserva.objects.count(), Visitante.objects.count()), (14, 4, 10, 22, 12))
+        self.assertEqual(RolUsuario.objects.filter(usuario__in=generados, rol__nombre="CLIENTE").count(), 14)
+
+        connection.check_constraints()  # FKs de todo lo insertado con bulk_create
+        self.assertFalse(Reserva.objects.filter(detalles__isnull=True).exists())
+        titulares = ReservaVisitante.objects.filter(es_titular=True).values("reserva").annotate(n=Count("id"))
+        self.assertEqual(sorted(t["n"] for t in titulares), [1] * 22)
+        self.assertFalse(Reserva.objects.exclude(usuario__email__endswith="@datos.test").exists())
+
+
+class ListaRapidaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.servicio = crear_servicio(duracion_min=90, costo=Decimal("150.5"), descripcion=None)
+        u = crear_usuario("ana@example.com", "ADMIN", "CLIENTE", nombre="Ana")
+        Usuario.objects.create(nombre="Sin roles", email="b@example.com", password_hash="x")
+        r = Reserva.objects.create(usuario=u, fecha_inicio=timezone.now(), total=Decimal("301"))
+        ReservaServicio.objects.create(reserva=r, servicio=cls.servicio, cantidad=2, precio_unitario=Decimal("150.5"))
+        Reserva.objects.create(usuario=u, fecha_inicio=timezone.now(), total=Decimal("0.1"))
+
+    def assertMismoJSON(self, serializer_class, qs):
+        render = JSONRenderer().render
+        self.assertEqual(
+            render(serializer_class.lista_rapida(qs)),
+            render(serializer_class(qs, many=True).data),
+        )
+
+    def test_salida_identica(self):
+        self.assertMismoJSON(ServicioSerializer, Servicio.objects.order_by("pk"))
+        self.assertMismoJSON(ReservaSerializer, Reserva.objects.order_by("pk"))
+        self.assertMismoJSON(UsuarioSerializer, Usuario.objects.order_by("pk"))
+
+    def test_endpoint_servicios(self):
+        client = APIClient()
+        normal = client.get("/api/servicios/").content
+        with override_settings(LISTA_RAPIDA=True):
+            rapido = client.get("/api/servicios/").content
+        self.assertEqual(rapido, normal)
+
+
+class JSONRapidoTests(TestCase):
+    def test_render_identico(self):
+        ahora = timezone.localtime(timezone.now())
+        data = {
+            "costo": Decimal("10.50"), "total": Decimal("0.1"), "id": uuid.uuid4(),
+            "fecha": ahora, "utc": ahora.astimezone(datetime.timezone.utc), "dia": ahora.date(),
+            "hora": datetime.time(10, 30, 15, 123456), "texto": "ñandú \u2028 fin",
+            "lista": [1, 2.5, None, True], "grande": 2 ** 70,
+        }
+        self.assertEqual(JSONRapidoRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(JSONRapidoRenderer().render(None), b"")
+
+    def test_floats_con_exponente_mismo_valor(self):
+        data = {"valores": [1e16, 1.5e16, 1e-7, 1e-5, 1e300, 5e-324, 0.0001, 2.5]}
+        rapido, estandar = JSONRapidoRenderer().render(data), JSONRenderer().render(data)
+        self.assertEqual(json.loads(rapido), json.loads(estandar))
+        if renderers.orjson is not None:  # documentado en core.renderers: cambia solo la notación
+            self.assertIn(b"1e16", rapido)
+            self.assertIn(b"1e+16", estandar)
+
+    def test_parse_identico(self):
+        for cuerpo in [b'{"a": [1, 2.5, "\u00f1"], "b": null}', b'{"n": 123456789012345678901234567890}']:
+            self.assertEqual(JSONRapidoParser().parse(io.BytesIO(cuerpo)), JSONParser().parse(io.BytesIO(cuerpo)))
+        with self.assertRaises(ParseError):
+            JSONRapidoParser().parse(io.BytesIO(b"{malo"))
+
+
+class IdempotenciaTests(TestCase):
+    datos = {"nombre": "Ana", "email": "ana@example.com", "password": "Secreta123", "password_confirm": "Secreta123"}
+
+    def setUp(self):
+        obtener_store().reiniciar()
+
+    def test_registro_repetido_devuelve_respuesta_guardada(self):
+        client = APIClient()
+        r1 = client.post("/api/auth/register/", self.datos, format="json", HTTP_IDEMPOTENCY_KEY="k1")
+        r2 = client.post("/api/auth/register/", self.datos, format="json", HTTP_IDEMPOTENCY_KEY="k1")
+        self.assertEqual((r1.status_code, r2.status_code), (201, 201))
+        self.assertEqual(r2["Idempotent-Replayed"], "true")
+        self.assertEqual(Usuario.objects.count(), 1)
+        # Los tokens JWT no se guardan ni se repiten
+        self.assertIn("access", r1.json())
+        self.assertEqual(r2.json(), {"usuario_id": r1.json()["usuario_id"]})
+        self.assertNotIn("access", str(ClaveIdempotencia.objects.get().respuesta))
+
+        otro = {**self.datos, "email": "otra@example.com"}
+        r3 = client.post("/api/auth/register/", otro, format="json", HTTP_IDEMPOTENCY_KEY="k1")
+        self.assertEqual(r3.status_code, 422)
+
+    def test_anonimos_con_la_misma_clave_no_se_mezclan(self):
+        client = APIClient()
+        client.post("/api/auth/register/", self.datos, format="json", HTTP_IDEMPOTENCY_KEY="k1",
+                    REMOTE_ADDR="10.0.0.1")
+        otro = {**self.datos, "email": "otra@example.com"}
+        r = client.post("/api/auth/register/", otro, format="json", HTTP_IDEMPOTENCY_KEY="k1",
+                        REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(r.status_code, 201)
+        self.assertNotIn("Idempotent-Replayed", r)
+        self.assertEqual(Usuario.objects.count(), 2)
+
+    def test_crear_reserva_repetida_no_duplica(self):
+        servicio = crear_servicio()
+        cliente = crear_usuario("ana@example.com")
+        client = cliente_de("ana@example.com")
+        datos = {"usuario": cliente.pk, "fecha_inicio": timezone.now().isoformat(), "total": "200.00",
+                 "detalles": [{"servicio": servicio.pk, "cantidad": 2, "precio_unitario": "100.00"}]}
+        r1 = client.post("/api/reservas/", datos, format="json", HTTP_IDEMPOTENCY_KEY="r1")
+        r2 = client.post("/api/reservas/", datos, format="json", HTTP_IDEMPOTENCY_KEY="r1")
+        self.assertEqual((r1.status_code, r2.status_code), (201, 201), r1.content)
+        self.assertEqual(r1.json(), r2.json())
+        self.assertEqual(r2["Idempotent-Replayed"], "true")
+        self.assertEqual((Reserva.objects.count(), ReservaServicio.objects.count()), (1, 1))
+
+    def test_sin_clave_ejecuta_siempre(self):
+        client = APIClient()
+        client.post("/api/auth/register/", self.datos, format="json")
+        r = client.post("/api/auth/register/", self.datos, format="json")
+        self.assertEqual(r.status_code, 400)
+
+
+class LimitesTests(TestCase):
+    def setUp(self):
+        obtener_store().reiniciar()
+
+    def test_login_por_email_devuelve_retry_after(self):
+        client = APIClient()
+        for _ in range(5):
+            r = client.post("/api/auth/login/", {"email": "x@example.com", "password": "mala"}, format="json")
+            self.assertEqual(r.status_code, 401)
+        r = client.post("/api/auth/login/", {"email": "X@example.com ", "password": "mala"}, format="json")
+        self.assertEqual(r.status_code, 429)
+        self.assertGreaterEqual(int(r["Retry-After"]), 1)
+        # Otro email desde la misma IP sigue permitido
+        r = client.post("/api/auth/login/", {"email": "y@example.com", "password": "mala"}, format="json")
+        self.assertEqual(r.status_code, 401)
+
+    def test_x_forwarded_for_falso_no_reinicia_el_contador(self):
+        configuracion.reiniciar()
+        self.addCleanup(configuracion.reiniciar)
+        Parametro.objects.create(clave="LIMITE_LOGIN_IP", tipo="TEXTO", valor="2/min")
+        client = APIClient()
+
+        def login(n, xff):
+            return client.post("/api/auth/login/", {"email": f"u{n}@example.com", "password": "mala"},
+                               format="json", HTTP_X_FORWARDED_FOR=xff, REMOTE_ADDR="10.0.0.1")
+
+        self.assertEqual([login(n, f"1.1.1.{n}").status_code for n in range(3)], [401, 401, 429])
+
+        # Detrás de un proxy cuenta la IP que agregó el proxy (la última), no lo que inventa el cliente
+        obtener_store().reiniciar()
+        rf = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+        with override_settings(REST_FRAMEWORK=rf):
+            self.assertEqual([login(n, f"{n}.9.9.9, 2.2.2.2").status_code for n in range(3)], [401, 401, 429])
+            self.assertEqual(login(3, "3.3.3.3").status_code, 401)
+
+    def test_store_bd_upsert(self):
+        store = BaseDatosStore()
+        self.assertEqual(store.registrar("k", 60, 60), (1, 0))
+        self.assertEqual(store.registrar("k", 60, 60), (2, 0))
+        self.assertEqual(store.registrar("k", 120, 60), (1, 2))
+
+
+class EsquemaCacheadoTests(TestCase):
+    def setUp(self):
+        esquema.invalidar()
+
+    def test_etag_gzip_y_formato(self):
+        client = APIClient()
+        r = client.get("/api/schema/")
+        self.assertEqual(r.status_code, 200)
+        self.assertIn(b"openapi:", r.content)
+        self.assertEqual(client.get("/api/schema/", HTTP_IF_NONE_MATCH=r["ETag"]).status_code, 304)
+
+        r = client.get("/api/schema/?format=json", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(r["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(r.content))["info"]["title"], "Turismo API")
+
+    def test_respeta_q_de_accept_encoding(self):
+        client = APIClient()
+        r = client.get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip;q=0")
+        self.assertFalse(r.has_header("Content-Encoding"))
+        self.assertIn(b"openapi:", r.content)
+        r = client.get("/api/schema/", HTTP_ACCEPT_ENCODING="br;q=0, gzip;q=0.5")
+        self.assertEqual(r["Content-Encoding"], "gzip")
+        r = client.get("/api/schema/", HTTP_ACCEPT_ENCODING="*;q=0")
+        self.assertFalse(r.has_header("Content-Encoding"))
+        q = esquema.calidades("GZIP; q=0.8, *;q=0.1, br;q=0")
+        self.assertEqual((q("gzip"), q("br"), q("deflate")), (0.8, 0, 0.1))
+
+    def test_etag_distinto_por_codificacion(self):
+        client = APIClient()
+        plano = client.get("/api/schema/")["ETag"]
+        comprimido = client.get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+        self.assertEqual(comprimido, plano[:-1] + '-gzip"')
+        # El ETag de una codificación no valida la otra
+        r = client.get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=plano)
+        self.assertEqual((r.status_code, r["Content-Encoding"]), (200, "gzip"))
+        self.assertEqual(client.get("/api/schema/", HTTP_IF_NONE_MATCH=comprimido).status_code, 200)
+        # Lista de ETags y forma débil (proxies que recomprimen)
+        r = client.get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=f'{plano}, W/{comprimido}')
+        self.assertEqual((r.status_code, r["ETag"]), (304, comprimido))
+
+    def test_build_en_disco_por_version(self):
+        with tempfile.TemporaryDirectory() as d, override_settings(ESQUEMA_DIR=d, VERSION_CODIGO="abc123"):
+            esquema.guardar_en_disco()
+            ruta = Path(d) / "openapi-abc123.json"
+            ruta.write_bytes(b'{"desde": "disco"}')
+            self.assertEqual(esquema.obtener("json").cuerpo, b'{"desde": "disco"}')
+            with override_settings(VERSION_CODIGO="otra"):
+                self.assertIn(b'"openapi"', esquema.obtener("json").cuerpo)
+
+
+@override_settings(TRAZAS_ACTIVAS=True)
+class TrazasTests(TestCase):
+    def setUp(self):
+        obtener_store().reiniciar()
+        Usuario.objects.create(nombre="Ana", email="ana@example.com", password_hash="x")
+
+    def _login(self, **extra):
+        return APIClient().post("/api/auth/login/", {"email": "ana@example.com", "password": "mala"}, format="json", **extra)
+
+    @override_settings(TRAZAS_MUESTREO=1.0)
+    def test_traza_muestreada_con_request_id(self):
+        with self.assertLogs("trazas", "INFO") as logs:
+            r = self._login(HTTP_X_REQUEST_ID="abc-123")
+        self.assertEqual(r["X-Request-ID"], "abc-123")
+        traza = json.loads(logs.records[0].getMessage())
+        self.assertEqual((traza["request_id"], traza["estado"], traza["muestreada"]), ("abc-123", 401, True))
+        nombres = [t["nombre"] for t in traza["tramos"]]
+        self.assertIn("sql", nombres)
+        self.assertIn("verify_password", nombres)
+
+    @override_settings(TRAZAS_MUESTREO=0.0, TRAZAS_UMBRAL_LENTO_MS=0)
+    def test_peticion_lenta_siempre_se_loguea(self):
+        with self.assertLogs("trazas", "INFO") as logs:
+            r = self._login(HTTP_X_REQUEST_ID="no valido\n")
+        traza = json.loads(logs.records[0].getMessage())
+        self.assertTrue(traza["lento"])
+        self.assertEqual(r["X-Request-ID"], traza["request_id"])
+        self.assertNotEqual(traza["request_id"], "no valido\n")
+
+    @override_settings(TRAZAS_MUESTREO=0.0, TRAZAS_UMBRAL_LENTO_MS=60_000)
+    def test_fuera_de_muestreo_no_loguea(self):
+        with self.assertNoLogs("trazas", "INFO"):
+            self._login()
+
+    @override_settings(TRAZAS_ACTIVAS=False, TRAZAS_MUESTREO=1.0)
+    def test_apagadas_no_tocan_la_peticion(self):
+        with self.assertNoLogs("trazas", "INFO"):
+            r = self._login(HTTP_X_REQUEST_ID="abc-123")
+        self.assertNotIn("X-Request-ID", r)
+
+
+@tarea(max_intentos=2)
+def tarea_que_falla(motivo):
+    raise RuntimeError(motivo)
+
+
+class TareasTests(TestCase):
+    def test_recuperacion_password_se_envia_desde_la_cola(self):
+        Usuario.objects.create(nombre="Ana", email="ana@example.com", password_hash="x")
+        obtener_store().reiniciar()
+        r = APIClient().post("/api/auth/solicitar-recuperacion-password/", {"email": "ana@example.com"}, format="json")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(Tarea.objects.get().estado, "PENDIENTE")
+
+        self.assertEqual(procesar_pendientes(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("reset-password/?token=", mail.outbox[0].body)
+        self.assertEqual(Tarea.objects.get().estado, "HECHA")
+
+    def test_reintento_con_backoff_y_luego_fallida(self):
+        t = tarea_que_falla.encolar("sin conexión")
+        procesar_pendientes()
+        t.refresh_from_db()
+        self.assertEqual((t.estado, t.intentos), ("PENDIENTE", 1))
+        self.assertGreater(t.ejecutar_desde, timezone.now())
+        self.assertIn("sin conexión", t.ultimo_error)
+        # Todavía no venció el backoff
+        self.assertEqual(procesar_pendientes(), 0)
+
+        Tarea.objects.filter(pk=t.pk).update(ejecutar_desde=timezone.now())
+        procesar_pendientes()
+        t.refresh_from_db()
+        self.assertEqual((t.estado, t.intentos), ("FALLIDA", 2))
+
+    def test_tarea_abandonada_vuelve_a_la_cola(self):
+        t = tarea_que_falla.encolar("x")
+        Tarea.objects.filter(pk=t.pk).update(estado="EN_CURSO", tomada_en=timezone.now() - datetime.timedelta(hours=1))
+        self.assertEqual(recuperar_abandonadas(), 1)
+        self.assertEqual(Tarea.objects.get(pk=t.pk).estado, "PENDIENTE")
+
+    def test_abandonada_en_su_ultimo_intento_queda_fallida(self):
+        t = tarea_que_falla.encolar("x")
+        hace_una_hora = timezone.now() - datetime.timedelta(hours=1)
+        # Cada toma cuenta el intento aunque el worker muera antes de registrar el resultado
+        for intento in range(1, t.max_intentos + 1):
+            tomar("muerto")
+            Tarea.objects.filter(pk=t.pk).update(tomada_en=hace_una_hora)
+            self.assertEqual(recuperar_abandonadas(), 1)
+            t.refresh_from_db()
+            self.assertEqual(t.intentos, intento)
+        self.assertEqual(t.estado, "FALLIDA")
+        self.assertIn("abandonada", t.ultimo_error)
+        self.assertEqual(procesar_pendientes(), 0)
+
+
+class ConsultasLentasTests(TestCase):
+    def setUp(self):
+        consultas_lentas.vaciar()
+        self.addCleanup(consultas_lentas.vaciar)
+        crear_servicio()
+        self.client = cliente_admin()
+
+    def test_captura_vista_params_redactados_y_plan(self):
+        with override_settings(CONSULTAS_LENTAS_MS=0):
+            self.client.get("/api/servicios/", {"search": "secreto"})
+            Servicio.objects.filter(titulo="Salar").count()  # fuera de una petición
+        servicios = [e for e in consultas_lentas.entradas() if '"catalogo_servicio"' in e["sql"]]
+        self.assertEqual([e["vista"] for e in servicios], ["GET servicio-list", None])
+        self.assertIn("<str:9>", servicios[0]["params"])  # "%secreto%"
+        self.assertNotIn("secreto", json.dumps(servicios[0]["params"]))
+        self.assertTrue(servicios[0]["plan"] and "detalle" in servicios[0]["plan"][0])
+
+        r = self.client.get("/api/diagnostico/consultas-lentas/", {"limite": 50})
+        self.assertEqual(r.status_code, 200)
+        totales = [h["total_ms"] for h in r.data["huellas"]]
+        self.assertEqual(totales, sorted(totales, reverse=True))
+        h = next(h for h in r.data["huellas"] if "GET servicio-list" in h["vistas"] and "LIKE" in h["forma"])
+        self.assertEqual(h["veces"], 1)
+        self.assertNotIn("secreto", h["forma"])
+
+        self.assertEqual(self.client.delete("/api/diagnostico/consultas-lentas/").status_code, 204)
+        self.assertEqual(consultas_lentas.entradas(), [])
+
+    def test_bajo_el_umbral_no_registra_y_solo_admin(self):
+        with override_settings(CONSULTAS_LENTAS_MS=60_000):
+            self.client.get("/api/servicios/")
+        self.assertEqual(consultas_lentas.entradas(), [])
+        self.assertEqual(cliente_de("cli@example.com").get("/api/diagnostico/consultas-lentas/").status_code, 403)
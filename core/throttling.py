@@ -0,0 +1,192 @@
+"""
+Rate limiting con contador de ventana deslizante, por IP y por email.
+
+Se guardan dos ventanas fijas (actual y anterior) por clave y se estima
+    peticiones = anterior * (1 - transcurrido / ventana) + actual
+lo que evita tanto el costo de guardar cada timestamp como las ráfagas en el
+borde de una ventana fija. El almacén es intercambiable (settings.LIMITES_STORE):
+- "memoria": dict por proceso, sin E/S (por defecto)
+- "bd": tabla ContadorLimite con upsert atómico, compartida entre workers
+
+Las políticas se declaran por ruta en REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]
+con claves "<alcance>_ip" / "<alcance>_email" (formato DRF: "5/min"); un
+Parametro LIMITE_<ALCANCE>_<IP|EMAIL> (packages.admin_config) las reemplaza
+en caliente.
+"""
+import logging
+import math
+import random
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from packages.admin_config.use_cases import configuracion
+from .models import ContadorLimite
+
+logger = logging.getLogger(__name__)
+
+PERIODOS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parsear_tasa(tasa):
+    if not tasa:
+        return None, None
+    num, periodo = tasa.split("/")
+    return int(num), PERIODOS[periodo[0]]
+
+
+class MemoriaStore:
+    """Contadores en memoria del proceso: clave -> [inicio_ventana, actual, anterior]."""
+    max_claves = 100_000
+
+    def __init__(self):
+        self._datos = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, clave, inicio, duracion):
+        with self._lock:
+            fila = self._datos.get(clave)
+            if fila is None or fila[0] < inicio - duracion:
+                fila = [inicio, 0, 0]
+            elif fila[0] < inicio:
+                fila = [inicio, 0, fila[1]]
+            fila[1] += 1
+            self._datos[clave] = fila
+            if len(self._datos) > self.max_claves:
+                self._purgar(inicio - duracion)
+            return fila[1], fila[2]
+
+    def _purgar(self, limite):
+        for clave in [c for c, f in self._datos.items() if f[0] < limite]:
+            del self._datos[clave]
+
+    def reiniciar(self):
+        with self._lock:
+            self._datos.clear()
+
+
+class BaseDatosStore:
+    """Contadores en la tabla ContadorLimite; un INSERT ... ON CONFLICT por petición."""
+    prob_purga = 0.001
+
+    def registrar(self, clave, inicio, duracion):
+        expira = datetime.fromtimestamp(inicio + 2 * duracion, tz=dt_timezone.utc)
+        actual = self._incrementar(clave, inicio, expira)
+        anterior = (ContadorLimite.objects.filter(clave=clave, ventana=inicio - duracion)
+                    .values_list("cuenta", flat=True).first() or 0)
+        if random.random() < self.prob_purga:
+            ContadorLimite.objects.filter(expira__lt=timezone.now()).delete()
+        return actual, anterior
+
+    def _incrementar(self, clave, inicio, expira):
+        if connection.vendor in ("postgresql", "sqlite"):
+            tabla = connection.ops.quote_name(ContadorLimite._meta.db_table)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {tabla} (clave, ventana, cuenta, expira) VALUES (%s, %s, 1, %s) "
+                    f"ON CONFLICT (clave, ventana) DO UPDATE SET cuenta = {tabla}.cuenta + 1 RETURNING cuenta",
+                    [clave, inicio, connection.ops.adapt_datetimefield_value(expira)],
+                )
+                return cursor.fetchone()[0]
+        qs = ContadorLimite.objects.filter(clave=clave, ventana=inicio)
+        if not qs.update(cuenta=F("cuenta") + 1):
+            try:
+                with transaction.atomic():
+                    ContadorLimite.objects.create(clave=clave, ventana=inicio, cuenta=1, expira=expira)
+                    return 1
+            except IntegrityError:
+                qs.update(cuenta=F("cuenta") + 1)
+        return qs.values_list("cuenta", flat=True).first()
+
+    def reiniciar(self):
+        ContadorLimite.objects.all().delete()
+
+
+STORES = {"memoria": MemoriaStore, "bd": BaseDatosStore}
+_store = None
+
+
+def obtener_store():
+    global _store
+    if _store is None:
+        nombre = getattr(settings, "LIMITES_STORE", "memoria")
+        _store = (STORES[nombre] if nombre in STORES else import_string(nombre))()
+    return _store
+
+
+class VentanaDeslizanteThrottle(BaseThrottle):
+    """Base: subclases definen `sufijo` y, si no cuentan por IP, `identificar(request)`; `alcance` lo fija la ruta."""
+    alcance = None
+    sufijo = None
+
+    def identificar(self, request):
+        # IP del cliente; X-Forwarded-For solo cuenta según REST_FRAMEWORK["NUM_PROXIES"]
+        return self.get_ident(request)
+
+    def tasa(self):
+        """Tasa de settings, o la del Parametro LIMITE_<ALCANCE>_<SUFIJO> si existe y es válida."""
+        defecto = api_settings.DEFAULT_THROTTLE_RATES.get(f"{self.alcance}_{self.sufijo}")
+        tasa = configuracion.texto(f"LIMITE_{self.alcance}_{self.sufijo}".upper(), defecto)
+        try:
+            return parsear_tasa(tasa)
+        except (ValueError, KeyError, IndexError):
+            logger.warning("tasa inválida %r para %s_%s; se usa %r", tasa, self.alcance, self.sufijo, defecto)
+            return parsear_tasa(defecto)
+
+    def allow_request(self, request, view):
+        if not getattr(settings, "LIMITES_ACTIVOS", True):
+            return True
+        limite, duracion = self.tasa()
+        if limite is None:
+            return True
+        ident = self.identificar(request)
+        if not ident:
+            return True
+        ahora = time.time()
+        inicio = int(ahora // duracion * duracion)
+        actual, anterior = obtener_store().registrar(f"{self.alcance}:{self.sufijo}:{ident}", inicio, duracion)
+        transcurrido = ahora - inicio
+        estimado = anterior * (1 - transcurrido / duracion) + actual
+        if estimado <= limite:
+            return True
+        self._espera = self._calcular_espera(limite, duracion, transcurrido, actual, anterior)
+        return False
+
+    @staticmethod
+    def _calcular_espera(limite, duracion, transcurrido, actual, anterior):
+        if actual >= limite:
+            # Hay que esperar a que la ventana actual pase a ser "anterior" y decaiga lo suficiente
+            return (duracion - transcurrido) + duracion * (1 - limite / actual)
+        # Solo hace falta que el peso de la ventana anterior baje
+        return max((anterior + actual - limite) / anterior * duracion - transcurrido, 0)
+
+    def wait(self):
+        return max(1, math.ceil(getattr(self, "_espera", 1)))
+
+
+class PorIPThrottle(VentanaDeslizanteThrottle):
+    sufijo = "ip"
+
+
+class PorEmailThrottle(VentanaDeslizanteThrottle):
+    sufijo = "email"
+
+    def identificar(self, request):
+        email = request.data.get("email") if hasattr(request.data, "get") else None
+        return email.strip().lower()[:191] if isinstance(email, str) else None
+
+
+def limites(alcance):
+    """Throttles por IP y por email para una ruta: @throttle_classes(limites("login"))."""
+    return [
+        type(f"{cls.__name__}_{alcance}", (cls,), {"alcance": alcance})
+        for cls in (PorIPThrottle, PorEmailThrottle)
+    ]
@@ -0,0 +1,172 @@
+"""
+Trazas livianas por petición para saber en qué se va el tiempo.
+
+`TrazasMiddleware` abre una traza por petición (id en el header
+X-Request-ID, reutilizado si el cliente lo manda) y `span(nombre)` cuelga
+tramos hijos del tramo actual vía contextvars, así que funciona igual en
+WSGI, en los hilos de sync_to_async y en código async. Fuera de una
+petición trazada `span` no hace nada.
+
+Se registra siempre el árbol completo (es barato: una lista por tramo),
+pero solo se emite al logger "trazas", como una línea JSON, si la petición
+salió en el muestreo (TRAZAS_MUESTREO) o tardó más que
+TRAZAS_UMBRAL_LENTO_MS. Todo esto solo con TRAZAS_ACTIVAS (apagado por
+defecto); sin él el middleware deja pasar la petición tal cual.
+"""
+import contextvars
+import json
+import logging
+import random
+import re
+import time
+import uuid
+from contextlib import ContextDecorator
+
+from django.conf import settings
+from django.db import connection
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+logger = logging.getLogger("trazas")
+
+HEADER = "X-Request-ID"
+MAX_TRAMOS = 2000
+_ID_VALIDO = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+_tramo_actual = contextvars.ContextVar("tramo_actual", default=None)
+
+
+class Tramo:
+    __slots__ = ("nombre", "atributos", "inicio", "fin", "hijos", "traza")
+
+    def __init__(self, nombre, atributos, traza):
+        self.nombre = nombre
+        self.atributos = atributos
+        self.traza = traza
+        self.hijos = []
+        self.inicio = time.perf_counter()
+        self.fin = None
+
+    def como_dict(self, origen):
+        d = {
+            "nombre": self.nombre,
+            "inicio_ms": round((self.inicio - origen) * 1000, 3),
+            "ms": round(((self.fin or time.perf_counter()) - self.inicio) * 1000, 3),
+        }
+        if self.atributos:
+            d.update(self.atributos)
+        if self.hijos:
+            d["hijos"] = [h.como_dict(origen) for h in self.hijos]
+        return d
+
+
+class Traza:
+    def __init__(self, request_id):
+        self.request_id = request_id
+        self.tramos = 0
+        self.descartados = 0
+        self.raiz = Tramo("peticion", {}, self)
+
+
+class span(ContextDecorator):
+    """
+    Context manager / decorador: `with span("send_mail"):` o `@span("x")`.
+    Los atributos extra se copian al JSON del tramo.
+    """
+
+    def __init__(self, nombre, **atributos):
+        self.nombre = nombre
+        self.atributos = atributos
+        self._token = None
+
+    def _recreate_cm(self):
+        # Cada llamada a la función decorada necesita su propio token
+        return span(self.nombre, **self.atributos)
+
+    def __enter__(self):
+        padre = _tramo_actual.get()
+        if padre is None:
+            return None
+        traza = padre.traza
+        if traza.tramos >= MAX_TRAMOS:
+            traza.descartados += 1
+            return None
+        traza.tramos += 1
+        tramo = Tramo(self.nombre, self.atributos, traza)
+        padre.hijos.append(tramo)
+        self._token = _tramo_actual.set(tramo)
+        return tramo
+
+    def __exit__(self, *exc):
+        if self._token is not None:
+            _tramo_actual.get().fin = time.perf_counter()
+            _tramo_actual.reset(self._token)
+            self._token = None
+        return False
+
+
+def _tramo_sql(execute, sql, params, many, context):
+    with span("sql", sql=sql[:300], many=many):
+        return execute(sql, params, many, context)
+
+
+def _id_peticion(request):
+    entrante = request.headers.get(HEADER, "")
+    return entrante if _ID_VALIDO.match(entrante) else uuid.uuid4().hex
+
+
+class TrazasMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, "TRAZAS_ACTIVAS", False):
+            return self.get_response(request)
+        traza = Traza(_id_peticion(request))
+        request.request_id = traza.request_id
+        token = _tramo_actual.set(traza.raiz)
+        try:
+            with connection.execute_wrapper(_tramo_sql):
+                response = self.get_response(request)
+        finally:
+            traza.raiz.fin = time.perf_counter()
+            _tramo_actual.reset(token)
+        response[HEADER] = traza.request_id
+        self._emitir(request, response, traza)
+        return response
+
+    def _emitir(self, request, response, traza):
+        duracion_ms = (traza.raiz.fin - traza.raiz.inicio) * 1000
+        lento = duracion_ms >= getattr(settings, "TRAZAS_UMBRAL_LENTO_MS", 1000)
+        muestreada = random.random() < getattr(settings, "TRAZAS_MUESTREO", 0.0)
+        if not (lento or muestreada):
+            return
+        raiz = traza.raiz.como_dict(traza.raiz.inicio)
+        logger.info(json.dumps({
+            "request_id": traza.request_id,
+            "metodo": request.method,
+            "ruta": request.path,
+            "estado": response.status_code,
+            "ms": raiz["ms"],
+            "lento": lento,
+            "muestreada": muestreada,
+            "tramos_descartados": traza.descartados,
+            "tramos": raiz.get("hijos", []),
+        }, ensure_ascii=False, default=str))
+
+
+class JWTAuthenticationTrazada(JWTAuthentication):
+    def authenticate(self, request):
+        with span("jwt_authentication"):
+            return super().authenticate(request)
+
+
+class SerializerTrazadoMixin:
+    """Tramos `<Serializer>.is_valid` y `<Serializer>.save`."""
+
+    def is_valid(self, *args, **kwargs):
+        with span(f"{type(self).__name__}.is_valid"):
+            return super().is_valid(*args, **kwargs)
+
+    def save(self, **kwargs):
+        with span(f"{type(self).__name__}.save"):
+            return super().save(**kwargs)
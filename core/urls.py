@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import consultas_lentas
+
+urlpatterns = [
+    path("consultas-lentas/", consultas_lentas, name="consultas_lentas"),
+]
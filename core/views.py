@@ -1,3 +1,36 @@
-from django.shortcuts import render
+from django.conf import settings
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import permissions, serializers as drf_serializers
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
 
-# Create your views here.
+from authz.roles import EsAdmin
+from . import consultas_lentas as registro
+
+
+class ConsultasLentasParamsSerializer(drf_serializers.Serializer):
+    limite = drf_serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
+@extend_schema(
+    summary="Consultas lentas",
+    description="Huellas de SQL que superaron CONSULTAS_LENTAS_MS, ordenadas por tiempo total, con la "
+                "última muestra (parámetros redactados) y su plan. El registro es por proceso: muestra "
+                "lo visto por el worker que responde. DELETE vacía el registro.",
+    parameters=[OpenApiParameter("limite", int, description="Huellas a devolver (1-100, por defecto 20)")],
+    responses=OpenApiTypes.OBJECT,
+)
+@api_view(["GET", "DELETE"])
+@permission_classes([permissions.IsAuthenticated, EsAdmin])
+def consultas_lentas(request):
+    if request.method == "DELETE":
+        registro.vaciar()
+        return Response(status=204)
+    params = ConsultasLentasParamsSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    return Response({
+        "umbral_ms": getattr(settings, "CONSULTAS_LENTAS_MS", 200),
+        "capturadas": len(registro.entradas()),
+        "huellas": registro.top_huellas(params.validated_data["limite"]),
+    })
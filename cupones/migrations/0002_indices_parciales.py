@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cupones', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cupon',
+            index=models.Index(condition=models.Q(('estado', True)), fields=['codigo'], name='cupon_codigo_activo_idx'),
+        ),
+    ]
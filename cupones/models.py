@@ -1,6 +1,24 @@
 from django.db import models
+from django.utils import timezone
 from core.models import TimeStampedModel
 
+class CuponQuerySet(models.QuerySet):
+    def activos(self):
+        return self.filter(estado=True)
+
+    def vigentes(self, en=None):
+        """Cupones activos cuya ventana de fechas incluye `en` (por defecto, ahora)."""
+        en = en or timezone.now()
+        return self.activos().filter(
+            models.Q(fecha_inicio__isnull=True) | models.Q(fecha_inicio__lte=en),
+            models.Q(fecha_fin__isnull=True) | models.Q(fecha_fin__gte=en),
+        )
+
+class ActivoManager(models.Manager.from_queryset(CuponQuerySet)):
+    """Solo cupones con estado activo."""
+    def get_queryset(self):
+        return super().get_queryset().activos()
+
 class Cupon(TimeStampedModel):
     TIPO = (("PORCENTAJE","PORCENTAJE"),("FIJO","FIJO"))
     codigo = models.CharField(max_length=50, unique=True)
@@ -9,4 +27,10 @@ class Cupon(TimeStampedModel):
     fecha_inicio = models.DateTimeField(blank=True, null=True)
     fecha_fin = models.DateTimeField(blank=True, null=True)
     estado = models.BooleanField(default=True)
+    objects = CuponQuerySet.as_manager()
+    activos = ActivoManager()
+    class Meta:
+        indexes = [
+            models.Index(fields=["codigo"], condition=models.Q(estado=True), name="cupon_codigo_activo_idx"),
+        ]
     def __str__(self): return self.codigo
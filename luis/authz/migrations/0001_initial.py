@@ -1,60 +0,0 @@
-# Generated by Django 5.2.6 on 2025-09-06 23:57
-
-import django.db.models.deletion
-from django.db import migrations, models
-
-
-class Migration(migrations.Migration):
-
-    initial = True
-
-    dependencies = [
-    ]
-
-    operations = [
-        migrations.CreateModel(
-            name='Rol',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('created_at', models.DateTimeField(auto_now_add=True)),
-                ('updated_at', models.DateTimeField(auto_now=True)),
-                ('nombre', models.CharField(max_length=50, unique=True)),
-            ],
-            options={
-                'abstract': False,
-            },
-        ),
-        migrations.CreateModel(
-            name='RolUsuario',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('rol', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='authz.rol')),
-            ],
-        ),
-        migrations.CreateModel(
-            name='Usuario',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('created_at', models.DateTimeField(auto_now_add=True)),
-                ('updated_at', models.DateTimeField(auto_now=True)),
-                ('nombre', models.CharField(max_length=100)),
-                ('email', models.EmailField(max_length=191, unique=True)),
-                ('password_hash', models.CharField(max_length=255)),
-                ('telefono', models.CharField(blank=True, max_length=25, null=True)),
-                ('estado', models.CharField(choices=[('ACTIVO', 'ACTIVO'), ('INACTIVO', 'INACTIVO'), ('BLOQUEADO', 'BLOQUEADO')], default='ACTIVO', max_length=10)),
-                ('roles', models.ManyToManyField(related_name='usuarios', through='authz.RolUsuario', to='authz.rol')),
-            ],
-            options={
-                'abstract': False,
-            },
-        ),
-        migrations.AddField(
-            model_name='rolusuario',
-            name='usuario',
-            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='authz.usuario'),
-        ),
-        migrations.AlterUniqueTogether(
-            name='rolusuario',
-            unique_together={('rol', 'usuario')},
-        ),
-    ]
@@ -1,28 +0,0 @@
-from rest_framework import viewsets, permissions, filters
-from .models import Categoria, Servicio
-from .serializers import CategoriaSerializer, ServicioSerializer
-
-class CategoriaViewSet(viewsets.ModelViewSet):
-    queryset = Categoria.objects.all()
-    serializer_class = CategoriaSerializer
-    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-
-class ServicioViewSet(viewsets.ModelViewSet):
-    queryset = Servicio.objects.all()
-    serializer_class = ServicioSerializer
-    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ["titulo", "descripcion", "tipo"]
-    ordering_fields = ["costo", "created_at"]
-
-    def get_queryset(self):
-        qs = super().get_queryset()
-        if self.request.method == "GET":
-            qs = qs.filter(visible_publico=True)
-        categoria = self.request.query_params.get("categoria")
-        if categoria:
-            qs = qs.filter(categoria_id=categoria)
-        tipo = self.request.query_params.get("tipo")
-        if tipo:
-            qs = qs.filter(tipo=tipo)
-        return qs
@@ -1,31 +0,0 @@
-# Generated by Django 5.2.6 on 2025-09-06 23:57
-
-from django.db import migrations, models
-
-
-class Migration(migrations.Migration):
-
-    initial = True
-
-    dependencies = [
-    ]
-
-    operations = [
-        migrations.CreateModel(
-            name='Cupon',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('created_at', models.DateTimeField(auto_now_add=True)),
-                ('updated_at', models.DateTimeField(auto_now=True)),
-                ('codigo', models.CharField(max_length=50, unique=True)),
-                ('tipo', models.CharField(choices=[('PORCENTAJE', 'PORCENTAJE'), ('FIJO', 'FIJO')], max_length=12)),
-                ('valor', models.DecimalField(decimal_places=2, max_digits=10)),
-                ('fecha_inicio', models.DateTimeField(blank=True, null=True)),
-                ('fecha_fin', models.DateTimeField(blank=True, null=True)),
-                ('estado', models.BooleanField(default=True)),
-            ],
-            options={
-                'abstract': False,
-            },
-        ),
-    ]
@@ -0,0 +1,35 @@
+from decimal import Decimal, InvalidOperation
+
+from rest_framework import serializers
+from ..models import Parametro
+
+TIPOS_PYTHON = {"ENTERO": (int,), "BOOLEANO": (bool,), "TEXTO": (str,)}
+
+
+class ParametroSerializer(serializers.ModelSerializer):
+    valor = serializers.JSONField()
+
+    class Meta:
+        model = Parametro
+        fields = ["clave", "tipo", "valor", "descripcion", "updated_at"]
+        read_only_fields = ["updated_at"]
+
+    def validate_clave(self, valor):
+        if not valor.replace("_", "").isalnum() or valor.upper() != valor:
+            raise serializers.ValidationError("Usa MAYÚSCULAS_CON_GUIONES_BAJOS (como la variable de entorno).")
+        return valor
+
+    def validate(self, attrs):
+        tipo = attrs.get("tipo", getattr(self.instance, "tipo", None))
+        valor = attrs.get("valor", getattr(self.instance, "valor", None))
+        if tipo == "DECIMAL":
+            try:
+                if isinstance(valor, bool) or not Decimal(str(valor)).is_finite():
+                    raise InvalidOperation
+            except InvalidOperation:
+                raise serializers.ValidationError({"valor": "Debe ser un número."})
+        elif tipo in TIPOS_PYTHON:
+            esperado = TIPOS_PYTHON[tipo]
+            if (isinstance(valor, bool) and bool not in esperado) or not isinstance(valor, esperado):
+                raise serializers.ValidationError({"valor": f"Debe ser de tipo {tipo}."})
+        return attrs
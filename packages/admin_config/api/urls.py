@@ -0,0 +1,10 @@
+from rest_framework.routers import DefaultRouter
+from django.urls import path, include
+from .viewsets import ParametroViewSet
+
+router = DefaultRouter()
+router.register(r"parametros", ParametroViewSet, basename="parametro")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
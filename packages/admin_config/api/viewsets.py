@@ -0,0 +1,16 @@
+from rest_framework import permissions, viewsets
+from authz.roles import EsAdmin
+from ..models import Parametro
+from .serializers import ParametroSerializer
+
+
+class ParametroViewSet(viewsets.ModelViewSet):
+    """
+    Endpoints en /api/config/parametros/ (solo ADMIN):
+    - GET/POST          /parametros/          -> listar / crear
+    - GET/PUT/PATCH/DEL /parametros/{clave}/  -> el cambio llega a todos los workers en CONFIG_REFRESCO_SEG
+    """
+    queryset = Parametro.objects.order_by("clave")
+    serializer_class = ParametroSerializer
+    permission_classes = [permissions.IsAuthenticated, EsAdmin]
+    lookup_field = "clave"
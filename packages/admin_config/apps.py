@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class AdminConfigConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'packages.admin_config'
+    label = 'admin_config'
+
+    def ready(self):
+        from .use_cases import configuracion  # noqa: F401  (registra las señales que suben la versión)
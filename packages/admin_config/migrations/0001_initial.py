@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:11
+
+from django.db import migrations, models
+
+
+def crear_version(apps, schema_editor):
+    VersionConfig = apps.get_model("admin_config", "VersionConfig")
+    VersionConfig.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Parametro',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('clave', models.CharField(max_length=100, unique=True)),
+                ('tipo', models.CharField(choices=[('ENTERO', 'ENTERO'), ('DECIMAL', 'DECIMAL'), ('BOOLEANO', 'BOOLEANO'), ('TEXTO', 'TEXTO'), ('JSON', 'JSON')], max_length=10)),
+                ('valor', models.JSONField()),
+                ('descripcion', models.CharField(blank=True, max_length=255)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='VersionConfig',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(crear_version, migrations.RunPython.noop),
+    ]
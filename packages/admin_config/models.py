@@ -0,0 +1,15 @@
+from django.db import models
+from core.models import TimeStampedModel
+
+class Parametro(TimeStampedModel):
+    """Valor de configuración editable en caliente (ver use_cases.configuracion)."""
+    TIPO = (("ENTERO","ENTERO"),("DECIMAL","DECIMAL"),("BOOLEANO","BOOLEANO"),("TEXTO","TEXTO"),("JSON","JSON"))
+    clave = models.CharField(max_length=100, unique=True)
+    tipo = models.CharField(max_length=10, choices=TIPO)
+    valor = models.JSONField()
+    descripcion = models.CharField(max_length=255, blank=True)
+    def __str__(self): return f"{self.clave}={self.valor!r}"
+
+class VersionConfig(models.Model):
+    """Fila única (pk=1): cada cambio en Parametro la incrementa; los workers solo leen este número."""
+    version = models.PositiveBigIntegerField(default=0)
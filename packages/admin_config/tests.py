@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authz.tokens import TokenRefresco
+from packages.common.pruebas import cliente_admin
+from .models import Parametro, VersionConfig
+from .use_cases import configuracion
+
+
+class ConfiguracionTests(TestCase):
+    def setUp(self):
+        configuracion.reiniciar()
+        self.addCleanup(configuracion.reiniciar)
+
+    def test_lectura_desde_instantanea(self):
+        self.assertEqual(configuracion.entero("RESERVA_RETENCION_MIN", 30), 30)
+        Parametro.objects.create(clave="RESERVA_RETENCION_MIN", tipo="ENTERO", valor=45)
+        self.assertEqual(VersionConfig.objects.get(pk=1).version, 1)
+        with self.assertNumQueries(0):  # dentro del intervalo: solo el dict
+            self.assertEqual(configuracion.entero("RESERVA_RETENCION_MIN", 30), 30)
+
+        with override_settings(CONFIG_REFRESCO_SEG=0), self.assertNumQueries(2):  # versión + recarga
+            self.assertEqual(configuracion.entero("RESERVA_RETENCION_MIN", 30), 45)
+        with override_settings(CONFIG_REFRESCO_SEG=0), self.assertNumQueries(1):  # misma versión
+            configuracion.entero("RESERVA_RETENCION_MIN", 30)
+
+        # Tipo equivocado en la fila: se usa el defecto
+        Parametro.objects.filter(clave="RESERVA_RETENCION_MIN").update(valor="mucho")
+        VersionConfig.objects.filter(pk=1).update(version=99)
+        with override_settings(CONFIG_REFRESCO_SEG=0):
+            self.assertEqual(configuracion.entero("RESERVA_RETENCION_MIN", 30), 30)
+
+    def test_el_propio_worker_ve_su_cambio_al_confirmar(self):
+        configuracion.texto("LIMITE_LOGIN_IP")
+        with self.captureOnCommitCallbacks(execute=True):
+            Parametro.objects.create(clave="LIMITE_LOGIN_IP", tipo="TEXTO", valor="1/min")
+        self.assertEqual(configuracion.texto("LIMITE_LOGIN_IP"), "1/min")
+
+    def test_vida_de_tokens_en_caliente(self):
+        Parametro.objects.create(clave="ACCESS_TOKEN_LIFETIME_MIN", tipo="ENTERO", valor=5)
+        configuracion.reiniciar()
+        acceso = TokenRefresco().access_token
+        self.assertEqual(acceso["exp"] - acceso["iat"], int(timedelta(minutes=5).total_seconds()))
+        self.assertIsInstance(acceso, AccessToken)
+
+    def test_api_solo_admin_y_valida_tipo(self):
+        client = cliente_admin()
+        r = client.post("/api/config/parametros/", {"clave": "CATALOGO_CACHE_SEG", "tipo": "ENTERO", "valor": "60"},
+                        format="json")
+        self.assertEqual(r.status_code, 400)
+        r = client.post("/api/config/parametros/", {"clave": "CATALOGO_CACHE_SEG", "tipo": "ENTERO", "valor": 60},
+                        format="json")
+        self.assertEqual(r.status_code, 201, r.content)
+        r = client.patch("/api/config/parametros/CATALOGO_CACHE_SEG/", {"valor": 120}, format="json")
+        self.assertEqual((r.status_code, r.data["valor"]), (200, 120))
+
+        otro = APIClient()
+        otro.force_authenticate(get_user_model().objects.create_user("cli", email="cli@example.com"))
+        self.assertEqual(otro.get("/api/config/parametros/").status_code, 403)
@@ -0,0 +1,121 @@
+"""
+Configuración en caliente respaldada por la tabla Parametro.
+
+    from packages.admin_config.use_cases import configuracion
+    minutos = configuracion.entero("RESERVA_RETENCION_MIN", settings.RESERVA_RETENCION_MIN)
+
+Cada proceso guarda una instantánea (dict clave -> valor). Leer es buscar en
+ese dict; a lo sumo cada CONFIG_REFRESCO_SEG segundos la lectura consulta
+`VersionConfig` (una fila, un entero) y solo si la versión cambió vuelve a
+cargar todos los parámetros. Guardar o borrar un Parametro por el ORM sube
+la versión (señales), así el cambio llega a todos los workers en a lo sumo
+ese intervalo, sin reiniciar.
+
+Las claves llevan el nombre de la variable de entorno que reemplazan; el
+`defecto` de cada lectura es el valor de settings/entorno, que rige
+mientras no haya fila.
+"""
+import logging
+import threading
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..models import Parametro, VersionConfig
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+
+
+class _Instantanea:
+    __slots__ = ("version", "valores", "revisada")
+
+    def __init__(self, version=None, valores=None, revisada=float("-inf")):
+        self.version = version
+        self.valores = valores or {}
+        self.revisada = revisada
+
+
+_actual = _Instantanea()
+
+
+def _intervalo():
+    return getattr(settings, "CONFIG_REFRESCO_SEG", 5)
+
+
+def _refrescar_si_toca():
+    global _actual
+    ahora = time.monotonic()
+    if ahora - _actual.revisada < _intervalo():
+        return
+    with _lock:
+        if ahora - _actual.revisada < _intervalo():  # otro hilo ya revisó
+            return
+        version = VersionConfig.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+        if version == _actual.version:
+            _actual.revisada = ahora
+            return
+        valores = dict(Parametro.objects.values_list("clave", "valor"))
+        # Se reemplaza el objeto entero: un lector concurrente ve la vieja o la nueva, nunca una mezcla
+        _actual = _Instantanea(version, valores, ahora)
+        logger.info("configuración recargada (versión %s, %s parámetros)", version, len(valores))
+
+
+def reiniciar():
+    """Descarta la instantánea: la próxima lectura consulta la base de datos."""
+    global _actual
+    _actual = _Instantanea()
+
+
+def valor(clave, defecto=None):
+    _refrescar_si_toca()
+    return _actual.valores.get(clave, defecto)
+
+
+def _tipado(clave, defecto, tipos, convertir=None):
+    v = valor(clave, defecto)
+    if v is defecto:
+        return defecto
+    if (isinstance(v, bool) and bool not in tipos) or not isinstance(v, tipos):
+        logger.warning("parámetro %s con tipo inesperado (%r); se usa el defecto", clave, v)
+        return defecto
+    return convertir(v) if convertir else v
+
+
+def entero(clave, defecto=None):
+    return _tipado(clave, defecto, (int,))
+
+
+def decimal(clave, defecto=None):
+    return _tipado(clave, defecto, (int, float, str), lambda v: Decimal(str(v)))
+
+
+def booleano(clave, defecto=None):
+    return _tipado(clave, defecto, (bool,))
+
+
+def texto(clave, defecto=None):
+    return _tipado(clave, defecto, (str,))
+
+
+def _subir_version():
+    if not VersionConfig.objects.filter(pk=1).update(version=F("version") + 1):
+        VersionConfig.objects.get_or_create(pk=1, defaults={"version": 1})
+
+
+def _revisar_ya():
+    _actual.revisada = float("-inf")
+
+
+@receiver(post_save, sender=Parametro)
+@receiver(post_delete, sender=Parametro)
+def _parametro_cambiado(sender, **kwargs):
+    _subir_version()
+    # Este worker no espera al intervalo para ver su propio cambio
+    transaction.on_commit(_revisar_ya)
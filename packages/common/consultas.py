@@ -0,0 +1,130 @@
+"""
+Control de cuántas consultas SQL hace un bloque de código.
+
+`query_budget(n)` es para tests: falla si el bloque (o el test decorado)
+hace más de `n` consultas, y el mensaje agrupa las consultas por forma
+para que un N+1 se vea de inmediato.
+
+    @query_budget(2)
+    def test_listado(self):
+        self.client.get("/api/servicios/")
+
+`DetectorNMas1Middleware` es para desarrollo (solo con DEBUG y
+DETECTOR_N_MAS_1 activos): cuenta las formas de SQL de cada petición y, si
+una se repite N_MAS_1_UMBRAL veces o más, lo registra en el logger
+"consultas" junto con el campo de serializer que la disparó.
+"""
+import logging
+import re
+import sys
+from collections import Counter
+from contextlib import ContextDecorator
+
+from django.conf import settings
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+from rest_framework.fields import Field
+
+logger = logging.getLogger("consultas")
+
+_LITERALES = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_LISTAS = re.compile(r"\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)")
+_ESPACIOS = re.compile(r"\s+")
+
+
+def forma_sql(sql):
+    """
+    SQL sin valores: literales y marcadores pasan a `?` y las listas
+    `IN (?, ?, ...)` a `(...)`, así dos consultas que solo difieren en los
+    parámetros tienen la misma forma.
+    """
+    sql = _LITERALES.sub("?", sql.replace("%s", "?"))
+    sql = _LISTAS.sub("(...)", sql)
+    return _ESPACIOS.sub(" ", sql).strip()
+
+
+def _repetidas(consultas, minimo=2):
+    formas = Counter(forma_sql(q["sql"]) for q in consultas)
+    return [(n, forma) for forma, n in formas.most_common() if n >= minimo]
+
+
+class query_budget(ContextDecorator):
+    """
+    Context manager / decorador que falla (AssertionError) si se superan
+    `n` consultas en la conexión `using`. A diferencia de assertNumQueries
+    es un techo, no un número exacto: bajar consultas no rompe el test.
+    """
+
+    def __init__(self, n, using="default"):
+        self.n = n
+        self.using = using
+        self._captura = None
+
+    def _recreate_cm(self):
+        return query_budget(self.n, self.using)
+
+    def __enter__(self):
+        self._captura = CaptureQueriesContext(connections[self.using])
+        self._captura.__enter__()
+        return self._captura
+
+    def __exit__(self, exc_type, exc, tb):
+        self._captura.__exit__(exc_type, exc, tb)
+        if exc_type is not None:
+            return False
+        hechas = len(self._captura)
+        if hechas > self.n:
+            lineas = [f"{hechas} consultas, presupuesto {self.n}."]
+            lineas += [f"  {n}x {forma}" for n, forma in _repetidas(self._captura.captured_queries)]
+            lineas += [f"{i}. {q['sql']}" for i, q in enumerate(self._captura.captured_queries, 1)]
+            raise AssertionError("\n".join(lineas))
+        return False
+
+
+def campo_en_curso():
+    """
+    "Serializer.campo" que se está serializando en este momento, o None.
+    Busca en la pila el bucle de `Serializer.to_representation`, cuya
+    variable local `field` es el campo que pidió el dato.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_name == "to_representation":
+            field = frame.f_locals.get("field")
+            if isinstance(field, Field) and field.parent is not None:
+                return f"{type(field.parent).__name__}.{field.field_name}"
+        frame = frame.f_back
+    return None
+
+
+class _Contador:
+    def __init__(self, umbral):
+        self.umbral = umbral
+        self.formas = Counter()
+        self.campos = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        forma = forma_sql(sql)
+        self.formas[forma] += 1
+        if self.formas[forma] == self.umbral:
+            # Solo al cruzar el umbral se recorre la pila: las consultas normales no pagan nada extra
+            self.campos[forma] = campo_en_curso()
+        return execute(sql, params, many, context)
+
+
+class DetectorNMas1Middleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not (settings.DEBUG and getattr(settings, "DETECTOR_N_MAS_1", False)):
+            return self.get_response(request)
+        contador = _Contador(getattr(settings, "N_MAS_1_UMBRAL", 5))
+        with connection.execute_wrapper(contador):
+            response = self.get_response(request)
+        for forma, campo in contador.campos.items():
+            logger.warning(
+                "N+1 en %s %s: %s consultas con la forma %r (campo: %s)",
+                request.method, request.path, contador.formas[forma], forma, campo or "desconocido",
+            )
+        return response
@@ -0,0 +1,72 @@
+"""
+Utilidades de filtrado reutilizables por los módulos de `packages`.
+
+`FilterSet` es una base mínima (sin django-filter): declara parámetros con
+campos de DRF para validarlos y un método `filtrar_<param>` por cada uno.
+"""
+import datetime
+
+from django.utils import timezone
+from rest_framework import serializers
+
+
+def rango_fechas(desde=None, hasta=None, tz=None):
+    """
+    Convierte fechas (date) inclusivas en un rango aware semiabierto
+    [inicio, fin) sobre la zona horaria actual. Así el filtro queda como
+    `created_at >= inicio AND created_at < fin`, que sí usa el índice de
+    `created_at` (a diferencia de `created_at__date`).
+    """
+    tz = tz or timezone.get_current_timezone()
+    inicio = datetime.datetime.combine(desde, datetime.time.min, tzinfo=tz) if desde else None
+    fin = datetime.datetime.combine(hasta + datetime.timedelta(days=1), datetime.time.min, tzinfo=tz) if hasta else None
+    return inicio, fin
+
+
+class FilterSet(serializers.Serializer):
+    """
+    Valida `request.query_params` y aplica los filtros presentes.
+
+        class MiFilterSet(FilterSet):
+            tour = serializers.IntegerField(required=False, min_value=1)
+            def filtrar_tour(self, qs, valor):
+                return qs.filter(tour_id=valor)
+
+        qs = MiFilterSet.aplicar(qs, request.query_params)  # ValidationError -> 400
+    """
+
+    @classmethod
+    def aplicar(cls, queryset, params):
+        fs = cls(data=params)
+        fs.is_valid(raise_exception=True)
+        return fs.filtrar(queryset)
+
+    def filtrar(self, queryset):
+        for nombre, valor in self.validated_data.items():
+            metodo = getattr(self, f"filtrar_{nombre}", None)
+            if metodo is not None and valor not in (None, ""):
+                queryset = metodo(queryset, valor)
+        return queryset
+
+
+class RangoCreacionMixin(serializers.Serializer):
+    """Parámetros ?desde=YYYY-MM-DD&hasta=YYYY-MM-DD sobre `created_at` (ambos inclusivos)."""
+    desde = serializers.DateField(required=False)
+    hasta = serializers.DateField(required=False)
+    campo_fecha = "created_at"
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        desde, hasta = attrs.get("desde"), attrs.get("hasta")
+        if desde and hasta and desde > hasta:
+            raise serializers.ValidationError({"hasta": "Debe ser posterior o igual a 'desde'."})
+        return attrs
+
+    def filtrar(self, queryset):
+        queryset = super().filtrar(queryset)
+        inicio, fin = rango_fechas(self.validated_data.get("desde"), self.validated_data.get("hasta"))
+        if inicio:
+            queryset = queryset.filter(**{f"{self.campo_fecha}__gte": inicio})
+        if fin:
+            queryset = queryset.filter(**{f"{self.campo_fecha}__lt": fin})
+        return queryset
@@ -0,0 +1,46 @@
+"""
+Datos de prueba compartidos por los tests de las apps y de `packages`.
+
+    self.tour = crear_servicio()                       # TOUR "Salar", categoría "Aventura"
+    self.hotel = crear_servicio("Hotel", tipo="ALOJAMIENTO", costo=Decimal("300"))
+    self.client = cliente_admin()                      # APIClient con rol ADMIN
+
+Los permisos (authz.roles) buscan el Usuario de dominio por el email del
+User de Django autenticado, por eso `cliente_de` solo crea el User y
+`crear_usuario` el Usuario con sus roles.
+"""
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from authz.models import Rol, Usuario
+from catalogo.models import Categoria, Servicio
+
+
+def crear_servicio(titulo="Salar", **campos):
+    """Servicio válido con valores por defecto; `campos` pisa cualquiera (categoría "Aventura" si no se da)."""
+    if "categoria" not in campos:
+        campos["categoria"] = Categoria.objects.get_or_create(nombre="Aventura")[0]
+    datos = {"tipo": "TOUR", "duracion_min": 60, "costo": Decimal("100"), "capacidad_max": 10,
+             "punto_encuentro": "Plaza", **campos}
+    return Servicio.objects.create(titulo=titulo, **datos)
+
+
+def crear_usuario(email, *roles, nombre=None):
+    usuario = Usuario.objects.create(nombre=nombre or email.split("@")[0], email=email, password_hash="x")
+    if roles:
+        usuario.roles.add(*Rol.objects.filter(nombre__in=roles))
+    return usuario
+
+
+def cliente_de(email):
+    """APIClient autenticado como el User de Django con ese email."""
+    client = APIClient()
+    client.force_authenticate(get_user_model().objects.create_user(email.split("@")[0], email=email))
+    return client
+
+
+def cliente_admin(email="admin@example.com"):
+    crear_usuario(email, "ADMIN")
+    return cliente_de(email)
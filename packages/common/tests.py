@@ -0,0 +1,62 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from authz.models import Rol, Usuario
+from authz.serializers import UsuarioSerializer
+from .consultas import DetectorNMas1Middleware, forma_sql, query_budget
+
+
+class QueryBudgetTests(TestCase):
+    def setUp(self):
+        for i in range(3):
+            Usuario.objects.create(nombre=f"U{i}", email=f"u{i}@example.com", password_hash="x")
+
+    def test_forma_sin_valores(self):
+        self.assertEqual(
+            forma_sql("SELECT * FROM t WHERE id IN (%s, %s, %s) AND nombre = 'O''Hara'  LIMIT 21"),
+            "SELECT * FROM t WHERE id IN (...) AND nombre = ? LIMIT ?",
+        )
+
+    def test_falla_por_encima_del_presupuesto(self):
+        with query_budget(4):  # 1 + N
+            for u in Usuario.objects.all():
+                list(u.roles.all())
+        with self.assertRaises(AssertionError) as ctx:
+            with query_budget(3):
+                for u in Usuario.objects.all():
+                    list(u.roles.all())
+        self.assertIn("4 consultas, presupuesto 3.", str(ctx.exception))
+        self.assertIn("3x SELECT", str(ctx.exception))
+
+    def test_como_decorador(self):
+        @query_budget(1)
+        def listar():
+            return list(Usuario.objects.all())
+
+        self.assertEqual(len(listar()), 3)
+        self.assertEqual(len(listar()), 3)  # cada llamada con su propia captura
+
+
+@override_settings(DEBUG=True, DETECTOR_N_MAS_1=True, N_MAS_1_UMBRAL=3)
+class DetectorNMas1Tests(TestCase):
+    def setUp(self):
+        rol = Rol.objects.get(nombre="CLIENTE")
+        for i in range(4):
+            Usuario.objects.create(nombre=f"U{i}", email=f"u{i}@example.com", password_hash="x").roles.add(rol)
+
+    def _peticion(self, queryset):
+        def vista(request):
+            UsuarioSerializer(queryset, many=True).data
+            return HttpResponse()
+        DetectorNMas1Middleware(vista)(RequestFactory().get("/api/usuarios/"))
+
+    def test_registra_el_campo_del_serializer(self):
+        with self.assertLogs("consultas", "WARNING") as logs:
+            self._peticion(Usuario.objects.all())
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("N+1 en GET /api/usuarios/: 4 consultas", logs.output[0])
+        self.assertIn("campo: UsuarioSerializer.roles", logs.output[0])
+
+    def test_sin_repeticiones_no_registra(self):
+        with self.assertNoLogs("consultas", "WARNING"):
+            self._peticion(Usuario.objects.prefetch_related("roles"))
@@ -0,0 +1,44 @@
+from rest_framework import serializers
+from catalogo.models import Servicio
+
+
+class ServicioOperadorSerializer(serializers.ModelSerializer):
+    """Inventario visto por su operador (incluye los no visibles al público)."""
+    class Meta:
+        model = Servicio
+        fields = ["id", "referencia_externa", "tipo", "titulo", "categoria", "costo",
+                  "capacidad_max", "visible_publico", "updated_at"]
+        read_only_fields = fields
+
+
+class CambioDisponibilidadSerializer(serializers.Serializer):
+    id = serializers.IntegerField(min_value=1)
+    capacidad_max = serializers.IntegerField(min_value=0, max_value=32767, required=False)
+    visible_publico = serializers.BooleanField(required=False)
+
+    def validate(self, attrs):
+        if len(attrs) == 1:
+            raise serializers.ValidationError("Indica 'capacidad_max' y/o 'visible_publico'.")
+        return attrs
+
+
+class DisponibilidadLoteSerializer(serializers.Serializer):
+    servicios = CambioDisponibilidadSerializer(many=True, allow_empty=False, max_length=1000)
+
+
+class SalidaSerializer(serializers.Serializer):
+    servicio_id = serializers.IntegerField()
+    titulo = serializers.CharField()
+    fecha = serializers.DateTimeField()
+    capacidad = serializers.IntegerField()
+    reservas = serializers.IntegerField()
+    plazas = serializers.IntegerField()
+
+
+class TableroSerializer(serializers.Serializer):
+    dias = serializers.IntegerField()
+    reservas_proximas = serializers.IntegerField()
+    plazas_proximas = serializers.IntegerField()
+    importe_proximo_pagado = serializers.DecimalField(max_digits=14, decimal_places=2)
+    importe_proximo_pendiente = serializers.DecimalField(max_digits=14, decimal_places=2)
+    ingresos_recientes = serializers.DecimalField(max_digits=14, decimal_places=2)
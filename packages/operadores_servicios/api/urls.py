@@ -0,0 +1,10 @@
+from rest_framework.routers import DefaultRouter
+from django.urls import path, include
+from .viewsets import InventarioOperadorViewSet
+
+router = DefaultRouter()
+router.register(r"servicios", InventarioOperadorViewSet, basename="operador-servicio")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
@@ -0,0 +1,70 @@
+from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiParameter, OpenApiResponse
+from rest_framework import permissions, status, viewsets
+from rest_framework import serializers as drf_serializers
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from authz.roles import EsOperador, usuario_id_de
+from catalogo.models import Servicio
+from core.idempotencia import idempotente
+from ..use_cases import inventario, tablero
+from .serializers import (
+    DisponibilidadLoteSerializer, SalidaSerializer, ServicioOperadorSerializer, TableroSerializer,
+)
+
+DIAS = OpenApiParameter("dias", int, description="Horizonte en días (1-365, por defecto 30)")
+
+
+def _dias(request):
+    campo = drf_serializers.IntegerField(min_value=1, max_value=365)
+    return campo.run_validation(request.query_params.get("dias", 30))
+
+
+class InventarioOperadorViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Endpoints en /api/operador/ (rol OPERADOR), siempre sobre los servicios del operador:
+    - GET  /servicios/                     -> su inventario (?tipo=)
+    - POST /servicios/disponibilidad/      -> capacidad/visibilidad en lote
+    - GET  /servicios/salidas/?dias=       -> próximas salidas con ocupación
+    - GET  /servicios/tablero/?dias=       -> resumen agregado
+    """
+    queryset = Servicio.objects.none()  # solo para el esquema; ver get_queryset
+    serializer_class = ServicioOperadorSerializer
+    permission_classes = [permissions.IsAuthenticated, EsOperador]
+
+    def get_queryset(self):
+        qs = inventario.servicios_de(usuario_id_de(self.request)).order_by("pk")
+        tipo = self.request.query_params.get("tipo")
+        if tipo:
+            qs = qs.filter(tipo=tipo)
+        return qs
+
+    @extend_schema(
+        summary="Actualizar disponibilidad en lote",
+        request=DisponibilidadLoteSerializer,
+        responses={
+            200: inline_serializer(name="DisponibilidadLoteResponse",
+                                   fields={"actualizados": drf_serializers.IntegerField()}),
+            400: OpenApiResponse(description="Validación fallida o servicios ajenos"),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="disponibilidad")
+    @idempotente
+    def disponibilidad(self, request):
+        serializer = DisponibilidadLoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            n = inventario.actualizar_disponibilidad(usuario_id_de(request), serializer.validated_data["servicios"])
+        except inventario.ServiciosAjenos as e:
+            return Response({"servicios_ajenos": e.ids}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"actualizados": n})
+
+    @extend_schema(summary="Próximas salidas", parameters=[DIAS], responses=SalidaSerializer(many=True))
+    @action(detail=False, methods=["get"], url_path="salidas")
+    def salidas(self, request):
+        salidas = inventario.proximas_salidas(usuario_id_de(request), dias=_dias(request))
+        return Response(SalidaSerializer(salidas, many=True).data)
+
+    @extend_schema(summary="Resumen del operador", parameters=[DIAS], responses=TableroSerializer)
+    @action(detail=False, methods=["get"], url_path="tablero")
+    def resumen(self, request):
+        return Response(TableroSerializer(tablero.resumen(usuario_id_de(request), dias=_dias(request))).data)
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from authz.models import Usuario
+from catalogo.models import Servicio
+from packages.common.pruebas import cliente_de, crear_servicio, crear_usuario
+from reservas.models import Reserva, ReservaServicio
+from sincronizacion.models import Baja
+from .use_cases.tablero import resumen
+
+
+class InventarioOperadorTests(TestCase):
+    def setUp(self):
+        self.op, otro = [crear_usuario(f"{n}@example.com", "OPERADOR") for n in ("op", "otro")]
+        self.salar = crear_servicio(operador=self.op)
+        self.oculto = crear_servicio("Oculto", operador=self.op, visible_publico=False)
+        self.ajeno = crear_servicio("Ajeno", operador=otro)
+
+        cliente = Usuario.objects.create(nombre="Cli", email="cli@example.com", password_hash="x")
+        manana = timezone.now() + timedelta(days=1)
+        for estado, cantidad in (("PAGADA", 3), ("PENDIENTE", 2), ("CANCELADA", 4)):
+            r = Reserva.objects.create(usuario=cliente, fecha_inicio=manana, total=Decimal("100") * cantidad,
+                                       estado=estado)
+            ReservaServicio.objects.create(reserva=r, servicio=self.salar, cantidad=cantidad,
+                                           precio_unitario=Decimal("100"))
+            ReservaServicio.objects.create(reserva=r, servicio=self.ajeno, cantidad=1, precio_unitario=Decimal("50"))
+
+        self.client = cliente_de("op@example.com")
+
+    def test_solo_ve_su_inventario(self):
+        r = self.client.get("/api/operador/servicios/")
+        self.assertEqual([s["titulo"] for s in r.data], ["Salar", "Oculto"])
+        self.assertEqual(self.client.get(f"/api/operador/servicios/{self.ajeno.pk}/").status_code, 404)
+        salidas = self.client.get("/api/operador/servicios/salidas/").data
+        self.assertEqual([(s["titulo"], s["reservas"], s["plazas"]) for s in salidas], [("Salar", 2, 5)])
+
+    def test_disponibilidad_en_lote(self):
+        cambios = [{"id": self.salar.pk, "capacidad_max": 20},
+                   {"id": self.oculto.pk, "visible_publico": True, "capacidad_max": 10}]
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            r = self.client.post("/api/operador/servicios/disponibilidad/", {"servicios": cambios}, format="json")
+        self.assertEqual((r.status_code, r.data), (200, {"actualizados": 2}))
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(Servicio.objects.get(pk=self.salar.pk).capacidad_max, 20)
+        self.assertTrue(Servicio.objects.get(pk=self.oculto.pk).visible_publico)
+
+        # Ocultar por lote también deja la lápida del feed /api/sync/
+        r = self.client.post("/api/operador/servicios/disponibilidad/",
+                             {"servicios": [{"id": self.salar.pk, "visible_publico": False}]}, format="json")
+        self.assertEqual(list(Baja.objects.values_list("entidad", "objeto_id")), [("servicios", self.salar.pk)])
+
+        r = self.client.post("/api/operador/servicios/disponibilidad/",
+                             {"servicios": [{"id": self.ajeno.pk, "capacidad_max": 0}]}, format="json")
+        self.assertEqual((r.status_code, r.data), (400, {"servicios_ajenos": [self.ajeno.pk]}))
+        self.assertEqual(Servicio.objects.get(pk=self.ajeno.pk).capacidad_max, 10)
+
+    def test_tablero_en_una_consulta(self):
+        with self.assertNumQueries(1):
+            datos = resumen(self.op.pk)
+        self.assertEqual((datos["reservas_proximas"], datos["plazas_proximas"]), (2, 5))
+        self.assertEqual((datos["importe_proximo_pagado"], datos["importe_proximo_pendiente"]),
+                         (Decimal("300.00"), Decimal("200.00")))
+        self.assertEqual(datos["ingresos_recientes"], Decimal("300.00"))
+        self.assertEqual(self.client.get("/api/operador/servicios/tablero/?dias=0").status_code, 400)
+
+    def test_requiere_rol_operador(self):
+        cliente = APIClient()
+        cliente.force_authenticate(get_user_model().objects.create_user("cli", email="cli@example.com"))
+        self.assertEqual(cliente.get("/api/operador/servicios/").status_code, 403)
@@ -0,0 +1,87 @@
+"""
+Inventario de un operador: sus servicios, próximas salidas y disponibilidad.
+
+Toda consulta parte de `servicios_de(operador_id)`, que filtra por
+`Servicio.operador` (índice `servicio_operador_idx`); nada de lo que se
+lee o escribe aquí puede salirse de ese alcance.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from catalogo.cache import invalidar_catalogo
+from catalogo.models import Servicio
+from reservas.expiracion import ESTADOS_QUE_OCUPAN
+from reservas.models import ReservaServicio
+from sincronizacion.signals import registrar_ocultos
+
+CAMPOS_DISPONIBILIDAD = ("capacidad_max", "visible_publico")
+
+
+class ServiciosAjenos(Exception):
+    """Se pidió modificar servicios que no existen o no son del operador."""
+
+    def __init__(self, ids):
+        super().__init__(f"Servicios ajenos o inexistentes: {ids}")
+        self.ids = ids
+
+
+def servicios_de(operador_id):
+    return Servicio.objects.filter(operador_id=operador_id)
+
+
+def lineas_de(operador_id):
+    """Detalles de reserva sobre servicios del operador, con `fecha` = día del servicio (o inicio de la reserva)."""
+    return (ReservaServicio.objects.filter(servicio__operador_id=operador_id)
+            .annotate(fecha=Coalesce("fecha_servicio", "reserva__fecha_inicio")))
+
+
+def proximas_salidas(operador_id, dias=30, limite=200):
+    """
+    Salidas (servicio × fecha) desde ahora hasta `dias` adelante con su
+    ocupación: reservas que ocupan cupo y plazas tomadas frente a capacidad_max.
+    """
+    ahora = timezone.now()
+    return list(
+        lineas_de(operador_id)
+        .filter(fecha__gte=ahora, fecha__lt=ahora + timedelta(days=dias), reserva__estado__in=ESTADOS_QUE_OCUPAN)
+        .values("servicio_id", "fecha", titulo=F("servicio__titulo"), capacidad=F("servicio__capacidad_max"))
+        .annotate(reservas=Count("reserva_id", distinct=True), plazas=Sum("cantidad"))
+        .order_by("fecha", "servicio_id")[:limite]
+    )
+
+
+def actualizar_disponibilidad(operador_id, cambios):
+    """
+    `cambios`: lista de dicts {"id", "capacidad_max"?, "visible_publico"?}
+    (si un id se repite, gana el último). Un `bulk_update` sobre servicios
+    del operador y una sola invalidación del catálogo. Devuelve cuántos cambió.
+    """
+    por_id = {}
+    for c in cambios:
+        por_id.setdefault(c["id"], {}).update({k: c[k] for k in CAMPOS_DISPONIBILIDAD if k in c})
+    with transaction.atomic():
+        servicios = servicios_de(operador_id).select_for_update().in_bulk(list(por_id))
+        if len(servicios) != len(por_id):
+            raise ServiciosAjenos(sorted(set(por_id) - servicios.keys()))
+        modificados, campos, ocultos = [], set(), []
+        ahora = timezone.now()
+        for pk, valores in por_id.items():
+            s = servicios[pk]
+            distintos = {k: v for k, v in valores.items() if getattr(s, k) != v}
+            if distintos:
+                if distintos.get("visible_publico") is False:
+                    ocultos.append(pk)
+                for k, v in distintos.items():
+                    setattr(s, k, v)
+                s.updated_at = ahora  # bulk_update no aplica auto_now
+                modificados.append(s)
+                campos |= distintos.keys()
+        if modificados:
+            Servicio.objects.bulk_update(modificados, [*campos, "updated_at"], batch_size=500)
+            registrar_ocultos(ocultos)
+            transaction.on_commit(invalidar_catalogo)
+    return len(modificados)
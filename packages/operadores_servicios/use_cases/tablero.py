@@ -0,0 +1,38 @@
+"""Resumen del tablero del operador: una sola consulta agregada con filtros condicionales."""
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Q, Sum
+from django.utils import timezone
+
+from reservas.expiracion import ESTADOS_QUE_OCUPAN
+from .inventario import lineas_de
+
+IMPORTE = ExpressionWrapper(F("cantidad") * F("precio_unitario"),
+                            output_field=DecimalField(max_digits=14, decimal_places=2))
+
+
+def resumen(operador_id, dias=30):
+    """
+    Próximos `dias`: reservas, plazas e importe (bruto de líneas, antes de
+    cupones) por cobrar y ya cobrado; últimos `dias`: importe pagado de
+    reservas creadas en ese lapso.
+    """
+    ahora = timezone.now()
+    proximas = Q(fecha__gte=ahora, fecha__lt=ahora + timedelta(days=dias), reserva__estado__in=ESTADOS_QUE_OCUPAN)
+    recientes = Q(reserva__created_at__gte=ahora - timedelta(days=dias))
+    datos = (
+        lineas_de(operador_id)
+        .filter(proximas | recientes)
+        .aggregate(
+            reservas_proximas=Count("reserva_id", distinct=True, filter=proximas),
+            plazas_proximas=Sum("cantidad", filter=proximas),
+            importe_proximo_pagado=Sum(IMPORTE, filter=proximas & Q(reserva__estado="PAGADA")),
+            importe_proximo_pendiente=Sum(IMPORTE, filter=proximas & Q(reserva__estado="PENDIENTE")),
+            ingresos_recientes=Sum(IMPORTE, filter=recientes & Q(reserva__estado="PAGADA")),
+        )
+    )
+    datos["plazas_proximas"] = datos["plazas_proximas"] or 0
+    for k in ("importe_proximo_pagado", "importe_proximo_pendiente", "ingresos_recientes"):
+        datos[k] = (datos[k] or Decimal("0")).quantize(Decimal("0.01"))
+    return {"dias": dias, **datos}
@@ -0,0 +1,66 @@
+# packages/reservas_pagos/api/filters.py
+"""
+Filtros y paginación del listado de Booking.
+
+Índices que sostienen estas consultas (declarados en `bookings.models.Booking.Meta`):
+    models.Index(fields=["user", "created_at"], name="booking_user_created_idx")
+    models.Index(fields=["status", "created_at"], name="booking_status_created_idx")
+"""
+from rest_framework import serializers
+from rest_framework.pagination import CursorPagination
+from packages.common.filtros import FilterSet, RangoCreacionMixin
+
+ESTADOS_DB = {"pendiente": "pending", "pagada": "paid", "confirmada": "confirmed",
+              "realizada": "completed", "cancelada": "canceled", "reembolsada": "refunded"}
+
+ORDENES = {"recientes": ("-created_at", "-id"), "antiguas": ("created_at", "id")}
+
+
+class BookingFilterSet(RangoCreacionMixin, FilterSet):
+    """
+    Filtros (todos opcionales):
+    - ?estado=<pendiente|pagada|confirmada|realizada|cancelada|reembolsada>
+    - ?tour=<id>
+    - ?salida=<id>
+    - ?desde=YYYY-MM-DD   (fecha de creación mínima, inclusive)
+    - ?hasta=YYYY-MM-DD   (fecha de creación máxima, inclusive)
+    """
+    estado = serializers.ChoiceField(choices=list(ESTADOS_DB), required=False)
+    tour = serializers.IntegerField(required=False, min_value=1)
+    salida = serializers.IntegerField(required=False, min_value=1)
+
+    def to_internal_value(self, data):
+        if data.get("estado"):
+            data = data.copy()
+            data["estado"] = data["estado"].lower()
+        return super().to_internal_value(data)
+
+    def filtrar_estado(self, qs, valor):
+        return qs.filter(status=ESTADOS_DB[valor])
+
+    def filtrar_tour(self, qs, valor):
+        return qs.filter(tour_id=valor)
+
+    def filtrar_salida(self, qs, valor):
+        return qs.filter(departure_id=valor)
+
+
+class BookingCursorPagination(CursorPagination):
+    """
+    Paginación por cursor sobre `created_at`: cada página es un
+    `WHERE created_at < <posición> ORDER BY created_at DESC, id DESC
+    OFFSET k LIMIT n`. El cursor de DRF guarda solo el primer campo del
+    orden, no (created_at, id): `id` fija el orden entre filas con el mismo
+    `created_at` y `k` cuenta las ya entregadas de ese valor empatado, así
+    que el OFFSET nunca pasa del tamaño del empate.
+    - ?orden=<recientes|antiguas>  (por defecto: recientes)
+    """
+    page_size = 50
+    page_size_query_param = "tamanio"
+    max_page_size = 200
+
+    def get_ordering(self, request, queryset, view):
+        orden = request.query_params.get("orden", "recientes")
+        if orden not in ORDENES:
+            raise serializers.ValidationError({"orden": f"Valores válidos: {', '.join(ORDENES)}."})
+        return ORDENES[orden]
@@ -0,0 +1,85 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from authz.models import Usuario
+from reservas.models import Reserva
+from .api.filters import BookingCursorPagination, BookingFilterSet
+
+# El modelo Booking no está instalado aquí: filtros y paginación se prueban sobre Reserva (también tiene created_at)
+
+
+class BookingFiltrosTests(TestCase):
+    def setUp(self):
+        usuario = Usuario.objects.create(nombre="Ana", email="ana@example.com", password_hash="x")
+        tz = timezone.get_current_timezone()
+        self.reservas = {}
+        for dia in (1, 2, 3):
+            r = Reserva.objects.create(usuario=usuario, fecha_inicio=timezone.now(), total=Decimal("0"))
+            creada = datetime(2026, 1, dia, 23, 30, tzinfo=tz)
+            Reserva.objects.filter(pk=r.pk).update(created_at=creada)
+            self.reservas[dia] = r.pk
+
+    def test_rango_de_fechas_inclusivo_y_validado(self):
+        qs = BookingFilterSet.aplicar(Reserva.objects.all(), {"desde": "2026-01-02", "hasta": "2026-01-02"})
+        self.assertEqual(list(qs.values_list("pk", flat=True)), [self.reservas[2]])
+        qs = BookingFilterSet.aplicar(Reserva.objects.all(), {"desde": "2026-01-02"})
+        self.assertEqual(set(qs.values_list("pk", flat=True)), {self.reservas[2], self.reservas[3]})
+
+        with self.assertRaises(ValidationError) as ctx:
+            BookingFilterSet.aplicar(Reserva.objects.all(), {"desde": "2026-01-03", "hasta": "2026-01-01"})
+        self.assertIn("hasta", ctx.exception.detail)
+        fs = BookingFilterSet(data={"desde": "03/01/2026"})
+        self.assertFalse(fs.is_valid())
+        self.assertIn("desde", fs.errors)
+        self.assertTrue(BookingFilterSet(data={"desde": date(2026, 1, 1).isoformat()}).is_valid())
+
+
+class BookingPaginacionTests(TestCase):
+    def setUp(self):
+        self.usuario = Usuario.objects.create(nombre="Ana", email="ana@example.com", password_hash="x")
+        self.factory = APIRequestFactory()
+
+    def _crear(self, creadas):
+        ids = []
+        for creada in creadas:
+            r = Reserva.objects.create(usuario=self.usuario, fecha_inicio=timezone.now(), total=Decimal("0"))
+            Reserva.objects.filter(pk=r.pk).update(created_at=creada)
+            ids.append(r.pk)
+        return ids
+
+    def _recorrer(self, url):
+        """Sigue los enlaces `next` y devuelve los ids de cada página."""
+        paginas = []
+        while url:
+            paginador = BookingCursorPagination()
+            pagina = paginador.paginate_queryset(Reserva.objects.all(), Request(self.factory.get(url)))
+            paginas.append([r.pk for r in pagina])
+            url = paginador.get_next_link()
+        return paginas
+
+    def test_orden_recientes_antiguas_e_invalido(self):
+        ahora = timezone.now()
+        vieja, nueva = self._crear([ahora - timedelta(days=1), ahora])
+        self.assertEqual(self._recorrer("/bookings/"), [[nueva, vieja]])
+        self.assertEqual(self._recorrer("/bookings/?orden=antiguas"), [[vieja, nueva]])
+        with self.assertRaises(ValidationError) as ctx:
+            self._recorrer("/bookings/?orden=precio")
+        self.assertIn("orden", ctx.exception.detail)
+
+    def test_cursor_recorre_empates_de_created_at_sin_repetir_ni_saltar(self):
+        ahora = timezone.now()
+        # 5 reservas en el mismo instante entre otras dos: los empates cruzan los bordes de página
+        ids = self._crear([ahora - timedelta(minutes=1)] + [ahora] * 5 + [ahora + timedelta(minutes=1)])
+        paginas = self._recorrer("/bookings/?tamanio=2")
+        self.assertEqual([len(p) for p in paginas], [2, 2, 2, 1])
+        recorridos = [pk for p in paginas for pk in p]
+        self.assertEqual(recorridos, [ids[-1]] + sorted(ids[1:-1], reverse=True) + [ids[0]])
+
+        paginas = self._recorrer("/bookings/?tamanio=2&orden=antiguas")
+        self.assertEqual([pk for p in paginas for pk in p], [ids[0]] + sorted(ids[1:-1]) + [ids[-1]])
@@ -0,0 +1,44 @@
+from django.utils import timezone
+from rest_framework import serializers
+
+
+class ItemCarritoSerializer(serializers.Serializer):
+    servicio = serializers.IntegerField(min_value=1)
+    fecha = serializers.DateTimeField()
+    visitantes = serializers.IntegerField(min_value=1, max_value=500)
+
+    def validate_fecha(self, valor):
+        if valor < timezone.now():
+            raise serializers.ValidationError("La fecha ya pasó.")
+        return valor
+
+
+class CotizarSerializer(serializers.Serializer):
+    items = ItemCarritoSerializer(many=True, allow_empty=False, max_length=50)
+    cupon = serializers.CharField(max_length=50, required=False, allow_blank=True)
+    moneda = serializers.CharField(max_length=3, default="BOB")
+
+
+class LineaCotizadaSerializer(serializers.Serializer):
+    servicio = serializers.IntegerField()
+    titulo = serializers.CharField()
+    fecha = serializers.DateTimeField()
+    visitantes = serializers.IntegerField()
+    precio_unitario = serializers.DecimalField(max_digits=12, decimal_places=2)
+    importe = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class CotizacionSerializer(serializers.Serializer):
+    token = serializers.CharField()
+    expira = serializers.DateTimeField()
+    lineas = LineaCotizadaSerializer(many=True)
+    moneda = serializers.CharField()
+    cupon = serializers.IntegerField(allow_null=True)
+    subtotal = serializers.DecimalField(max_digits=14, decimal_places=2)
+    descuento = serializers.DecimalField(max_digits=14, decimal_places=2)
+    total = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class ConvertirSerializer(serializers.Serializer):
+    token = serializers.CharField()
+    usuario = serializers.IntegerField(min_value=1, help_text="Cliente (authz.Usuario) titular de la reserva")
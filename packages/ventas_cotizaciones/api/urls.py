@@ -0,0 +1,10 @@
+from rest_framework.routers import DefaultRouter
+from django.urls import path, include
+from .viewsets import CotizacionViewSet
+
+router = DefaultRouter()
+router.register(r"cotizaciones", CotizacionViewSet, basename="cotizacion")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
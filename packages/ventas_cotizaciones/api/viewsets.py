@@ -0,0 +1,59 @@
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from authz.models import Usuario
+from authz.roles import EsAgente
+from core.idempotencia import idempotente
+from reservas.serializers import ReservaSerializer
+from ..use_cases import cotizador
+from .serializers import ConvertirSerializer, CotizacionSerializer, CotizarSerializer
+
+
+class CotizacionViewSet(viewsets.ViewSet):
+    """
+    Endpoints en /api/ventas/ (rol AGENTE o ADMIN):
+    - POST /cotizaciones/            -> valorar un carrito; devuelve líneas, totales y un token de vida corta
+    - POST /cotizaciones/convertir/  -> crear la Reserva de un token vigente, sin re-cotizar
+    """
+    permission_classes = [permissions.IsAuthenticated, EsAgente]
+
+    @extend_schema(
+        summary="Cotizar un carrito",
+        request=CotizarSerializer,
+        responses={200: CotizacionSerializer, 400: OpenApiResponse(description="Errores por ítem o cupón")},
+    )
+    def create(self, request):
+        serializer = CotizarSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        datos = serializer.validated_data
+        try:
+            cotizacion = cotizador.cotizar(datos["items"], datos.get("cupon"), datos["moneda"])
+        except cotizador.CotizacionInvalida as e:
+            return Response({"errores": e.errores}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(CotizacionSerializer(cotizacion).data)
+
+    @extend_schema(
+        summary="Convertir cotización en reserva",
+        request=ConvertirSerializer,
+        responses={
+            201: ReservaSerializer,
+            400: OpenApiResponse(description="Token vencido/inválido, usuario inexistente o salida sin plazas"),
+            409: OpenApiResponse(description="La cotización ya se convirtió"),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="convertir")
+    @idempotente
+    def convertir(self, request):
+        serializer = ConvertirSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        datos = serializer.validated_data
+        if not Usuario.activos.filter(pk=datos["usuario"]).exists():
+            return Response({"usuario": "No existe o está inactivo."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            reserva = cotizador.convertir(datos["token"], datos["usuario"])
+        except cotizador.CotizacionInvalida as e:
+            return Response({"errores": e.errores}, status=status.HTTP_400_BAD_REQUEST)
+        except cotizador.CotizacionYaConvertida as e:
+            return Response({"detail": str(e), "reserva": e.reserva_id}, status=status.HTTP_409_CONFLICT)
+        return Response(ReservaSerializer(reserva).data, status=status.HTTP_201_CREATED)
@@ -0,0 +1,98 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from catalogo.models import Servicio
+from cupones.models import Cupon
+from packages.common.pruebas import cliente_de, crear_servicio, crear_usuario
+from reservas.models import Reserva
+from .use_cases.cotizador import CotizacionInvalida, cotizar
+
+
+class CotizacionesTests(TestCase):
+    def setUp(self):
+        self.tour = crear_servicio()
+        self.hotel = crear_servicio("Hotel", tipo="ALOJAMIENTO", costo=Decimal("250.50"), capacidad_max=4)
+        Cupon.objects.create(codigo="DIEZ", tipo="PORCENTAJE", valor=Decimal("10"))
+        crear_usuario("agente@example.com", "AGENTE")
+        self.cliente = crear_usuario("cli@example.com")
+        self.client = cliente_de("agente@example.com")
+        manana = timezone.now() + timedelta(days=1)
+        self.carrito = {"items": [
+            {"servicio": self.tour.pk, "fecha": manana.isoformat(), "visitantes": 3},
+            {"servicio": self.hotel.pk, "fecha": (manana + timedelta(days=1)).isoformat(), "visitantes": 2},
+        ], "cupon": "DIEZ"}
+
+    def test_cotiza_en_una_pasada(self):
+        items = [{"servicio": self.tour.pk, "fecha": timezone.now(), "visitantes": 3},
+                 {"servicio": self.hotel.pk, "fecha": timezone.now(), "visitantes": 2}]
+        with self.assertNumQueries(2):  # servicios + cupón
+            c = cotizar(items, "DIEZ")
+        self.assertEqual((c["subtotal"], c["descuento"], c["total"]),
+                         (Decimal("801.00"), Decimal("80.10"), Decimal("720.90")))
+
+        r = self.client.post("/api/ventas/cotizaciones/", {**self.carrito, "cupon": "NO"}, format="json")
+        self.assertEqual((r.status_code, list(r.data["errores"])), (400, ["cupon"]))
+        self.carrito["items"][1]["visitantes"] = 5
+        r = self.client.post("/api/ventas/cotizaciones/", self.carrito, format="json")
+        self.assertEqual(list(r.data["errores"]), [1])
+
+    def test_convierte_sin_recotizar_y_una_sola_vez(self):
+        cotizacion = self.client.post("/api/ventas/cotizaciones/", self.carrito, format="json").data
+        self.assertEqual(cotizacion["total"], "720.90")
+        # Un cambio de precio posterior no altera lo cotizado
+        Servicio.objects.filter(pk=self.tour.pk).update(costo=Decimal("999"))
+
+        datos = {"token": cotizacion["token"], "usuario": self.cliente.pk}
+        r = self.client.post("/api/ventas/cotizaciones/convertir/", datos, format="json")
+        self.assertEqual(r.status_code, 201, r.content)
+        self.assertEqual((r.data["total"], r.data["usuario"], r.data["estado"]), ("720.90", self.cliente.pk, "PENDIENTE"))
+        self.assertEqual(sorted((d["servicio"], d["cantidad"], d["precio_unitario"]) for d in r.data["detalles"]),
+                         [(self.tour.pk, 3, "100.00"), (self.hotel.pk, 2, "250.50")])
+
+        r2 = self.client.post("/api/ventas/cotizaciones/convertir/", datos, format="json")
+        self.assertEqual((r2.status_code, r2.data["reserva"]), (409, r.data["id"]))
+        self.assertEqual(Reserva.objects.count(), 1)
+
+    def test_token_vencido_o_alterado(self):
+        token = self.client.post("/api/ventas/cotizaciones/", self.carrito, format="json").data["token"]
+        r = self.client.post("/api/ventas/cotizaciones/convertir/",
+                             {"token": token[:-2] + "xx", "usuario": self.cliente.pk}, format="json")
+        self.assertEqual(r.status_code, 400)
+        with override_settings(COTIZACION_TTL_SEG=-1):
+            r = self.client.post("/api/ventas/cotizaciones/convertir/",
+                                 {"token": token, "usuario": self.cliente.pk}, format="json")
+        self.assertIn("venció", r.data["errores"]["token"])
+
+    def test_requiere_agente(self):
+        self.assertEqual(cliente_de("cli@example.com").post("/api/ventas/cotizaciones/", self.carrito, format="json").status_code, 403)
+
+    def test_descuenta_plazas_tomadas_y_reverifica_al_convertir(self):
+        fecha = timezone.now() + timedelta(days=1)
+        items = [{"servicio": self.tour.pk, "fecha": fecha, "visitantes": 4}]
+        cotizacion = cotizar(items)
+
+        ocupa = Reserva.objects.create(usuario=self.cliente, fecha_inicio=fecha, total=Decimal("0"))
+        ocupa.detalles.create(servicio=self.tour, cantidad=7, precio_unitario=Decimal("100"))
+        libera = Reserva.objects.create(usuario=self.cliente, fecha_inicio=fecha, estado="CANCELADA",
+                                        total=Decimal("0"))
+        libera.detalles.create(servicio=self.tour, cantidad=5, precio_unitario=Decimal("100"))
+        # Otra salida del mismo servicio no cuenta
+        ocupa.detalles.create(servicio=self.hotel, cantidad=3, precio_unitario=Decimal("250.50"),
+                              fecha_servicio=fecha + timedelta(days=1))
+
+        with self.assertNumQueries(1), self.assertRaises(CotizacionInvalida) as ctx:
+            cotizar(items)
+        self.assertIn("(3 de 10)", ctx.exception.errores[0])
+        self.assertEqual(cotizar([{**items[0], "visitantes": 3},
+                                  {"servicio": self.hotel.pk, "fecha": fecha, "visitantes": 4}])["total"],
+                         Decimal("1302.00"))
+
+        # El token se emitió con cupo; al convertir ya no lo hay
+        r = self.client.post("/api/ventas/cotizaciones/convertir/",
+                             {"token": cotizacion["token"], "usuario": self.cliente.pk}, format="json")
+        self.assertEqual(r.status_code, 400)
+        self.assertIn("plazas libres", r.data["errores"][0])
+        self.assertEqual(Reserva.objects.count(), 2)
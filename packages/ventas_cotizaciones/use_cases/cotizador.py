@@ -0,0 +1,200 @@
+"""
+Motor de cotizaciones para agentes de venta.
+
+`cotizar` valora un carrito (servicio × fecha × visitantes) en una pasada:
+una consulta trae costo, capacidad y plazas ya tomadas en cada salida
+(servicio × fecha, reservas en ESTADOS_QUE_OCUPAN), otra el cupón (si hay
+código), y el resto es aritmética en memoria. No escribe nada.
+
+La cotización viaja en su token: un `signing.dumps` comprimido con las
+líneas ya valoradas y los totales, válido COTIZACION_TTL_SEG. Así cualquier
+worker puede convertirla sin caché compartida, y `convertir` crea la
+Reserva con esas mismas líneas, sin volver a leer precios. Para que un
+token se convierta una sola vez se registra su huella en
+`ClaveIdempotencia` dentro de la misma transacción que crea la reserva.
+Esa transacción vuelve a contar las plazas con los servicios bloqueados
+(FOR UPDATE): entre cotizar y convertir otra venta pudo llenar la salida.
+"""
+import hashlib
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core import signing
+from django.db import IntegrityError, transaction
+from django.db.models import Case, DateTimeField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from catalogo.models import Servicio
+from core.models import ClaveIdempotencia
+from cupones.models import Cupon
+from reservas.expiracion import ESTADOS_QUE_OCUPAN
+from reservas.models import Reserva, ReservaServicio
+
+SAL = "ventas_cotizaciones.cotizacion"
+ALCANCE_CONVERSION = "cotizacion"
+CENTAVO = Decimal("0.01")
+
+
+class CotizacionInvalida(Exception):
+    """Carrito que no se puede cotizar, o token vencido/alterado. `errores` va tal cual en el 400."""
+
+    def __init__(self, errores):
+        super().__init__(errores)
+        self.errores = errores
+
+
+class CotizacionYaConvertida(Exception):
+    def __init__(self, reserva_id):
+        super().__init__(f"La cotización ya se convirtió en la reserva {reserva_id}")
+        self.reserva_id = reserva_id
+
+
+def ttl():
+    return getattr(settings, "COTIZACION_TTL_SEG", 15 * 60)
+
+
+def _descuento(cupon, subtotal):
+    if cupon is None:
+        return Decimal("0")
+    if cupon.tipo == "PORCENTAJE":
+        return min(subtotal, (subtotal * cupon.valor / 100).quantize(CENTAVO))
+    return min(subtotal, cupon.valor)
+
+
+def _con_plazas_tomadas(servicios, fechas):
+    """
+    Anota `tomadas`: plazas ocupadas en la salida pedida de cada servicio
+    (`fechas`: {servicio_id: datetime}), en la misma consulta que el servicio.
+    """
+    fecha_pedida = Case(*(When(pk=pk, then=Value(f)) for pk, f in fechas.items()), output_field=DateTimeField())
+    ocupadas = (ReservaServicio.objects
+                .annotate(fecha=Coalesce("fecha_servicio", "reserva__fecha_inicio"))
+                .filter(servicio_id=OuterRef("pk"), fecha=OuterRef("fecha_pedida"),
+                        reserva__estado__in=ESTADOS_QUE_OCUPAN)
+                .values("servicio_id").annotate(plazas=Sum("cantidad")).values("plazas"))
+    return servicios.annotate(fecha_pedida=fecha_pedida, tomadas=Coalesce(Subquery(ocupadas), 0))
+
+
+def _error_de_cupo(visitantes, capacidad, tomadas):
+    libres = max(capacidad - tomadas, 0)
+    if visitantes > libres:
+        return f"Supera las plazas libres de la salida ({libres} de {capacidad})."
+    return None
+
+
+def cotizar(items, codigo_cupon=None, moneda="BOB"):
+    """
+    `items`: [{"servicio": id, "fecha": datetime, "visitantes": n}, ...].
+    Devuelve la cotización (dict con `token`); CotizacionInvalida si algo falla.
+    """
+    # Con un servicio repetido vale su primera fecha; la línea repetida es error igual
+    fechas = {}
+    for i in items:
+        fechas.setdefault(i["servicio"], i["fecha"])
+    servicios = {pk: (titulo, costo, capacidad, tomadas) for pk, titulo, costo, capacidad, tomadas in
+                 _con_plazas_tomadas(Servicio.publicos.filter(pk__in=fechas), fechas)
+                 .values_list("pk", "titulo", "costo", "capacidad_max", "tomadas")}
+    errores = {}
+    vistos = set()
+    for n, item in enumerate(items):
+        datos = servicios.get(item["servicio"])
+        if datos is None:
+            errores[n] = "Servicio inexistente o no disponible."
+        elif item["servicio"] in vistos:
+            errores[n] = "Servicio repetido en el carrito (una línea por servicio)."
+        elif cupo := _error_de_cupo(item["visitantes"], datos[2], datos[3]):
+            errores[n] = cupo
+        vistos.add(item["servicio"])
+
+    cupon = None
+    if codigo_cupon:
+        cupon = Cupon.objects.vigentes().filter(codigo=codigo_cupon).only("pk", "tipo", "valor").first()
+        if cupon is None:
+            errores["cupon"] = "Cupón inexistente o no vigente."
+    if errores:
+        raise CotizacionInvalida(errores)
+
+    lineas, subtotal = [], Decimal("0")
+    for item in items:
+        titulo, costo, _, _ = servicios[item["servicio"]]
+        importe = costo * item["visitantes"]
+        subtotal += importe
+        lineas.append({"servicio": item["servicio"], "titulo": titulo, "fecha": item["fecha"],
+                       "visitantes": item["visitantes"], "precio_unitario": costo, "importe": importe})
+    descuento = _descuento(cupon, subtotal)
+    cotizacion = {
+        "lineas": lineas, "moneda": moneda, "cupon": cupon.pk if cupon else None,
+        "subtotal": subtotal, "descuento": descuento, "total": subtotal - descuento,
+    }
+    compacta = {
+        "l": [[x["servicio"], x["fecha"].isoformat(), x["visitantes"], str(x["precio_unitario"])] for x in lineas],
+        "c": cotizacion["cupon"], "m": moneda, "t": str(cotizacion["total"]),
+    }
+    cotizacion["token"] = signing.dumps(compacta, salt=SAL, compress=True)
+    cotizacion["expira"] = timezone.now() + timedelta(seconds=ttl())
+    return cotizacion
+
+
+def leer_token(token):
+    try:
+        return signing.loads(token, salt=SAL, max_age=ttl())
+    except signing.SignatureExpired:
+        raise CotizacionInvalida({"token": "La cotización venció; vuelve a cotizar."})
+    except signing.BadSignature:
+        raise CotizacionInvalida({"token": "Token de cotización inválido."})
+
+
+def _verificar_cupo(lineas):
+    """Recuenta las plazas de cada salida con los servicios bloqueados hasta el fin de la transacción."""
+    fechas = {servicio: fecha for servicio, fecha, _, _ in lineas}
+    # Primero el bloqueo (en orden de pk: dos conversiones no se cruzan) y después el conteo en
+    # otra sentencia: en READ COMMITTED esa ve las líneas que confirmó quien tenía el bloqueo;
+    # contar dentro del mismo SELECT ... FOR UPDATE usaría la foto previa a la espera
+    capacidades = dict(Servicio.objects.select_for_update().filter(pk__in=fechas).order_by("pk")
+                       .values_list("pk", "capacidad_max"))
+    tomadas = dict(_con_plazas_tomadas(Servicio.objects.filter(pk__in=capacidades), fechas)
+                   .values_list("pk", "tomadas"))
+    cupos = {pk: (capacidad, tomadas[pk]) for pk, capacidad in capacidades.items()}
+    errores = {}
+    for n, (servicio, _, visitantes, _) in enumerate(lineas):
+        if servicio not in cupos:
+            errores[n] = "Servicio inexistente."
+        elif cupo := _error_de_cupo(visitantes, *cupos[servicio]):
+            errores[n] = cupo
+    if errores:
+        raise CotizacionInvalida(errores)
+
+
+def convertir(token, usuario_id):
+    """Crea la Reserva (PENDIENTE) de una cotización vigente, con sus líneas tal como se cotizaron."""
+    datos = leer_token(token)
+    lineas = [(servicio, datetime.fromisoformat(fecha), visitantes, Decimal(precio))
+              for servicio, fecha, visitantes, precio in datos["l"]]
+    huella = hashlib.sha256(token.encode()).hexdigest()
+    try:
+        with transaction.atomic():
+            _verificar_cupo(lineas)
+            reserva = Reserva.objects.create(
+                usuario_id=usuario_id, fecha_inicio=min(fecha for _, fecha, _, _ in lineas),
+                cupon_id=datos["c"], total=Decimal(datos["t"]), moneda=datos["m"],
+            )
+            ReservaServicio.objects.bulk_create([
+                ReservaServicio(reserva=reserva, servicio_id=servicio, cantidad=visitantes,
+                                precio_unitario=precio, fecha_servicio=fecha)
+                for servicio, fecha, visitantes, precio in lineas
+            ])
+            # Una conversión concurrente del mismo token espera aquí (índice único) y luego falla
+            ClaveIdempotencia.objects.create(
+                alcance=ALCANCE_CONVERSION, clave=huella, hash_peticion=huella, en_curso=False,
+                estado_http=201, respuesta={"reserva": reserva.pk},
+                expira=timezone.now() + timedelta(seconds=ttl()),
+            )
+    except IntegrityError:
+        previa = ClaveIdempotencia.objects.filter(alcance=ALCANCE_CONVERSION, clave=huella).first()
+        if previa is None or not previa.respuesta:
+            # No fue la guarda: una FK de las líneas (servicio o cupón borrado desde que se cotizó)
+            raise CotizacionInvalida({"token": "Algún servicio o cupón de la cotización ya no existe."})
+        raise CotizacionYaConvertida(previa.respuesta["reserva"])
+    return reserva
@@ -0,0 +1,20 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+
+from reportes.rollups import actualizar_ventas
+
+
+class Command(BaseCommand):
+    help = "Actualiza los rollups de ventas procesando solo reservas modificadas desde la última marca de agua."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--completo", action="store_true", help="reconstruir todos los días")
+        parser.add_argument("--margen", type=int, default=60, help="segundos a re-procesar antes de la marca")
+
+    def handle(self, *args, **o):
+        inicio = time.perf_counter()
+        dias, filas = actualizar_ventas(datetime.timedelta(seconds=o["margen"]), completo=o["completo"])
+        self.stdout.write(self.style.SUCCESS(
+            f"{dias} día(s) recalculados, {filas} filas de rollup en {time.perf_counter() - inicio:.2f}s"))
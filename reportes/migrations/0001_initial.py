@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('catalogo', '0002_indices_parciales'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MarcaAgua',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nombre', models.CharField(max_length=50, unique=True)),
+                ('valor', models.DateTimeField(blank=True, null=True)),
+                ('actualizado', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='VentaDiaria',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateField()),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'PENDIENTE'), ('PAGADA', 'PAGADA'), ('CANCELADA', 'CANCELADA'), ('REPROGRAMADA', 'REPROGRAMADA')], max_length=12)),
+                ('reservas', models.PositiveIntegerField(default=0)),
+                ('cantidad', models.PositiveIntegerField(default=0)),
+                ('total_bruto', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('descuento_cupon', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('servicio', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ventas_diarias', to='catalogo.servicio')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['estado', 'fecha'], name='reportes_ve_estado_e01073_idx')],
+                'constraints': [models.UniqueConstraint(fields=('fecha', 'servicio', 'estado'), name='uq_venta_diaria')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reportes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ventadiaria',
+            name='estado',
+            field=models.CharField(choices=[('PENDIENTE', 'PENDIENTE'), ('PAGADA', 'PAGADA'), ('CANCELADA', 'CANCELADA'), ('REPROGRAMADA', 'REPROGRAMADA'), ('EXPIRADA', 'EXPIRADA')], max_length=12),
+        ),
+    ]
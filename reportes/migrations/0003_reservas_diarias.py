@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reportes', '0002_estado_expirada'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReservasDiarias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateField()),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'PENDIENTE'), ('PAGADA', 'PAGADA'), ('CANCELADA', 'CANCELADA'), ('REPROGRAMADA', 'REPROGRAMADA'), ('EXPIRADA', 'EXPIRADA')], max_length=12)),
+                ('tipo', models.CharField(blank=True, default='', max_length=20)),
+                ('reservas', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('fecha', 'tipo', 'estado'), name='uq_reservas_diarias')],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reportes', '0003_reservas_diarias'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiaPendiente',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateField(unique=True)),
+            ],
+        ),
+    ]
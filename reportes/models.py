@@ -0,0 +1,47 @@
+from django.db import models
+from catalogo.models import Servicio
+from reservas.models import Reserva
+
+class VentaDiaria(models.Model):
+    """Rollup por día (de creación de la reserva, hora de La Paz) × servicio × estado."""
+    ESTADO = Reserva.ESTADO
+    fecha = models.DateField()
+    servicio = models.ForeignKey(Servicio, on_delete=models.CASCADE, related_name="ventas_diarias")
+    estado = models.CharField(max_length=12, choices=ESTADO)
+    reservas = models.PositiveIntegerField(default=0)
+    cantidad = models.PositiveIntegerField(default=0)
+    total_bruto = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    descuento_cupon = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["fecha", "servicio", "estado"], name="uq_venta_diaria"),
+        ]
+        indexes = [models.Index(fields=["estado", "fecha"])]
+
+class ReservasDiarias(models.Model):
+    """
+    Reservas distintas por día × estado (× tipo de servicio). Una reserva con
+    varios servicios ocupa varias filas de VentaDiaria, así que sumar su
+    columna `reservas` la contaría varias veces; el reporte toma de aquí el
+    conteo cuando agrupa por algo que no es el servicio. tipo "" = todos.
+    """
+    ESTADO = Reserva.ESTADO
+    fecha = models.DateField()
+    estado = models.CharField(max_length=12, choices=ESTADO)
+    tipo = models.CharField(max_length=20, blank=True, default="")
+    reservas = models.PositiveIntegerField(default=0)
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["fecha", "tipo", "estado"], name="uq_reservas_diarias"),
+        ]
+
+class DiaPendiente(models.Model):
+    """Día a recalcular que `updated_at` no delata: el de una reserva borrada (ver reportes.signals)."""
+    fecha = models.DateField(unique=True)
+
+class MarcaAgua(models.Model):
+    """Último `updated_at` procesado por cada rollup incremental."""
+    nombre = models.CharField(max_length=50, unique=True)
+    valor = models.DateTimeField(null=True, blank=True)
+    actualizado = models.DateTimeField(auto_now=True)
+    def __str__(self): return f"{self.nombre}: {self.valor}"
@@ -0,0 +1,110 @@
+"""
+Mantenimiento incremental de los rollups de ventas.
+
+La clave temporal es el día de creación de la reserva (en la zona horaria del
+proyecto), que no cambia; un cambio de estado o de detalle solo mueve cifras
+dentro de ese día. Por eso basta con recalcular completos los días que tienen
+reservas con `updated_at` posterior a la marca de agua, más los días de
+reservas borradas (`DiaPendiente`, que llena un post_delete).
+"""
+import datetime
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from reservas.models import Reserva, ReservaArchivada, ReservaServicio, ReservaServicioArchivada
+from .models import DiaPendiente, VentaDiaria, MarcaAgua, ReservasDiarias
+
+MARCA_VENTAS = "ventas_diarias"
+CENTAVO = Decimal("0.01")
+
+
+def _limites(dia):
+    tz = timezone.get_current_timezone()
+    inicio = datetime.datetime.combine(dia, datetime.time.min, tzinfo=tz)
+    return inicio, inicio + datetime.timedelta(days=1)
+
+
+def recalcular_dia(dia):
+    """Reemplaza las filas de VentaDiaria y ReservasDiarias de `dia` con lo calculado desde reservas."""
+    inicio, fin = _limites(dia)
+    lineas = []
+    # Un día puede tener reservas vivas y archivadas (el archivo corta por fecha_inicio)
+    for modelo in (ReservaServicio, ReservaServicioArchivada):
+        lineas += modelo.objects.filter(
+            reserva__created_at__gte=inicio, reserva__created_at__lt=fin,
+        ).values_list("reserva_id", "reserva__estado", "reserva__total", "reserva__cupon_id",
+                      "servicio_id", "servicio__tipo", "cantidad", "precio_unitario")
+
+    subtotales = defaultdict(Decimal)
+    distintas = defaultdict(set)  # (tipo, estado) -> ids de reserva; tipo "" = todos
+    for reserva_id, estado, _, _, _, tipo, cantidad, precio in lineas:
+        subtotales[reserva_id] += cantidad * precio
+        distintas[("", estado)].add(reserva_id)
+        distintas[(tipo, estado)].add(reserva_id)
+
+    acumulado = {}
+    for reserva_id, estado, total, cupon_id, servicio_id, _, cantidad, precio in lineas:
+        fila = acumulado.setdefault((servicio_id, estado), {"reservas": set(), "cantidad": 0,
+                                                           "bruto": Decimal("0"), "descuento": Decimal("0")})
+        importe = cantidad * precio
+        fila["reservas"].add(reserva_id)
+        fila["cantidad"] += cantidad
+        fila["bruto"] += importe
+        subtotal = subtotales[reserva_id]
+        if cupon_id and subtotal > total:
+            # El descuento de la reserva se reparte proporcional al importe de cada línea
+            fila["descuento"] += (subtotal - total) * importe / subtotal
+
+    VentaDiaria.objects.filter(fecha=dia).delete()
+    VentaDiaria.objects.bulk_create([
+        VentaDiaria(fecha=dia, servicio_id=servicio_id, estado=estado, reservas=len(f["reservas"]),
+                    cantidad=f["cantidad"], total_bruto=f["bruto"].quantize(CENTAVO),
+                    descuento_cupon=f["descuento"].quantize(CENTAVO))
+        for (servicio_id, estado), f in acumulado.items()
+    ])
+    ReservasDiarias.objects.filter(fecha=dia).delete()
+    ReservasDiarias.objects.bulk_create([
+        ReservasDiarias(fecha=dia, tipo=tipo, estado=estado, reservas=len(ids))
+        for (tipo, estado), ids in distintas.items()
+    ])
+    return len(acumulado)
+
+
+def actualizar_ventas(margen=datetime.timedelta(seconds=60), completo=False):
+    """
+    Recalcula los días afectados desde la última marca de agua.
+    `margen` re-procesa un poco antes de la marca para cubrir transacciones
+    que confirmaron tarde (recalcular un día es idempotente).
+    Devuelve (días recalculados, filas de rollup escritas).
+    """
+    marca, _ = MarcaAgua.objects.get_or_create(nombre=MARCA_VENTAS)
+    hasta = timezone.now()
+    cambios = Reserva.objects.filter(updated_at__lte=hasta)
+    if marca.valor and not completo:
+        cambios = cambios.filter(updated_at__gt=marca.valor - margen)
+    tz = timezone.get_current_timezone()
+    dias = set(cambios.annotate(dia=TruncDate("created_at", tzinfo=tz)).values_list("dia", flat=True).distinct())
+    # Se sacan de la cola antes de recalcular: un borrado que confirme durante el
+    # recálculo vuelve a encolar su día y lo toma la próxima corrida
+    pendientes = list(DiaPendiente.objects.values_list("pk", "fecha"))
+    DiaPendiente.objects.filter(pk__in=[pk for pk, _ in pendientes]).delete()
+    dias |= {fecha for _, fecha in pendientes}
+    if completo:
+        dias |= set(ReservaArchivada.objects.annotate(dia=TruncDate("created_at", tzinfo=tz))
+                    .values_list("dia", flat=True).distinct())
+    dias = sorted(dias)
+
+    filas = 0
+    for dia in dias:
+        with transaction.atomic():
+            filas += recalcular_dia(dia)
+    if completo:
+        VentaDiaria.objects.exclude(fecha__in=dias).delete()
+        ReservasDiarias.objects.exclude(fecha__in=dias).delete()
+    marca.valor = hasta
+    marca.save(update_fields=["valor", "actualizado"])
+    return len(dias), filas
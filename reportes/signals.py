@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from reservas.models import Reserva
+from .models import DiaPendiente
+
+
+@receiver(post_delete, sender=Reserva)
+def encolar_dia(sender, instance, **kwargs):
+    # Una reserva borrada no deja updated_at que la marca de agua pueda ver
+    fecha = timezone.localdate(instance.created_at)
+    DiaPendiente.objects.bulk_create([DiaPendiente(fecha=fecha)], ignore_conflicts=True)
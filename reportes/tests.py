@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from authz.models import Usuario
+from cupones.models import Cupon
+from packages.common.pruebas import cliente_de, crear_servicio, crear_usuario
+from reservas.archivo import archivar
+from reservas.estados import transicionar
+from reservas.models import Reserva, ReservaServicio
+from .models import VentaDiaria
+from .rollups import actualizar_ventas
+
+
+class RollupVentasTests(TestCase):
+    def setUp(self):
+        self.tour = crear_servicio()
+        self.hotel = crear_servicio("Hotel", tipo="ALOJAMIENTO", costo=Decimal("300"))
+        usuario = Usuario.objects.create(nombre="Ana", email="ana@example.com", password_hash="x")
+        cupon = Cupon.objects.create(codigo="DESC", tipo="FIJO", valor=Decimal("40"))
+        self.reserva = Reserva.objects.create(usuario=usuario, fecha_inicio=timezone.now(), total=Decimal("460"), cupon=cupon)
+        ReservaServicio.objects.create(reserva=self.reserva, servicio=self.tour, cantidad=2, precio_unitario=Decimal("100"))
+        ReservaServicio.objects.create(reserva=self.reserva, servicio=self.hotel, cantidad=1, precio_unitario=Decimal("300"))
+
+    def test_incremental_por_estado(self):
+        self.assertEqual(actualizar_ventas(), (1, 2))
+        tour = VentaDiaria.objects.get(servicio=self.tour)
+        self.assertEqual((tour.estado, tour.reservas, tour.cantidad), ("PENDIENTE", 1, 2))
+        self.assertEqual((tour.total_bruto, tour.descuento_cupon), (Decimal("200.00"), Decimal("16.00")))
+
+        # Sin cambios: no se recalcula nada fuera del margen
+        self.assertEqual(actualizar_ventas(margen=timezone.timedelta(0)), (0, 0))
+
+        transicionar(self.reserva.pk, "pagar")
+        actualizar_ventas()
+        self.assertEqual(set(VentaDiaria.objects.values_list("estado", flat=True)), {"PAGADA"})
+
+    def test_reserva_borrada_recalcula_su_dia(self):
+        actualizar_ventas()
+        self.reserva.delete()
+        self.assertEqual(actualizar_ventas(margen=timezone.timedelta(0)), (1, 0))
+        self.assertFalse(VentaDiaria.objects.exists())
+        self.assertEqual(actualizar_ventas(margen=timezone.timedelta(0)), (0, 0))
+
+    def test_recalculo_completo_conserva_lo_archivado(self):
+        Reserva.objects.filter(pk=self.reserva.pk).update(fecha_inicio=timezone.now() - timezone.timedelta(days=730))
+        archivar(meses=12)
+        self.assertEqual(actualizar_ventas(completo=True), (1, 2))
+        self.assertEqual(VentaDiaria.objects.get(servicio=self.tour).total_bruto, Decimal("200.00"))
+
+    def test_endpoint_lee_rollups(self):
+        actualizar_ventas()
+        client = cliente_de("op@example.com")
+        self.assertEqual(client.get("/api/reportes/ventas/").status_code, 403)
+        crear_usuario("op@example.com", "ADMIN")
+        hoy = timezone.localdate().isoformat()
+        r = client.get(f"/api/reportes/ventas/?desde={hoy}&hasta={hoy}&agrupar=tipo")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(
+            [(f["tipo"], f["total_bruto"], f["total_neto"]) for f in r.data["resultados"]],
+            [("ALOJAMIENTO", "300.00", "276.00"), ("TOUR", "200.00", "184.00")],
+        )
+        self.assertEqual([f["reservas"] for f in r.data["resultados"]], [1, 1])
+        # Una reserva con dos servicios cuenta una vez por día, mes y estado
+        for agrupar in ("dia", "mes", "estado"):
+            r = client.get(f"/api/reportes/ventas/?agrupar={agrupar}")
+            self.assertEqual([(f["reservas"], f["cantidad"]) for f in r.data["resultados"]], [(1, 3)], agrupar)
+        with self.assertNumQueries(3):  # usuario + roles (EsAdmin) + el reporte
+            client.get("/api/reportes/ventas/?agrupar=servicio")
+        self.assertEqual(client.get("/api/reportes/ventas/?agrupar=x").status_code, 400)
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import reporte_ventas
+
+urlpatterns = [
+    path("ventas/", reporte_ventas, name="reporte_ventas"),
+]
@@ -0,0 +1,90 @@
+from django.db.models import Sum, F, Q
+from django.db.models.functions import TruncMonth
+from rest_framework import permissions, serializers as drf_serializers
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from authz.roles import EsAdmin
+from .models import ReservasDiarias, VentaDiaria
+
+# agrupar -> (columnas del rollup, expresiones con alias) que forman la clave
+AGRUPACIONES = {
+    "dia": (["fecha"], {}),
+    "mes": ([], {"mes": TruncMonth("fecha")}),
+    "servicio": (["servicio_id"], {"servicio_titulo": F("servicio__titulo")}),
+    "tipo": ([], {"tipo": F("servicio__tipo")}),
+    "estado": (["estado"], {}),
+}
+
+# agrupar -> (columnas, expresiones, filtro) de ReservasDiarias con la misma clave. Por servicio
+# basta sumar VentaDiaria.reservas (una reserva tiene un solo estado); en el resto una reserva
+# con varios servicios aparecería una vez por servicio, así que el conteo viene de aquí.
+CONTEO_RESERVAS = {
+    "dia": (["fecha"], {}, Q(tipo="")),
+    "mes": ([], {"mes": TruncMonth("fecha")}, Q(tipo="")),
+    "tipo": (["tipo"], {}, ~Q(tipo="")),
+    "estado": (["estado"], {}, Q(tipo="")),
+}
+
+class VentasParamsSerializer(drf_serializers.Serializer):
+    desde = drf_serializers.DateField(required=False)
+    hasta = drf_serializers.DateField(required=False)
+    agrupar = drf_serializers.ChoiceField(choices=list(AGRUPACIONES), default="dia")
+    estado = drf_serializers.ChoiceField(choices=[e for e, _ in VentaDiaria.ESTADO], required=False)
+
+    def validate(self, attrs):
+        if attrs.get("desde") and attrs.get("hasta") and attrs["desde"] > attrs["hasta"]:
+            raise drf_serializers.ValidationError({"hasta": "Debe ser posterior o igual a 'desde'."})
+        return attrs
+
+def _filtrar(qs, p):
+    if p.get("desde"):
+        qs = qs.filter(fecha__gte=p["desde"])
+    if p.get("hasta"):
+        qs = qs.filter(fecha__lte=p["hasta"])
+    if p.get("estado"):
+        qs = qs.filter(estado=p["estado"])
+    return qs
+
+@extend_schema(
+    summary="Reporte de ventas",
+    description="Ventas agregadas desde los rollups diarios (día de creación × servicio × estado). "
+                "No recorre reservas: los rollups se actualizan con `manage.py actualizar_reportes`. "
+                "Solo ADMIN.",
+    parameters=[
+        OpenApiParameter("desde", str, description="YYYY-MM-DD (inclusive)"),
+        OpenApiParameter("hasta", str, description="YYYY-MM-DD (inclusive)"),
+        OpenApiParameter("agrupar", str, enum=list(AGRUPACIONES)),
+        OpenApiParameter("estado", str),
+    ],
+)
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated, EsAdmin])
+def reporte_ventas(request):
+    params = VentasParamsSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    p = params.validated_data
+
+    campos, expresiones = AGRUPACIONES[p["agrupar"]]
+    filas = (_filtrar(VentaDiaria.objects.all(), p).values(*campos, **expresiones)
+             .annotate(reservas=Sum("reservas"), cantidad=Sum("cantidad"),
+                       total_bruto=Sum("total_bruto"), descuento_cupon=Sum("descuento_cupon"))
+             .order_by(*campos, *expresiones))
+    if p["agrupar"] in CONTEO_RESERVAS:
+        c_campos, c_expresiones, filtro = CONTEO_RESERVAS[p["agrupar"]]
+        clave = [*c_campos, *c_expresiones]
+        conteos = {
+            tuple(c[k] for k in clave): c["n"]
+            for c in _filtrar(ReservasDiarias.objects.filter(filtro), p)
+            .values(*c_campos, **c_expresiones).annotate(n=Sum("reservas")).order_by()
+        }
+        filas = list(filas)
+        for f in filas:
+            f["reservas"] = conteos.get(tuple(f[k] for k in clave), 0)
+    resultados = []
+    for f in filas:
+        f["total_neto"] = f["total_bruto"] - f["descuento_cupon"]
+        for campo in ("total_bruto", "descuento_cupon", "total_neto"):
+            f[campo] = f"{f[campo]:.2f}"
+        resultados.append(f)
+    return Response({"agrupar": p["agrupar"], "resultados": resultados})
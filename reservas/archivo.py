@@ -0,0 +1,109 @@
+"""
+Archivo de reservas históricas.
+
+Las reservas con `fecha_inicio` anterior a RESERVA_ARCHIVO_MESES meses se
+mueven, con sus detalles y visitantes, a las tablas *Archivada (mismas
+columnas y mismos ids). Así las tablas vivas, y sus índices, solo cargan lo
+que todavía puede cambiar de estado.
+
+Cada lote es una transacción: elige hasta `lote` ids por `fecha_inicio`
+(con `FOR UPDATE SKIP LOCKED` en PostgreSQL, para no pelear con una
+transición en curso), copia con `INSERT ... SELECT` y borra con DELETE por
+id. El borrado es SQL directo a propósito: no dispara post_delete, así que
+el feed de sincronización no publica bajas de reservas que siguen
+existiendo (ahora en el archivo).
+
+`ReservaViewSet` consulta el archivo solo si el rango pedido llega hasta
+fechas archivadas (ver `rango_toca_archivo`).
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import (
+    Reserva, ReservaArchivada, ReservaServicio, ReservaServicioArchivada,
+    ReservaVisitante, ReservaVisitanteArchivada,
+)
+
+logger = logging.getLogger(__name__)
+
+# (tabla viva, tabla de archivo, columna con el id de la reserva); padres al final al copiar
+TABLAS = (
+    (Reserva, ReservaArchivada, "id"),
+    (ReservaServicio, ReservaServicioArchivada, "reserva_id"),
+    (ReservaVisitante, ReservaVisitanteArchivada, "reserva_id"),
+)
+
+
+def fecha_corte(meses=None):
+    meses = meses if meses is not None else getattr(settings, "RESERVA_ARCHIVO_MESES", 18)
+    # Meses de 30 días: el corte no necesita precisión de calendario
+    return timezone.now() - timedelta(days=30 * meses)
+
+
+def _copiar(origen, destino, columna, ids, ahora):
+    qn = connection.ops.quote_name
+    columnas = [f.column for f in destino._meta.concrete_fields if f.name != "archivada_en"]
+    lista = ", ".join(qn(c) for c in columnas)
+    marcas = ", ".join(["%s"] * len(ids))
+    extra = ", " + qn("archivada_en") if destino is ReservaArchivada else ""
+    valor_extra = ", %s" if extra else ""
+    sql = (f"INSERT INTO {qn(destino._meta.db_table)} ({lista}{extra}) "
+           f"SELECT {lista}{valor_extra} FROM {qn(origen._meta.db_table)} WHERE {qn(columna)} IN ({marcas})")
+    with connection.cursor() as c:
+        c.execute(sql, ([ahora] if extra else []) + list(ids))
+
+
+def _borrar(modelo, columna, ids):
+    qn = connection.ops.quote_name
+    marcas = ", ".join(["%s"] * len(ids))
+    with connection.cursor() as c:
+        c.execute(f"DELETE FROM {qn(modelo._meta.db_table)} WHERE {qn(columna)} IN ({marcas})", list(ids))
+
+
+def _archivar_lote(corte, lote):
+    with transaction.atomic():
+        ids = list(
+            Reserva.objects.filter(fecha_inicio__lt=corte)
+            .order_by("fecha_inicio")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", flat=True)[:lote]
+        )
+        if not ids:
+            return 0
+        ahora = timezone.now()
+        for origen, destino, columna in TABLAS:
+            _copiar(origen, destino, columna, ids, ahora)
+        for origen, _, columna in reversed(TABLAS):
+            _borrar(origen, columna, ids)
+    return len(ids)
+
+
+def archivar(meses=None, lote=None, max_lotes=None):
+    """Mueve al archivo las reservas con fecha_inicio anterior al corte. Devuelve (reservas, lotes)."""
+    lote = lote or getattr(settings, "RESERVA_ARCHIVO_LOTE", 500)
+    corte = fecha_corte(meses)
+    archivadas = lotes = 0
+    while max_lotes is None or lotes < max_lotes:
+        n = _archivar_lote(corte, lote)
+        if n == 0:
+            break
+        lotes += 1
+        archivadas += n
+        if n < lote:
+            break
+    logger.info("archivo de reservas: %s reservas en %s lote(s), corte %s", archivadas, lotes, corte)
+    return archivadas, lotes
+
+
+def rango_toca_archivo(inicio):
+    """
+    ¿Un rango que empieza en `inicio` (None = sin límite) puede incluir
+    reservas archivadas? Una sola lectura del índice de fecha_inicio.
+    """
+    ultima = ReservaArchivada.objects.aggregate(m=Max("fecha_inicio"))["m"]
+    return ultima is not None and (inicio is None or inicio <= ultima)
@@ -0,0 +1,54 @@
+"""
+Máquina de estados de Reserva con control de concurrencia optimista.
+
+Cada transición es un único `UPDATE ... WHERE id=%s AND estado=<esperado> AND version=<v>`;
+si otra petición cambió la reserva entre la lectura y la escritura, el UPDATE
+afecta 0 filas y se informa un conflicto en lugar de pisar el cambio.
+No se toman bloqueos de fila.
+"""
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Reserva
+
+# accion -> (estados de origen permitidos, estado destino)
+TRANSICIONES = {
+    "pagar": ({"PENDIENTE"}, "PAGADA"),
+    "cancelar": ({"PENDIENTE", "PAGADA", "REPROGRAMADA"}, "CANCELADA"),
+    "reprogramar": ({"PENDIENTE", "PAGADA", "REPROGRAMADA"}, "REPROGRAMADA"),
+    # Solo la usa el barrido (reservas.expiracion), en lotes
+    "expirar": ({"PENDIENTE"}, "EXPIRADA"),
+}
+
+
+class TransicionInvalida(Exception):
+    pass
+
+
+class ConflictoConcurrencia(Exception):
+    pass
+
+
+def transicionar(reserva_id, accion, version=None, **cambios):
+    """
+    Aplica `accion` a la reserva. Si se pasa `version`, debe coincidir con la
+    actual (el cliente actúa sobre lo que vio); si no, se usa la leída aquí.
+    `cambios` son columnas extra a escribir en el mismo UPDATE (p. ej. fecha_inicio).
+    Devuelve la reserva actualizada.
+    """
+    origenes, destino = TRANSICIONES[accion]
+    actual = Reserva.objects.filter(pk=reserva_id).values("estado", "version").first()
+    if actual is None:
+        raise Reserva.DoesNotExist
+    esperada = actual["version"] if version is None else int(version)
+    if actual["version"] != esperada:
+        raise ConflictoConcurrencia(f"La reserva cambió (versión actual {actual['version']}).")
+    if actual["estado"] not in origenes:
+        raise TransicionInvalida(f"No se puede {accion} una reserva {actual['estado']}.")
+
+    filas = Reserva.objects.filter(pk=reserva_id, estado=actual["estado"], version=esperada).update(
+        estado=destino, version=F("version") + 1, updated_at=timezone.now(), **cambios
+    )
+    if filas == 0:
+        raise ConflictoConcurrencia("La reserva fue modificada por otra operación; vuelve a intentarlo.")
+    return Reserva.objects.get(pk=reserva_id)
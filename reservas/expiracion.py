@@ -0,0 +1,101 @@
+"""
+Barrido de reservas PENDIENTE vencidas.
+
+Una reserva que nadie paga dentro de RESERVA_RETENCION_MIN (editable en
+caliente vía packages.admin_config) pasa a EXPIRADA.
+El cupo de una reserva es la suma de sus detalles mientras esté en un estado
+que ocupa (ver ESTADOS_QUE_OCUPAN); el mismo UPDATE que la expira lo libera.
+
+Cada lote es una transacción que elige hasta `lote` ids por el índice
+parcial `reserva_pendiente_idx` con `FOR UPDATE SKIP LOCKED` (en PostgreSQL),
+de modo que varios barredores, o un barrido y un pago en curso, no se
+bloquean entre sí: la fila que otro tiene tomada se deja para la próxima
+pasada. El UPDATE vuelve a exigir estado PENDIENTE, así que un pago que
+confirmó justo antes gana.
+
+Se ejecuta con `manage.py expirar_reservas` (cron) o, con
+RESERVA_BARRIDO_ASGI, en un bucle asyncio dentro de cada worker ASGI
+(`bucle_barrido`, ver backend/asgi.py y core.ciclo_vida).
+"""
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from packages.admin_config.use_cases import configuracion
+from .estados import TRANSICIONES
+from .models import BarridoExpiracion, Reserva
+
+logger = logging.getLogger(__name__)
+
+ESTADOS_QUE_OCUPAN = ("PENDIENTE", "PAGADA", "REPROGRAMADA")
+
+
+def _expirar_lote(limite, lote):
+    _, destino = TRANSICIONES["expirar"]
+    with transaction.atomic():
+        # estado="PENDIENTE" literal: así el planner usa el índice parcial
+        ids = list(
+            Reserva.objects.filter(estado="PENDIENTE", created_at__lt=limite)
+            .order_by("created_at")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", flat=True)[:lote]
+        )
+        if not ids:
+            return 0, 0
+        expiradas = Reserva.objects.filter(pk__in=ids, estado="PENDIENTE").update(
+            estado=destino, version=F("version") + 1, updated_at=timezone.now()
+        )
+    return len(ids), expiradas
+
+
+def barrer(retencion=None, lote=None, max_lotes=None):
+    """Expira las PENDIENTE creadas antes de ahora - retención. Devuelve el BarridoExpiracion."""
+    # timedelta(0) es una retención válida: expira todas las PENDIENTE ya creadas
+    if retencion is None:
+        retencion = timedelta(
+            minutes=configuracion.entero("RESERVA_RETENCION_MIN", getattr(settings, "RESERVA_RETENCION_MIN", 30)))
+    if lote is None:
+        lote = getattr(settings, "RESERVA_BARRIDO_LOTE", 500)
+    inicio = time.perf_counter()
+    limite = timezone.now() - retencion
+    expiradas = lotes = 0
+    while max_lotes is None or lotes < max_lotes:
+        elegidas, n = _expirar_lote(limite, lote)
+        if elegidas == 0:
+            break
+        lotes += 1
+        expiradas += n
+        if elegidas < lote:
+            break
+    barrido = BarridoExpiracion.objects.create(
+        creadas_antes_de=limite, expiradas=expiradas, lotes=lotes,
+        duracion_ms=round((time.perf_counter() - inicio) * 1000),
+    )
+    logger.info("barrido de reservas: %s expiradas en %s lote(s), %s ms", expiradas, lotes, barrido.duracion_ms)
+    return barrido
+
+
+def _barrer_en_hilo():
+    close_old_connections()
+    try:
+        return barrer()
+    finally:
+        close_old_connections()
+
+
+async def bucle_barrido(intervalo):
+    while True:
+        try:
+            # Hilo propio: no ocupa el hilo que atiende las vistas síncronas
+            await sync_to_async(_barrer_en_hilo, thread_sensitive=False)()
+        except Exception:
+            logger.exception("falló el barrido de reservas")
+        await asyncio.sleep(intervalo)
+
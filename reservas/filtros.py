@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+from packages.common.filtros import FilterSet, RangoCreacionMixin
+from .models import Reserva
+
+
+class ReservaFilterSet(RangoCreacionMixin, FilterSet):
+    """
+    ?desde=&hasta= sobre `fecha_inicio` (días inclusivos) y ?estado=.
+    `incluir_archivo` y `limite_archivo` no filtran: deciden si el listado
+    suma reservas archivadas y cuántas como máximo (ver ReservaViewSet.list).
+    """
+    campo_fecha = "fecha_inicio"
+    estado = serializers.ChoiceField(choices=Reserva.ESTADO, required=False)
+    incluir_archivo = serializers.BooleanField(required=False, default=False)
+    limite_archivo = serializers.IntegerField(required=False, default=100, min_value=1, max_value=1000)
+
+    def filtrar_estado(self, qs, valor):
+        return qs.filter(estado=valor)
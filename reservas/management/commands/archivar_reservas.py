@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from reservas.archivo import archivar, fecha_corte
+
+
+class Command(BaseCommand):
+    help = "Mueve al archivo las reservas (con detalles y visitantes) cuya fecha_inicio es anterior a N meses."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--meses", type=int, help="antigüedad mínima (defecto: RESERVA_ARCHIVO_MESES)")
+        parser.add_argument("--lote", type=int, help="reservas por transacción (defecto: RESERVA_ARCHIVO_LOTE)")
+        parser.add_argument("--max-lotes", type=int, help="cortar tras N lotes (para acotar cada corrida)")
+
+    def handle(self, *args, **o):
+        reservas, lotes = archivar(meses=o["meses"], lote=o["lote"], max_lotes=o["max_lotes"])
+        self.stdout.write(self.style.SUCCESS(
+            f"{reservas} reserva(s) archivadas en {lotes} lote(s); corte {fecha_corte(o['meses']):%Y-%m-%d}"))
@@ -0,0 +1,19 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from reservas.expiracion import barrer
+
+
+class Command(BaseCommand):
+    help = "Pasa a EXPIRADA las reservas PENDIENTE más viejas que la retención (liberando su cupo)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--retencion-min", type=int, help="minutos de retención (defecto: RESERVA_RETENCION_MIN)")
+        parser.add_argument("--lote", type=int, help="reservas por transacción (defecto: RESERVA_BARRIDO_LOTE)")
+
+    def handle(self, *args, **o):
+        retencion = timedelta(minutes=o["retencion_min"]) if o["retencion_min"] is not None else None
+        b = barrer(retencion=retencion, lote=o["lote"])
+        self.stdout.write(self.style.SUCCESS(
+            f"{b.expiradas} reserva(s) expiradas en {b.lotes} lote(s), {b.duracion_ms} ms"))
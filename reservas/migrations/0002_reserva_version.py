@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservas', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reserva',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authz', '0003_indices_parciales'),
+        ('cupones', '0002_indices_parciales'),
+        ('reservas', '0002_reserva_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reserva',
+            index=models.Index(fields=['updated_at'], name='reserva_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reserva',
+            index=models.Index(fields=['created_at'], name='reserva_created_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authz', '0003_indices_parciales'),
+        ('cupones', '0002_indices_parciales'),
+        ('reservas', '0004_indices_sync'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BarridoExpiracion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ejecutado_en', models.DateTimeField(auto_now_add=True)),
+                ('creadas_antes_de', models.DateTimeField()),
+                ('expiradas', models.PositiveIntegerField(default=0)),
+                ('lotes', models.PositiveIntegerField(default=0)),
+                ('duracion_ms', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='reserva',
+            name='estado',
+            field=models.CharField(choices=[('PENDIENTE', 'PENDIENTE'), ('PAGADA', 'PAGADA'), ('CANCELADA', 'CANCELADA'), ('REPROGRAMADA', 'REPROGRAMADA'), ('EXPIRADA', 'EXPIRADA')], default='PENDIENTE', max_length=12),
+        ),
+        migrations.AddIndex(
+            model_name='reserva',
+            index=models.Index(condition=models.Q(('estado', 'PENDIENTE')), fields=['created_at'], name='reserva_pendiente_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='barridoexpiracion',
+            index=models.Index(fields=['ejecutado_en'], name='reservas_ba_ejecuta_2dd67b_idx'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authz', '0003_indices_parciales'),
+        ('catalogo', '0003_indices_sync'),
+        ('cupones', '0002_indices_parciales'),
+        ('reservas', '0005_expiracion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReservaArchivada',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('fecha_inicio', models.DateTimeField()),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'PENDIENTE'), ('PAGADA', 'PAGADA'), ('CANCELADA', 'CANCELADA'), ('REPROGRAMADA', 'REPROGRAMADA'), ('EXPIRADA', 'EXPIRADA')], max_length=12)),
+                ('total', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('moneda', models.CharField(max_length=3)),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archivada_en', models.DateTimeField(auto_now_add=True)),
+                ('cupon', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='cupones.cupon')),
+                ('usuario', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='authz.usuario')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ReservaServicioArchivada',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('cantidad', models.PositiveSmallIntegerField(default=1)),
+                ('precio_unitario', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('fecha_servicio', models.DateTimeField(blank=True, null=True)),
+                ('reserva', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='detalles', to='reservas.reservaarchivada')),
+                ('servicio', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='catalogo.servicio')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ReservaVisitanteArchivada',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('estado', models.CharField(choices=[('CONFIRMADO', 'CONFIRMADO'), ('CANCELADO', 'CANCELADO')], max_length=10)),
+                ('es_titular', models.BooleanField(default=False)),
+                ('reserva', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='visitantes', to='reservas.reservaarchivada')),
+                ('visitante', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='reservas.visitante')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='reservaarchivada',
+            index=models.Index(fields=['fecha_inicio'], name='reserva_arch_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservaarchivada',
+            index=models.Index(fields=['usuario'], name='reserva_arch_usuario_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservaarchivada',
+            index=models.Index(fields=['created_at'], name='reserva_arch_created_idx'),
+        ),
+    ]
@@ -5,15 +5,36 @@ from catalogo.models import Servicio
 from cupones.models import Cupon
 
 class Reserva(TimeStampedModel):
-    ESTADO = (("PENDIENTE","PENDIENTE"),("PAGADA","PAGADA"),("CANCELADA","CANCELADA"),("REPROGRAMADA","REPROGRAMADA"))
+    ESTADO = (("PENDIENTE","PENDIENTE"),("PAGADA","PAGADA"),("CANCELADA","CANCELADA"),("REPROGRAMADA","REPROGRAMADA"),("EXPIRADA","EXPIRADA"))
     usuario = models.ForeignKey(Usuario, on_delete=models.RESTRICT, related_name="reservas")
     fecha_inicio = models.DateTimeField()
     estado = models.CharField(max_length=12, choices=ESTADO, default="PENDIENTE")
     cupon = models.ForeignKey(Cupon, on_delete=models.SET_NULL, null=True, blank=True, related_name="reservas")
     total = models.DecimalField(max_digits=12, decimal_places=2)
     moneda = models.CharField(max_length=3, default="BOB")
+    # Control de concurrencia optimista: cada transición de estado la incrementa
+    version = models.PositiveIntegerField(default=0)
     class Meta:
-        indexes = [models.Index(fields=["usuario"]), models.Index(fields=["estado"])]
+        indexes = [
+            models.Index(fields=["usuario"]), models.Index(fields=["estado"]),
+            # Procesos incrementales (rollups de reportes) y rangos por día de creación
+            models.Index(fields=["updated_at"], name="reserva_updated_idx"),
+            models.Index(fields=["created_at"], name="reserva_created_idx"),
+            # Feed de sincronización: reservas de un usuario por fecha de cambio
+            models.Index(fields=["usuario", "updated_at"], name="reserva_usuario_updated_idx"),
+            # Barrido de expiración: solo las PENDIENTE, en orden de antigüedad
+            models.Index(fields=["created_at"], condition=models.Q(estado="PENDIENTE"), name="reserva_pendiente_idx"),
+        ]
+
+class BarridoExpiracion(models.Model):
+    """Métricas de cada pasada de reservas.expiracion.barrer()."""
+    ejecutado_en = models.DateTimeField(auto_now_add=True)
+    creadas_antes_de = models.DateTimeField()
+    expiradas = models.PositiveIntegerField(default=0)
+    lotes = models.PositiveIntegerField(default=0)
+    duracion_ms = models.PositiveIntegerField(default=0)
+    class Meta:
+        indexes = [models.Index(fields=["ejecutado_en"])]
 
 class ReservaServicio(models.Model):
     reserva = models.ForeignKey(Reserva, on_delete=models.CASCADE, related_name="detalles")
@@ -32,6 +53,8 @@ class Visitante(TimeStampedModel):
     nacionalidad = models.CharField(max_length=50, blank=True, null=True)
     email = models.EmailField(max_length=191, blank=True, null=True)
     telefono = models.CharField(max_length=25, blank=True, null=True)
+    class Meta:
+        indexes = [models.Index(fields=["updated_at"], name="visitante_updated_idx")]
 
 class ReservaVisitante(models.Model):
     ESTADO = (("CONFIRMADO","CONFIRMADO"),("CANCELADO","CANCELADO"))
@@ -49,3 +72,43 @@ class ReservaVisitante(models.Model):
                 name="uq_un_titular_por_reserva",
             ),
         ]
+
+
+# --- Archivo histórico (reservas.archivo) ---
+# Mismas columnas e ids que las tablas vivas; las FK a usuario/cupón/servicio/visitante
+# no llevan restricción en BD para no impedir borrar datos maestros por historia.
+
+class ReservaArchivada(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    usuario = models.ForeignKey(Usuario, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+")
+    fecha_inicio = models.DateTimeField()
+    estado = models.CharField(max_length=12, choices=Reserva.ESTADO)
+    cupon = models.ForeignKey(Cupon, on_delete=models.DO_NOTHING, db_constraint=False, null=True, blank=True, related_name="+")
+    total = models.DecimalField(max_digits=12, decimal_places=2)
+    moneda = models.CharField(max_length=3)
+    version = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archivada_en = models.DateTimeField(auto_now_add=True)
+    class Meta:
+        indexes = [
+            models.Index(fields=["fecha_inicio"], name="reserva_arch_fecha_idx"),
+            models.Index(fields=["usuario"], name="reserva_arch_usuario_idx"),
+            # Rollups de reportes: recalcular un día de creación incluye lo archivado
+            models.Index(fields=["created_at"], name="reserva_arch_created_idx"),
+        ]
+
+class ReservaServicioArchivada(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    reserva = models.ForeignKey(ReservaArchivada, on_delete=models.CASCADE, related_name="detalles")
+    servicio = models.ForeignKey(Servicio, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+")
+    cantidad = models.PositiveSmallIntegerField(default=1)
+    precio_unitario = models.DecimalField(max_digits=12, decimal_places=2)
+    fecha_servicio = models.DateTimeField(blank=True, null=True)
+
+class ReservaVisitanteArchivada(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    reserva = models.ForeignKey(ReservaArchivada, on_delete=models.CASCADE, related_name="visitantes")
+    visitante = models.ForeignKey(Visitante, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+")
+    estado = models.CharField(max_length=10, choices=ReservaVisitante.ESTADO)
+    es_titular = models.BooleanField(default=False)
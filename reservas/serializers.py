@@ -1,15 +1,17 @@
 from rest_framework import serializers
-from .models import Reserva, ReservaServicio, Visitante, ReservaVisitante
+from core.serializers import ListaRapidaMixin
+from core.trazas import SerializerTrazadoMixin
+from .models import Reserva, ReservaArchivada, ReservaServicio, ReservaServicioArchivada, Visitante, ReservaVisitante
 
 class ReservaServicioSerializer(serializers.ModelSerializer):
     class Meta: model = ReservaServicio; fields = ["servicio","cantidad","precio_unitario","fecha_servicio"]
 
-class ReservaSerializer(serializers.ModelSerializer):
+class ReservaSerializer(SerializerTrazadoMixin, ListaRapidaMixin, serializers.ModelSerializer):
     detalles = ReservaServicioSerializer(many=True)
     class Meta:
         model = Reserva
-        fields = ["id","usuario","fecha_inicio","estado","cupon","total","moneda","detalles","created_at","updated_at"]
-        read_only_fields = ["estado"]
+        fields = ["id","usuario","fecha_inicio","estado","version","cupon","total","moneda","detalles","created_at","updated_at"]
+        read_only_fields = ["estado","version"]
 
     def create(self, validated_data):
         detalles = validated_data.pop("detalles", [])
@@ -18,8 +20,19 @@ class ReservaSerializer(serializers.ModelSerializer):
             ReservaServicio.objects.create(reserva=reserva, **d)
         return reserva
 
-class VisitanteSerializer(serializers.ModelSerializer):
+class ReservaServicioArchivadaSerializer(ReservaServicioSerializer):
+    class Meta(ReservaServicioSerializer.Meta): model = ReservaServicioArchivada
+
+class ReservaArchivadaSerializer(ListaRapidaMixin, serializers.ModelSerializer):
+    """Misma salida que ReservaSerializer, de solo lectura, sobre el archivo."""
+    detalles = ReservaServicioArchivadaSerializer(many=True, read_only=True)
+    class Meta:
+        model = ReservaArchivada
+        fields = ReservaSerializer.Meta.fields
+        read_only_fields = fields
+
+class VisitanteSerializer(SerializerTrazadoMixin, serializers.ModelSerializer):
     class Meta: model = Visitante; fields = "__all__"
 
-class ReservaVisitanteSerializer(serializers.ModelSerializer):
+class ReservaVisitanteSerializer(SerializerTrazadoMixin, serializers.ModelSerializer):
     class Meta: model = ReservaVisitante; fields = ["reserva","visitante","estado","es_titular"]
\ No newline at end of file
@@ -1,3 +1,192 @@
-from django.test import TestCase
+import io
+import threading
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from authz.models import Usuario
+from packages.common.consultas import query_budget
+from packages.common.pruebas import cliente_de, crear_servicio
+from sincronizacion.models import Baja
+from .archivo import archivar
+from .estados import transicionar, TransicionInvalida, ConflictoConcurrencia
+from .expiracion import barrer
+from .models import (
+    BarridoExpiracion, Reserva, ReservaArchivada, ReservaServicio, ReservaServicioArchivada,
+    ReservaVisitante, ReservaVisitanteArchivada, Visitante,
+)
+
+
+def crear_reserva():
+    u = Usuario.objects.create(nombre="Ana", email=f"ana{Usuario.objects.count()}@example.com", password_hash="x")
+    return Reserva.objects.create(usuario=u, fecha_inicio=timezone.now(), total=Decimal("100"))
+
+
+class TransicionesReservaTests(TestCase):
+    def setUp(self):
+        self.reserva = crear_reserva()
+        self.client = cliente_de("op@example.com")
+
+    def test_pagar_y_cancelar(self):
+        r = self.client.post(f"/api/reservas/{self.reserva.pk}/pagar/", {"version": 0}, format="json")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual((r.data["estado"], r.data["version"]), ("PAGADA", 1))
+        r = self.client.post(f"/api/reservas/{self.reserva.pk}/pagar/", format="json")
+        self.assertEqual(r.status_code, 400)
+        r = self.client.post(f"/api/reservas/{self.reserva.pk}/cancelar/", format="json")
+        self.assertEqual((r.status_code, r.data["estado"]), (200, "CANCELADA"))
+
+    def test_version_obsoleta_es_conflicto(self):
+        transicionar(self.reserva.pk, "pagar")
+        r = self.client.post(f"/api/reservas/{self.reserva.pk}/cancelar/", {"version": 0}, format="json")
+        self.assertEqual(r.status_code, 409)
+        self.assertEqual(Reserva.objects.get(pk=self.reserva.pk).estado, "PAGADA")
+
+    def test_editar_incrementa_la_version(self):
+        r = self.client.patch(f"/api/reservas/{self.reserva.pk}/", {"fecha_inicio": "2030-02-01T10:00:00-04:00"},
+                              format="json")
+        self.assertEqual((r.status_code, r.data["version"]), (200, 1))
+        # Quien leyó la reserva antes de la edición no la pisa
+        r = self.client.post(f"/api/reservas/{self.reserva.pk}/reprogramar/",
+                             {"version": 0, "fecha_inicio": "2030-03-01T10:00:00-04:00"}, format="json")
+        self.assertEqual(r.status_code, 409)
+        self.assertEqual(Reserva.objects.get(pk=self.reserva.pk).fecha_inicio.month, 2)
+
+    def test_reprogramar(self):
+        nueva = "2030-01-15T09:00:00-04:00"
+        r = self.client.post(f"/api/reservas/{self.reserva.pk}/reprogramar/", {"fecha_inicio": nueva}, format="json")
+        self.assertEqual((r.status_code, r.data["estado"]), (200, "REPROGRAMADA"))
+        self.assertEqual(r.data["fecha_inicio"], nueva)
+        r = self.client.post(f"/api/reservas/{self.reserva.pk}/reprogramar/", {}, format="json")
+        self.assertEqual(r.status_code, 400)
+
+
+class ConcurrenciaReservaTests(TransactionTestCase):
+    def test_transiciones_paralelas(self):
+        """Pago y cancelación simultáneos sobre la misma versión: exactamente uno gana."""
+        reserva = crear_reserva()
+        hilos = 8
+        barrera = threading.Barrier(hilos)
+        resultados = []
+
+        def intentar(accion):
+            try:
+                barrera.wait()
+                transicionar(reserva.pk, accion, version=0)
+                resultados.append("ok")
+            except (ConflictoConcurrencia, TransicionInvalida):
+                resultados.append("rechazada")
+            finally:
+                connection.close()
+
+        ts = [threading.Thread(target=intentar, args=("pagar" if i % 2 else "cancelar",)) for i in range(hilos)]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+
+        self.assertEqual(resultados.count("ok"), 1)
+        self.assertEqual(resultados.count("rechazada"), hilos - 1)
+        self.assertEqual(Reserva.objects.get(pk=reserva.pk).version, 1)
+
+
+class ExpiracionReservasTests(TestCase):
+    def test_barrido_expira_solo_pendientes_vencidas(self):
+        viejas = [crear_reserva() for _ in range(3)]
+        pagada = crear_reserva()
+        transicionar(pagada.pk, "pagar")
+        nueva = crear_reserva()
+        hace_una_hora = timezone.now() - timedelta(hours=1)
+        Reserva.objects.filter(pk__in=[r.pk for r in viejas] + [pagada.pk]).update(created_at=hace_una_hora)
+
+        barrido = barrer(retencion=timedelta(minutes=30), lote=2)
+        self.assertEqual((barrido.expiradas, barrido.lotes), (3, 2))
+        self.assertEqual(BarridoExpiracion.objects.count(), 1)
+        estados = dict(Reserva.objects.values_list("pk", "estado"))
+        self.assertEqual({estados[r.pk] for r in viejas}, {"EXPIRADA"})
+        self.assertEqual((estados[pagada.pk], estados[nueva.pk]), ("PAGADA", "PENDIENTE"))
+        self.assertEqual(Reserva.objects.get(pk=viejas[0].pk).version, 1)
+
+        # Una expirada ya no se puede pagar
+        with self.assertRaises(TransicionInvalida):
+            transicionar(viejas[0].pk, "pagar")
+
+    def test_retencion_cero_expira_todas_las_pendientes(self):
+        reservas = [crear_reserva() for _ in range(2)]
+        call_command("expirar_reservas", "--retencion-min", "0", stdout=io.StringIO())
+        self.assertEqual(set(Reserva.objects.filter(pk__in=[r.pk for r in reservas])
+                             .values_list("estado", flat=True)), {"EXPIRADA"})
+
+
+class ListadoReservasTests(TestCase):
+    def test_listado_sin_n_mas_1(self):
+        tour = crear_servicio()
+        for _ in range(5):
+            ReservaServicio.objects.create(reserva=crear_reserva(), servicio=tour, cantidad=1,
+                                           precio_unitario=Decimal("100"))
+        client = cliente_de("op@example.com")
+        with query_budget(3):  # reservas + detalles + máximo del archivo
+            r = client.get("/api/reservas/")
+        self.assertEqual([len(x["detalles"]) for x in r.data], [1] * 5)
+
+
+class ArchivoReservasTests(TestCase):
+    def setUp(self):
+        tour = crear_servicio()
+        visitante = Visitante.objects.create(documento="123", nombre="Ana", apellido="Paz",
+                                             fecha_nacimiento="1990-01-01")
+        self.viejas = [crear_reserva() for _ in range(3)]
+        for r in self.viejas:
+            ReservaServicio.objects.create(reserva=r, servicio=tour, cantidad=2, precio_unitario=Decimal("50"))
+            ReservaVisitante.objects.create(reserva=r, visitante=visitante, es_titular=True)
+        hace_dos_anios = timezone.now() - timedelta(days=730)
+        Reserva.objects.filter(pk__in=[r.pk for r in self.viejas]).update(fecha_inicio=hace_dos_anios)
+        self.nueva = crear_reserva()
+        self.client = cliente_de("op@example.com")
+
+    def test_mueve_por_lotes_con_hijos(self):
+        self.assertEqual(archivar(meses=12, lote=2), (3, 2))
+        self.assertEqual(list(Reserva.objects.values_list("pk", flat=True)), [self.nueva.pk])
+        self.assertEqual(ReservaArchivada.objects.count(), 3)
+        self.assertEqual(ReservaServicioArchivada.objects.count(), 3)
+        self.assertEqual(ReservaVisitanteArchivada.objects.count(), 3)
+        self.assertFalse(ReservaServicio.objects.exists() or ReservaVisitante.objects.exists())
+        # Archivar no es borrar: el feed de sincronización no publica bajas
+        self.assertFalse(Baja.objects.exists())
+        self.assertEqual(archivar(meses=12), (0, 0))
+
+    def test_vista_consulta_archivo_solo_si_el_rango_lo_pide(self):
+        archivar(meses=12)
+        hoy = timezone.localdate()
+        with self.assertNumQueries(3):  # reservas + detalles + máximo del archivo
+            r = self.client.get("/api/reservas/", {"desde": hoy.isoformat()})
+        self.assertEqual([x["id"] for x in r.data], [self.nueva.pk])
+
+        # Sin `desde` ni incluir_archivo el listado no toca el archivo
+        with self.assertNumQueries(2):
+            r = self.client.get("/api/reservas/")
+        self.assertEqual([x["id"] for x in r.data], [self.nueva.pk])
+
+        r = self.client.get("/api/reservas/", {"incluir_archivo": "1"})
+        self.assertEqual([x["id"] for x in r.data], [self.nueva.pk] + sorted((v.pk for v in self.viejas), reverse=True))
+        archivada = next(x for x in r.data if x["id"] == self.viejas[0].pk)
+        self.assertEqual(archivada["detalles"][0]["cantidad"], 2)
+        self.assertNotIn("X-Archivo-Truncado", r)
+
+        r = self.client.get("/api/reservas/", {"incluir_archivo": "1", "limite_archivo": 2})
+        self.assertEqual(len(r.data), 3)
+        self.assertEqual(r["X-Archivo-Truncado"], "true")
+
+        hace_un_anio = (hoy - timedelta(days=365)).isoformat()
+        with override_settings(LISTA_RAPIDA=True):
+            rapida = self.client.get("/api/reservas/", {"desde": "2000-01-01", "hasta": hace_un_anio})
+        self.assertEqual(sorted(x["id"] for x in rapida.data), sorted(v.pk for v in self.viejas))
+
+        r = self.client.get(f"/api/reservas/{self.viejas[0].pk}/")
+        self.assertEqual((r.status_code, r.data["total"]), (200, "100.00"))
+        r = self.client.post(f"/api/reservas/{self.viejas[0].pk}/pagar/", format="json")
+        self.assertEqual(r.status_code, 404)
@@ -1,8 +1,27 @@
-from rest_framework import viewsets, permissions
-from .models import Reserva, Visitante, ReservaVisitante
-from .serializers import ReservaSerializer, VisitanteSerializer, ReservaVisitanteSerializer
+from django.conf import settings
+from django.db.models import F
+from django.http import Http404
+from django.utils.dateparse import parse_datetime
+from rest_framework import viewsets, permissions, status
+from rest_framework import serializers as drf_serializers
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiParameter, OpenApiResponse
+from core.idempotencia import idempotente
+from core.serializers import ListaRapidaViewSetMixin
+from packages.common.filtros import rango_fechas
+from .archivo import rango_toca_archivo
+from .filtros import ReservaFilterSet
+from .models import Reserva, ReservaArchivada, Visitante, ReservaVisitante
+from .serializers import ReservaSerializer, ReservaArchivadaSerializer, VisitanteSerializer, ReservaVisitanteSerializer
+from .estados import transicionar, TransicionInvalida, ConflictoConcurrencia
 
-class ReservaViewSet(viewsets.ModelViewSet):
+def _orden_listado(fila):
+    return parse_datetime(fila["fecha_inicio"]), fila["id"]
+
+
+class ReservaViewSet(ListaRapidaViewSetMixin, viewsets.ModelViewSet):
     queryset = Reserva.objects.all().select_related("usuario","cupon").prefetch_related("detalles")
     serializer_class = ReservaSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -14,6 +33,122 @@ class ReservaViewSet(viewsets.ModelViewSet):
             return qs
         return qs.none()
 
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action == "list":
+            queryset = ReservaFilterSet.aplicar(queryset, self.request.query_params).order_by("-fecha_inicio", "-id")
+        return queryset
+
+    @extend_schema(parameters=[
+        OpenApiParameter("desde", str, description="YYYY-MM-DD sobre fecha_inicio (inclusive)"),
+        OpenApiParameter("hasta", str, description="YYYY-MM-DD sobre fecha_inicio (inclusive)"),
+        OpenApiParameter("estado", str, enum=[e for e, _ in Reserva.ESTADO]),
+        OpenApiParameter("incluir_archivo", bool, description="Suma reservas archivadas aunque no se pida `desde`"),
+        OpenApiParameter("limite_archivo", int, description="Máximo de reservas archivadas (1-1000, por defecto 100)"),
+    ])
+    def list(self, request, *args, **kwargs):
+        """
+        Reservas vivas, de la más reciente a la más antigua. Las archivadas
+        se suman solo si se pide `incluir_archivo` o si `desde` llega a
+        fechas archivadas; van intercaladas en el mismo orden, hasta
+        `limite_archivo` (con X-Archivo-Truncado si quedaron más).
+        """
+        respuesta = super().list(request, *args, **kwargs)
+        filtros = ReservaFilterSet(data=request.query_params)
+        filtros.is_valid(raise_exception=True)
+        p = filtros.validated_data
+        inicio, _ = rango_fechas(p.get("desde"))
+        if not (p["incluir_archivo"] or (inicio is not None and rango_toca_archivo(inicio))):
+            return respuesta
+        limite = p["limite_archivo"]
+        archivadas = filtros.filtrar(ReservaArchivada.objects.all()).order_by("-fecha_inicio", "-id")[:limite + 1]
+        if getattr(settings, "LISTA_RAPIDA", False):
+            datos = ReservaArchivadaSerializer.lista_rapida(archivadas)
+        else:
+            datos = ReservaArchivadaSerializer(archivadas.prefetch_related("detalles"), many=True).data
+        datos = list(datos)
+        if len(datos) > limite:
+            datos = datos[:limite]
+            respuesta["X-Archivo-Truncado"] = "true"
+        # Puede haber reservas viejas aún sin archivar: se intercalan, no se concatenan
+        respuesta.data = sorted([*respuesta.data, *datos], key=_orden_listado, reverse=True)
+        return respuesta
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            archivada = get_object_or_404(ReservaArchivada.objects.prefetch_related("detalles"), pk=kwargs["pk"])
+            return Response(ReservaArchivadaSerializer(archivada).data)
+
+    @idempotente
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
+    def perform_update(self, serializer):
+        # Una edición (PUT/PATCH) también es un cambio: quien tenga la versión anterior recibe 409
+        reserva = serializer.save(version=F("version") + 1)
+        reserva.refresh_from_db(fields=["version"])
+
+    def _transicion(self, request, accion, **cambios):
+        reserva = self.get_object()
+        try:
+            reserva = transicionar(reserva.pk, accion, version=request.data.get("version"), **cambios)
+        except TransicionInvalida as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except ConflictoConcurrencia as e:
+            return Response({"detail": str(e)}, status=status.HTTP_409_CONFLICT)
+        except (TypeError, ValueError):
+            return Response({"detail": "'version' debe ser un entero"}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(ReservaSerializer(reserva).data)
+
+    @extend_schema(
+        summary="Marcar reserva como pagada",
+        request=inline_serializer(
+            name="TransicionReservaRequest",
+            fields={"version": drf_serializers.IntegerField(required=False)},
+        ),
+        responses={200: ReservaSerializer, 400: OpenApiResponse(description="Transición inválida"),
+                   409: OpenApiResponse(description="La reserva cambió (versión distinta)")},
+    )
+    @action(detail=True, methods=["post"], url_path="pagar")
+    def pagar(self, request, pk=None):
+        return self._transicion(request, "pagar")
+
+    @extend_schema(
+        summary="Cancelar reserva",
+        request=inline_serializer(
+            name="CancelarReservaRequest",
+            fields={"version": drf_serializers.IntegerField(required=False)},
+        ),
+        responses={200: ReservaSerializer, 400: OpenApiResponse(description="Transición inválida"),
+                   409: OpenApiResponse(description="La reserva cambió (versión distinta)")},
+    )
+    @action(detail=True, methods=["post"], url_path="cancelar")
+    def cancelar(self, request, pk=None):
+        return self._transicion(request, "cancelar")
+
+    @extend_schema(
+        summary="Reprogramar reserva",
+        request=inline_serializer(
+            name="ReprogramarReservaRequest",
+            fields={
+                "fecha_inicio": drf_serializers.DateTimeField(),
+                "version": drf_serializers.IntegerField(required=False),
+            },
+        ),
+        responses={200: ReservaSerializer, 400: OpenApiResponse(description="Transición inválida"),
+                   409: OpenApiResponse(description="La reserva cambió (versión distinta)")},
+    )
+    @action(detail=True, methods=["post"], url_path="reprogramar")
+    def reprogramar(self, request, pk=None):
+        campo = drf_serializers.DateTimeField()
+        try:
+            fecha_inicio = campo.run_validation(request.data.get("fecha_inicio"))
+        except drf_serializers.ValidationError as e:
+            return Response({"fecha_inicio": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return self._transicion(request, "reprogramar", fecha_inicio=fecha_inicio)
+
 class VisitanteViewSet(viewsets.ModelViewSet):
     queryset = Visitante.objects.all()
     serializer_class = VisitanteSerializer
@@ -22,4 +157,4 @@ class VisitanteViewSet(viewsets.ModelViewSet):
 class ReservaVisitanteViewSet(viewsets.ModelViewSet):
     queryset = ReservaVisitante.objects.all()
     serializer_class = ReservaVisitanteSerializer
-    permission_classes = [permissions.IsAuthenticated]
\ No newline at end of file
+    permission_classes = [permissions.IsAuthenticated]
@@ -0,0 +1,139 @@
+"""
+Feed de cambios para clientes offline (GET /api/sync/?desde=<cursor>).
+
+El cursor (firmado, opaco para el cliente) guarda por entidad la última
+posición entregada como (updated_at, id), y lo mismo para las lápidas de
+`Baja`. Cada llamada:
+
+1. Un solo UNION sobre los índices de updated_at / eliminado_en dice qué
+   entidades tienen algo nuevo; si nada cambió, la sincronización termina ahí.
+2. Para las que cambiaron se leen las claves en orden (updated_at, id) hasta
+   completar el lote y se serializan esas filas.
+
+Solo se entregan filas con marca de tiempo anterior a ahora - SYNC_MARGEN_SEG:
+una transacción que guardó `updated_at` pero todavía no confirmó quedaría,
+si no, detrás de un cursor que ya la pasó.
+"""
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import CharField, Q, Value
+from django.utils import timezone
+
+from catalogo.models import Categoria, Servicio
+from catalogo.serializers import CategoriaSerializer, ServicioSerializer
+from reservas.models import Reserva, ReservaVisitante, Visitante
+from reservas.serializers import ReservaSerializer, VisitanteSerializer
+from .models import Baja
+
+SAL = "sincronizacion.cursor"
+BAJAS = "bajas"
+
+
+class CursorInvalido(Exception):
+    pass
+
+
+def fuentes(usuario_id):
+    """entidad -> (queryset visible para el usuario, serializer). El orden es el de entrega."""
+    return {
+        "categorias": (Categoria.objects.all(), CategoriaSerializer),
+        # Como /api/servicios/: los no visibles no se entregan (ocultar uno deja una Baja)
+        "servicios": (Servicio.objects.visibles().select_related("categoria"), ServicioSerializer),
+        "reservas": (Reserva.objects.filter(usuario_id=usuario_id), ReservaSerializer),
+        "visitantes": (
+            Visitante.objects.filter(
+                pk__in=ReservaVisitante.objects.filter(reserva__usuario_id=usuario_id).values("visitante_id")
+            ),
+            VisitanteSerializer,
+        ),
+    }
+
+
+def bajas(usuario_id):
+    return Baja.objects.filter(Q(usuario_id__isnull=True) | Q(usuario_id=usuario_id))
+
+
+def leer_cursor(cursor, usuario_id, auth_id):
+    """-> (posiciones, usuario_id). Sin cursor: descarga completa para `usuario_id`."""
+    if not cursor:
+        return {}, usuario_id
+    try:
+        datos = signing.loads(cursor, salt=SAL)
+    except signing.BadSignature:
+        raise CursorInvalido("Cursor inválido")
+    if datos.get("a") != auth_id:
+        raise CursorInvalido("El cursor pertenece a otro usuario")
+    posiciones = {k: (datetime.fromisoformat(t), pk) for k, (t, pk) in datos["p"].items()}
+    return posiciones, datos["u"]
+
+
+def escribir_cursor(posiciones, usuario_id, auth_id):
+    p = {k: [t.isoformat(), pk] for k, (t, pk) in posiciones.items()}
+    return signing.dumps({"u": usuario_id, "a": auth_id, "p": p}, salt=SAL, compress=True)
+
+
+def _despues(campo, posicion):
+    if posicion is None:
+        return Q()
+    t, pk = posicion
+    return Q(**{f"{campo}__gt": t}) | Q(**{campo: t, "pk__gt": pk})
+
+
+def _pendientes(qs, campo, posicion, hasta):
+    return qs.filter(_despues(campo, posicion), **{f"{campo}__lte": hasta}).order_by(campo, "pk")
+
+
+def _serializar(qs, serializer_class, ids):
+    filas = qs.model._default_manager.filter(pk__in=ids)
+    if hasattr(serializer_class, "lista_rapida"):
+        datos = serializer_class.lista_rapida(filas)
+    else:
+        datos = serializer_class(filas, many=True).data
+    orden = {pk: i for i, pk in enumerate(ids)}
+    return sorted(datos, key=lambda d: orden[d["id"]])
+
+
+def cambios(usuario_id, posiciones, limite, auth_id):
+    hasta = timezone.now() - timedelta(seconds=getattr(settings, "SYNC_MARGEN_SEG", 2))
+    por_entidad = fuentes(usuario_id)
+    if not posiciones:
+        # Descarga inicial: las filas vigentes ya la describen, las lápidas viejas sobran
+        posiciones[BAJAS] = (hasta, 0)
+    sondas = [
+        _pendientes(qs, "updated_at", posiciones.get(nombre), hasta)
+        for nombre, (qs, _) in por_entidad.items()
+    ] + [_pendientes(bajas(usuario_id), "eliminado_en", posiciones.get(BAJAS), hasta)]
+    nombres = list(por_entidad) + [BAJAS]
+    sondas = [
+        q.order_by().annotate(_fuente=Value(n, output_field=CharField())).values_list("_fuente", flat=True)
+        for q, n in zip(sondas, nombres)
+    ]
+    con_cambios = set(sondas[0].union(*sondas[1:]))
+
+    salida = {"cambios": {}, "eliminados": {}}
+    restante = limite
+    for nombre in nombres:
+        if nombre not in con_cambios:
+            continue
+        if restante == 0:
+            break
+        if nombre == BAJAS:
+            claves = list(_pendientes(bajas(usuario_id), "eliminado_en", posiciones.get(BAJAS), hasta)
+                          .values_list("eliminado_en", "pk", "entidad", "objeto_id")[:restante])
+            for _, _, entidad, objeto_id in claves:
+                salida["eliminados"].setdefault(entidad, []).append(objeto_id)
+        else:
+            qs, serializer_class = por_entidad[nombre]
+            claves = list(_pendientes(qs, "updated_at", posiciones.get(nombre), hasta)
+                          .values_list("updated_at", "pk")[:restante])
+            salida["cambios"][nombre] = _serializar(qs, serializer_class, [pk for _, pk in claves])
+        if claves:
+            posiciones[nombre] = claves[-1][:2]
+            restante -= len(claves)
+
+    # Lote lleno: puede quedar algo (en el peor caso la próxima llamada viene vacía)
+    salida["hay_mas"] = restante == 0
+    salida["cursor"] = escribir_cursor(posiciones, usuario_id, auth_id)
+    return salida
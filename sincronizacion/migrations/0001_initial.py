@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:56
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Baja',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entidad', models.CharField(max_length=20)),
+                ('objeto_id', models.BigIntegerField()),
+                ('usuario_id', models.BigIntegerField(blank=True, null=True)),
+                ('eliminado_en', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['eliminado_en'], name='baja_eliminado_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,12 @@
+from django.db import models
+from django.utils import timezone
+
+class Baja(models.Model):
+    """Lápida de una fila borrada, para que /api/sync/ informe el borrado a los clientes."""
+    entidad = models.CharField(max_length=20)
+    objeto_id = models.BigIntegerField()
+    # Dueño de la fila (reservas); null = la ven todos los clientes
+    usuario_id = models.BigIntegerField(null=True, blank=True)
+    eliminado_en = models.DateTimeField(default=timezone.now)
+    class Meta:
+        indexes = [models.Index(fields=["eliminado_en"], name="baja_eliminado_idx")]
@@ -0,0 +1,59 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from catalogo.models import Categoria, Servicio
+from reservas.models import Reserva, ReservaVisitante, Visitante
+from .models import Baja
+
+ENTIDAD_POR_MODELO = {
+    Categoria: "categorias",
+    Servicio: "servicios",
+    Reserva: "reservas",
+    Visitante: "visitantes",
+}
+
+
+@receiver(post_delete, sender=Categoria)
+@receiver(post_delete, sender=Servicio)
+@receiver(post_delete, sender=Reserva)
+@receiver(post_delete, sender=Visitante)
+def registrar_baja(sender, instance, **kwargs):
+    Baja.objects.create(
+        entidad=ENTIDAD_POR_MODELO[sender],
+        objeto_id=instance.pk,
+        usuario_id=getattr(instance, "usuario_id", None),
+    )
+
+
+def registrar_ocultos(ids):
+    """
+    Lápidas de servicios que dejaron de ser visibles al público: para el
+    feed un servicio oculto es un servicio borrado. Las escrituras por
+    lotes (bulk_update) no pasan por las señales y llaman a esta función.
+    """
+    Baja.objects.bulk_create([Baja(entidad=ENTIDAD_POR_MODELO[Servicio], objeto_id=pk) for pk in ids])
+
+
+@receiver(pre_save, sender=Servicio)
+def _recordar_si_se_oculta(sender, instance, update_fields=None, **kwargs):
+    # Solo cuesta una consulta cuando se guarda un servicio no visible
+    instance._se_oculta = (
+        instance.pk is not None and not instance.visible_publico
+        and (update_fields is None or "visible_publico" in update_fields)
+        and Servicio.objects.filter(pk=instance.pk, visible_publico=True).exists()
+    )
+
+
+@receiver(post_save, sender=Servicio)
+def _baja_si_se_oculto(sender, instance, **kwargs):
+    if getattr(instance, "_se_oculta", False):
+        registrar_ocultos([instance.pk])
+        instance._se_oculta = False
+
+
+@receiver(post_save, sender=ReservaVisitante)
+def _tocar_visitante(sender, instance, **kwargs):
+    # El feed sigue a los visitantes por su updated_at: enlazar uno ya existente a
+    # otra reserva lo vuelve visible para ese usuario sin que su fila cambie
+    Visitante.objects.filter(pk=instance.visitante_id).update(updated_at=timezone.now())
@@ -0,0 +1,88 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from authz.models import Usuario
+from catalogo.models import Categoria
+from packages.common.pruebas import cliente_de, crear_servicio
+from reservas.models import Reserva, ReservaVisitante, Visitante
+
+
+@override_settings(SYNC_MARGEN_SEG=0)
+class SincronizacionTests(TestCase):
+    def setUp(self):
+        self.cat = Categoria.objects.create(nombre="Aventura")
+        self.tour = crear_servicio(categoria=self.cat)
+        self.guia = Usuario.objects.create(nombre="Guía", email="guia@example.com", password_hash="x")
+        otro = Usuario.objects.create(nombre="Otro", email="otro@example.com", password_hash="x")
+        self.reserva = Reserva.objects.create(usuario=self.guia, fecha_inicio=timezone.now(), total=Decimal("100"))
+        Reserva.objects.create(usuario=otro, fecha_inicio=timezone.now(), total=Decimal("50"))
+        self.visitante = Visitante.objects.create(documento="123", nombre="Eva", apellido="Paz", fecha_nacimiento="1990-01-01")
+        ReservaVisitante.objects.create(reserva=self.reserva, visitante=self.visitante, es_titular=True)
+        self.client = cliente_de("guia@example.com")
+
+    def _sync(self, **params):
+        r = self.client.get("/api/sync/", params)
+        self.assertEqual(r.status_code, 200, r.content)
+        return r.json()
+
+    def test_descarga_inicial_y_luego_solo_cambios(self):
+        d = self._sync()
+        self.assertEqual([s["id"] for s in d["cambios"]["servicios"]], [self.tour.id])
+        self.assertEqual([r["id"] for r in d["cambios"]["reservas"]], [self.reserva.id])
+        self.assertEqual([v["id"] for v in d["cambios"]["visitantes"]], [self.visitante.id])
+        self.assertFalse(d["hay_mas"])
+
+        # Sin cambios: una sola consulta (el UNION sobre los índices)
+        with self.assertNumQueries(1):
+            vacio = self._sync(desde=d["cursor"])
+        self.assertEqual((vacio["cambios"], vacio["eliminados"]), ({}, {}))
+
+        self.tour.costo = Decimal("120")
+        self.tour.save()
+        otra = Categoria.objects.create(nombre="Temporal")
+        otra_id = otra.id
+        otra.delete()
+        d2 = self._sync(desde=vacio["cursor"])
+        self.assertEqual(list(d2["cambios"]), ["servicios"])
+        self.assertEqual(d2["cambios"]["servicios"][0]["costo"], "120.00")
+        self.assertEqual(d2["eliminados"], {"categorias": [otra_id]})
+
+    def test_lotes_con_cursor_de_continuacion(self):
+        Categoria.objects.create(nombre="Cultural")
+        d = self._sync(limite=1)
+        vistos = len(d["cambios"]["categorias"])
+        while d["hay_mas"]:
+            d = self._sync(desde=d["cursor"], limite=1)
+            vistos += sum(len(v) for v in d["cambios"].values())
+        # 2 categorías + 1 servicio + 1 reserva + 1 visitante
+        self.assertEqual(vistos, 5)
+
+    def test_cursor_ajeno_o_alterado(self):
+        cursor = self._sync()["cursor"]
+        self.assertEqual(self.client.get("/api/sync/", {"desde": cursor + "x"}).status_code, 400)
+        self.assertEqual(cliente_de("otro@example.com").get("/api/sync/", {"desde": cursor}).status_code, 400)
+
+    def test_servicio_oculto_no_se_entrega_y_ocultarlo_es_una_baja(self):
+        oculto = crear_servicio("Privado", costo=Decimal("10"), categoria=self.cat, visible_publico=False)
+        d = self._sync()
+        self.assertNotIn(oculto.id, [s["id"] for s in d["cambios"]["servicios"]])
+
+        self.tour.visible_publico = False
+        self.tour.save()
+        oculto.save()  # ya estaba oculto: no deja otra lápida
+        d2 = self._sync(desde=d["cursor"])
+        self.assertEqual(d2["eliminados"], {"servicios": [self.tour.id]})
+        self.assertNotIn("servicios", d2["cambios"])
+
+    def test_visitante_existente_enlazado_a_otra_reserva(self):
+        ajeno = Visitante.objects.create(documento="999", nombre="Leo", apellido="Paz", fecha_nacimiento="1990-01-01")
+        Visitante.objects.filter(pk=ajeno.pk).update(updated_at=timezone.now() - timedelta(days=30))
+        d = self._sync()
+        self.assertEqual([v["id"] for v in d["cambios"]["visitantes"]], [self.visitante.id])
+
+        ReservaVisitante.objects.create(reserva=self.reserva, visitante=ajeno)
+        d2 = self._sync(desde=d["cursor"])
+        self.assertEqual([v["id"] for v in d2["cambios"]["visitantes"]], [ajeno.id])
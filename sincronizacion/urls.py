@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import sincronizar
+
+urlpatterns = [
+    path("", sincronizar, name="sincronizar"),
+]
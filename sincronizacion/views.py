@@ -0,0 +1,45 @@
+from rest_framework import permissions, serializers as drf_serializers
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from authz.models import Usuario
+from .feed import CursorInvalido, cambios, leer_cursor
+
+LIMITE_DEFECTO = 500
+LIMITE_MAXIMO = 2000
+
+class SyncParamsSerializer(drf_serializers.Serializer):
+    desde = drf_serializers.CharField(required=False, allow_blank=True)
+    limite = drf_serializers.IntegerField(required=False, min_value=1, max_value=LIMITE_MAXIMO, default=LIMITE_DEFECTO)
+
+@extend_schema(
+    summary="Cambios desde un cursor",
+    description="Devuelve categorías, servicios, reservas del usuario y sus visitantes creados o modificados "
+                "desde `desde`, más los ids eliminados. Sin `desde` es la descarga completa. Si `hay_mas` es "
+                "true, repetir con el `cursor` devuelto.",
+    parameters=[
+        OpenApiParameter("desde", str, description="Cursor devuelto por la llamada anterior"),
+        OpenApiParameter("limite", int, description=f"Filas por lote (máx. {LIMITE_MAXIMO})"),
+    ],
+    responses={200: OpenApiResponse(description="{cambios, eliminados, hay_mas, cursor}"),
+               400: OpenApiResponse(description="Cursor inválido")},
+)
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def sincronizar(request):
+    params = SyncParamsSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    p = params.validated_data
+
+    # El cursor firmado ya trae el id del authz.Usuario: una sincronización sin
+    # cambios no necesita ni siquiera resolverlo por email.
+    usuario_id = None
+    if not p.get("desde"):
+        usuario_id = Usuario.objects.filter(email=request.user.email).values_list("pk", flat=True).first()
+        if usuario_id is None:
+            return Response({"detail": "Usuario no encontrado"}, status=404)
+    try:
+        posiciones, usuario_id = leer_cursor(p.get("desde"), usuario_id, request.user.pk)
+    except CursorInvalido as e:
+        return Response({"detail": str(e)}, status=400)
+    return Response(cambios(usuario_id, posiciones, p["limite"], request.user.pk))